@@ -31,11 +31,68 @@ import re  # Add this line
 from bpy_extras.io_utils import ImportHelper
 from bpy.props import StringProperty, CollectionProperty, PointerProperty, BoolProperty, EnumProperty
 from bpy.types import Operator, Panel, PropertyGroup
+from bpy.app.handlers import persistent
 import json  # Add this line
+import posixpath
+import tempfile
+import hashlib
+import subprocess
+import time
+import bpy.utils.previews
+import numpy as np
+import base64
+import mmap
+import contextlib
+import shutil
+import zipfile
+import threading
+import queue
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import ctypes
+import struct
+import urllib.parse
+from .mesh_formats import (
+    parse_obj, parse_ply_header, parse_ply, parse_stl,
+    get_gltf_node_name, parse_gltf_nodes
+)
+from .texture_formats import (
+    group_texture_tiles, GPU_TEXTURE_FORMATS, KTX2_IDENTIFIER,
+    get_mip_size, read_gpu_texture_header, parse_gpu_texture_header, build_dds_header
+)
+
+def has_operator(submodule, name):
+    """bpy.ops submodules resolve any attribute, so look the operator up in dir()"""
+    return name in dir(submodule)
+
+def get_import_extensions(backend='OPERATOR'):
+    """Importer per file extension.
+
+    OPERATOR uses Blender's importers and prefers the native C++ ones
+    (wm.obj_import, wm.ply_import, wm.stl_import) where they exist.
+    DIRECT builds OBJ/PLY/STL meshes from NumPy arrays without calling an operator.
+    """
+    if has_operator(bpy.ops.wm, "obj_import"):
+        obj_import = lambda filepath: bpy.ops.wm.obj_import(filepath=filepath)
+    else:
+        obj_import = lambda filepath: bpy.ops.import_scene.obj(filepath=filepath)
+    if has_operator(bpy.ops.wm, "ply_import"):
+        ply_import = lambda filepath: bpy.ops.wm.ply_import(filepath=filepath)
+    else:
+        ply_import = lambda filepath: bpy.ops.import_mesh.ply(filepath=filepath)
+    if has_operator(bpy.ops.wm, "stl_import"):
+        stl_import = lambda filepath: bpy.ops.wm.stl_import(filepath=filepath)
+    else:
+        stl_import = lambda filepath: bpy.ops.import_mesh.stl(filepath=filepath)
+
+    if backend == 'DIRECT':
+        obj_import = import_obj_direct
+        ply_import = import_ply_direct
+        stl_import = import_stl_direct
 
-def get_import_extensions():
     return {
-        '.obj': lambda filepath: bpy.ops.import_scene.obj(filepath=filepath), 
+        '.obj': obj_import,
         '.fbx': lambda filepath: bpy.ops.import_scene.fbx(filepath=filepath),
         '.3ds': lambda filepath: bpy.ops.import_scene.autodesk_3ds(filepath=filepath),
         '.dae': lambda filepath: bpy.ops.wm.collada_import(filepath=filepath),
@@ -43,12 +100,587 @@ def get_import_extensions():
         '.usd': lambda filepath: bpy.ops.wm.usd_import(filepath=filepath),
         '.usda': lambda filepath: bpy.ops.wm.usd_import(filepath=filepath),
         '.usdc': lambda filepath: bpy.ops.wm.usd_import(filepath=filepath),
-        '.ply': lambda filepath: bpy.ops.import_mesh.ply(filepath=filepath),
-        '.stl': lambda filepath: bpy.ops.import_mesh.stl(filepath=filepath),
+        '.ply': ply_import,
+        '.stl': stl_import,
         '.glb': lambda filepath: bpy.ops.import_scene.gltf(filepath=filepath),
         '.gltf': lambda filepath: bpy.ops.import_scene.gltf(filepath=filepath)
     }
 
+# Direct mesh loading: the parsers in mesh_formats return plain NumPy arrays,
+# build_mesh_object turns them into a mesh.
+
+def build_mesh_object(mesh_data, collection=None):
+    """Create a mesh object with foreach_set bulk writes - no operator involved"""
+    positions = np.ascontiguousarray(mesh_data["positions"], dtype=np.float32)
+    loop_vertices = np.ascontiguousarray(mesh_data["loop_vertices"], dtype=np.int32)
+    loop_totals = np.ascontiguousarray(mesh_data["loop_totals"], dtype=np.int32)
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    if len(loop_totals) > 1:
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    mesh = bpy.data.meshes.new(mesh_data["name"])
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", positions.ravel())
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set("vertex_index", loop_vertices)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    try:
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    except (AttributeError, TypeError):
+        # Read-only in newer Blender, derived from loop_start there
+        pass
+
+    if mesh_data.get("loop_uvs") is not None:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", np.ascontiguousarray(mesh_data["loop_uvs"], dtype=np.float32).ravel())
+
+    mesh.update(calc_edges=True)
+
+    if mesh_data.get("vertex_normals") is not None or mesh_data.get("loop_normals") is not None:
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(loop_totals), dtype=bool))
+        if mesh_data.get("loop_normals") is not None:
+            mesh.normals_split_custom_set(np.asarray(mesh_data["loop_normals"], dtype=np.float32))
+        else:
+            mesh.normals_split_custom_set_from_vertices(np.asarray(mesh_data["vertex_normals"], dtype=np.float32))
+
+    obj = bpy.data.objects.new(mesh_data["name"], mesh)
+    (collection or bpy.context.collection).objects.link(obj)
+    return obj
+
+def read_source_bytes(filepath):
+    with open_source_file(filepath) as f:
+        return f.read()
+
+def import_obj_direct(filepath, object_filter=None):
+    for mesh_data in parse_obj(read_source_bytes(filepath), object_filter):
+        build_mesh_object(mesh_data)
+
+def import_ply_direct(filepath):
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    for mesh_data in parse_ply(read_source_bytes(filepath), name):
+        build_mesh_object(mesh_data)
+
+def import_stl_direct(filepath):
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    for mesh_data in parse_stl(read_source_bytes(filepath), name):
+        build_mesh_object(mesh_data)
+
+# Direct glTF loading for selective imports: only the requested nodes are read and built
+def read_gltf_json(filepath):
+    """Read only the JSON part of a .gltf/.glb file"""
+    with open_source_file(filepath) as f:
+        header = f.read(20)
+        if header[:4] != b'glTF':
+            f.seek(0)
+            return json.loads(f.read())
+        json_length = int.from_bytes(header[12:16], 'little')
+        return json.loads(f.read(json_length))
+
+def map_source_file(filepath):
+    """Read-only memory map of a file, stays valid after the file is closed"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+@contextlib.contextmanager
+def open_gltf(filepath):
+    """The glTF JSON and its buffers as zero-copy memoryviews of memory-mapped files.
+
+    Only the JSON chunk is parsed, accessors view the BIN chunk directly.
+    Arrays viewing the buffers must not outlive the with block.
+    """
+    maps = []
+    views = []
+
+    def map_buffer(path):
+        data = map_source_file(path)
+        if data is None:
+            return b''
+        maps.append(data)
+        views.append(memoryview(data))
+        return views[-1]
+
+    try:
+        data = map_buffer(filepath)
+        bin_chunk = None
+        if data[:4] == b'glTF':
+            json_length = int.from_bytes(data[12:16], 'little')
+            gltf = json.loads(bytes(data[20:20 + json_length]))
+            bin_offset = 20 + json_length
+            if len(data) >= bin_offset + 8:
+                bin_length = int.from_bytes(data[bin_offset:bin_offset + 4], 'little')
+                bin_chunk = data[bin_offset + 8:bin_offset + 8 + bin_length]
+                views.append(bin_chunk)
+        else:
+            gltf = json.loads(bytes(data))
+
+        buffers = []
+        for buffer in gltf.get("buffers", []):
+            uri = buffer.get("uri")
+            if uri is None:
+                buffers.append(bin_chunk)
+            elif uri.startswith("data:"):
+                buffers.append(base64.b64decode(uri.split(",", 1)[1]))
+            else:
+                buffers.append(map_buffer(os.path.join(os.path.dirname(filepath), urllib.parse.unquote(uri))))
+        yield gltf, buffers
+    finally:
+        buffers = bin_chunk = data = None
+        try:
+            for view in reversed(views):
+                view.release()
+            for data in maps:
+                data.close()
+        except BufferError:
+            # Some array still views the file, the map is closed once it is garbage collected
+            print(f"Memory map of {filepath} still in use")
+
+def import_gltf_direct(filepath, node_filter=None):
+    # parse_gltf_nodes copies while transforming, nothing keeps the map alive
+    with open_gltf(filepath) as (gltf, buffers):
+        meshes = parse_gltf_nodes(gltf, buffers, node_filter)
+    for mesh_data in meshes:
+        build_mesh_object(mesh_data)
+
+# Inventory: list the meshes of a file without importing it, as (name, source_ref) pairs.
+# source_ref addresses the mesh inside the file: glTF node index, OBJ group, USD prim path.
+
+def list_obj_groups(data):
+    group_key = b'o' if (data.startswith(b'o ') or b'\no ' in data) else b'g'
+    names = re.findall(rb'^' + group_key + rb' +(.+?)\s*$', data, re.MULTILINE)
+    return [(name, name) for name in dict.fromkeys(n.decode('utf-8', 'replace') for n in names)]
+
+def list_usd_meshes(file_path):
+    try:
+        from pxr import Usd, UsdGeom
+    except ImportError:
+        return None
+    stage = Usd.Stage.Open(file_path)
+    if not stage:
+        return None
+    return [(prim.GetName(), str(prim.GetPath())) for prim in stage.Traverse() if prim.IsA(UsdGeom.Mesh)]
+
+def list_source_meshes(file_path):
+    """Mesh inventory of formats we can read ourselves, None for everything else"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.glb', '.gltf'):
+        gltf = read_gltf_json(file_path)
+        return [(get_gltf_node_name(gltf, i), str(i)) for i, node in enumerate(gltf.get("nodes", [])) if "mesh" in node]
+    if ext == '.obj':
+        return list_obj_groups(read_source_bytes(file_path))
+    if ext in ('.usd', '.usda', '.usdc') and not split_archive_path(file_path)[0]:
+        return list_usd_meshes(file_path)
+    return None
+
+def probe_mesh_counts(file_path):
+    """Triangle and vertex counts from file headers without building meshes, None for other formats.
+    PLY faces count as triangles, the header doesn't tell polygon sizes."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.glb', '.gltf'):
+        gltf = read_gltf_json(file_path)
+        accessors = gltf.get("accessors", [])
+        triangles = vertices = 0
+        for node in gltf.get("nodes", []):
+            if "mesh" not in node:
+                continue
+            for primitive in gltf["meshes"][node["mesh"]].get("primitives", []):
+                attributes = primitive.get("attributes", {})
+                if "POSITION" not in attributes:
+                    continue
+                count = accessors[attributes["POSITION"]]["count"]
+                vertices += count
+                if primitive.get("mode", 4) == 4:
+                    triangles += (accessors[primitive["indices"]]["count"] if "indices" in primitive else count) // 3
+        return {"tris": triangles, "verts": vertices}
+    if ext == '.ply':
+        with open_source_file(file_path) as f:
+            _, elements, _ = parse_ply_header(f.read(1 << 16))
+        counts = {element["name"]: element["count"] for element in elements}
+        return {"tris": counts.get("face", 0), "verts": counts.get("vertex", 0)}
+    if ext == '.stl':
+        size = int(get_file_signature(file_path).split(":")[0] or 0)
+        with open_source_file(file_path) as f:
+            head = f.read(84)
+            if len(head) == 84 and 84 + 50 * int.from_bytes(head[80:84], 'little') == size:
+                triangles = int.from_bytes(head[80:84], 'little')
+            else:
+                triangles = (head + f.read()).count(b'facet normal')
+        return {"tris": triangles, "verts": triangles * 3}
+    if ext == '.obj':
+        data = read_source_bytes(file_path)
+        faces = re.findall(rb'^f\s+(.*?)\s*$', data, re.MULTILINE)
+        corners = len(b' '.join(faces).split())
+        return {"tris": corners - 2 * len(faces), "verts": len(re.findall(rb'^v\s', data, re.MULTILINE))}
+    return None
+
+def try_probe_mesh_counts(file_path):
+    try:
+        return probe_mesh_counts(file_path)
+    except Exception as e:
+        print(f"Failed to count triangles of {file_path}: {str(e)}")
+        return None
+
+def can_import_selectively(file_path, extensions):
+    """Whether single objects of the file can be read without importing the rest.
+    OBJ only with the DIRECT backend, so partial and full imports use the same importer."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.obj':
+        return extensions.get(ext) is import_obj_direct
+    return ext in ('.glb', '.gltf', '.usd', '.usda', '.usdc')
+
+def import_selected_objects(file_path, selected_objects, extensions):
+    """Import only the selected objects of a multi-object file.
+    Returns False if the format can't be read selectively and the whole file was imported."""
+    ext = os.path.splitext(file_path)[1].lower()
+    refs = [obj.source_ref for obj in selected_objects]
+    if refs and all(refs) and can_import_selectively(file_path, extensions):
+        if ext in ('.glb', '.gltf'):
+            import_gltf_direct(file_path, node_filter={int(ref) for ref in refs})
+            return True
+        if ext == '.obj':
+            import_obj_direct(file_path, object_filter=set(refs))
+            return True
+        if ext in ('.usd', '.usda', '.usdc'):
+            bpy.ops.wm.usd_import(filepath=file_path, prim_path_mask=",".join(refs))
+            return True
+
+    extensions[ext](file_path)
+    return False
+
+def get_cache_dir(*parts):
+    """Per-user cache directory of the add-on, created on demand"""
+    try:
+        base = bpy.utils.extension_path_user(__package__, path="cache", create=True)
+    except Exception:
+        # Legacy add-on install without extension user dirs
+        base = os.path.join(tempfile.gettempdir(), "assetporter_alpha")
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+# Scan index: per-file signature and probed object names, persisted between sessions
+_scan_index = None
+
+def get_scan_index():
+    """Load the scan index from disk once per session"""
+    global _scan_index
+    if _scan_index is None:
+        try:
+            with open(os.path.join(get_cache_dir(), "scan_index.json"), 'r', encoding='utf-8') as f:
+                _scan_index = json.load(f)
+        except (OSError, ValueError):
+            _scan_index = {}
+        _scan_index.setdefault("files", {})
+    return _scan_index
+
+def save_scan_index():
+    if _scan_index is None:
+        return
+    index_path = os.path.join(get_cache_dir(), "scan_index.json")
+    try:
+        with open(index_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(_scan_index, f)
+        os.replace(index_path + ".tmp", index_path)
+    except OSError as e:
+        print(f"Failed to save scan index: {str(e)}")
+
+def get_file_signature(file_path):
+    """Cheap change detection: size and mtime of the file, size and CRC for archive members"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        member = get_archive_member(file_path)
+        return f"{member.file_size}:{member.CRC}" if member else ""
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+def get_source_cache_key(file_path):
+    """Cache key for data derived from a source file - changes whenever the file changes"""
+    signature = get_file_signature(file_path)
+    return hashlib.sha1(f"{lod_file_key(file_path)}|{signature}".encode('utf-8')).hexdigest()
+
+def lod_file_key(file_path):
+    return os.path.normcase(os.path.normpath(file_path))
+
+def get_lod_file_path(lod):
+    """Full path of the file behind a LODItem"""
+    if lod.source_path:
+        # Generated files live in the cache, not next to the library files
+        return lod.source_path
+    return os.path.join(os.path.dirname(lod.object_name), lod.name)
+
+def get_library_roots(props, report=None):
+    """Absolute, existing root folders from props.folder_path"""
+    valid_paths = []
+    for folder_path in [path.strip() for path in props.folder_path.split(';')]:
+        abs_path = bpy.path.abspath(folder_path).replace("\\", "/")
+        if os.path.exists(abs_path):
+            valid_paths.append(abs_path)
+        elif report:
+            report({'WARNING'}, f"Invalid path: {folder_path}")
+    return valid_paths
+
+# Zip archives act as folders: their members get virtual paths like
+# <library>/pack.zip/Rock/Rock_LOD0.fbx, listed from the central directory
+# and extracted only when a file is actually read by Blender.
+_archive_listings = {}  # archive path -> (signature, {member name: ZipInfo})
+
+def get_archive_listing(archive_path):
+    signature = get_file_signature(archive_path)
+    cached = _archive_listings.get(archive_path)
+    if cached is None or cached[0] != signature:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = {info.filename: info for info in archive.infolist() if not info.is_dir()}
+        cached = _archive_listings[archive_path] = (signature, members)
+    return cached[1]
+
+def split_archive_path(file_path):
+    """(archive path, member name) of a virtual path, (None, file_path) for normal files"""
+    normalized = file_path.replace("\\", "/")
+    start = 0
+    while True:
+        index = normalized.lower().find(".zip/", start)
+        if index < 0:
+            return None, file_path
+        archive_path = normalized[:index + 4]
+        if os.path.isfile(archive_path):
+            return archive_path, normalized[index + 5:]
+        start = index + 5
+
+def get_archive_member(file_path):
+    archive_path, member = split_archive_path(file_path)
+    if archive_path is None:
+        return None
+    try:
+        return get_archive_listing(archive_path).get(member)
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+def open_source_file(file_path):
+    """Binary file object of a library file, archive members are read without extracting them"""
+    archive_path, member = split_archive_path(file_path)
+    if archive_path is None:
+        return open(file_path, 'rb')
+    archive = zipfile.ZipFile(archive_path)
+    try:
+        member_file = archive.open(member)
+    except Exception:
+        archive.close()
+        raise
+    # Closing the member file leaves the archive open, close both together
+    member_close = member_file.close
+    def close():
+        member_close()
+        archive.close()
+    member_file.close = close
+    return member_file
+
+def extract_archive_member(archive_path, member):
+    """Real file of an archive member in the cache, extracted once per member CRC.
+    .gltf files bring the buffers and images they reference."""
+    file_path = f"{archive_path}/{member}"
+    signature = get_file_signature(file_path)
+    key = hashlib.sha1(lod_file_key(file_path).encode('utf-8')).hexdigest()[:16]
+    target_dir = get_cache_dir("archives", key)
+    target = os.path.join(target_dir, os.path.basename(member))
+    extracted = get_scan_index().setdefault("extracted", {})
+    if extracted.get(key) == signature and os.path.exists(target):
+        return target
+
+    member_dir = posixpath.dirname(member)
+    files = [(member, target)]
+    for relative in get_sidecar_files(file_path) or []:
+        files.append((posixpath.normpath(posixpath.join(member_dir, relative.replace("\\", "/"))),
+                      os.path.join(target_dir, relative)))
+    with zipfile.ZipFile(archive_path) as archive:
+        for name, path in files:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with archive.open(name) as source, open(path + ".part", 'wb') as out:
+                shutil.copyfileobj(source, out, 1 << 20)
+            os.replace(path + ".part", path)
+
+    extracted[key] = signature
+    return target
+
+def walk_library(folder_path, start_dir=None, recursive=True):
+    """os.walk over a library root that also descends into zip archives.
+    Yields (directory, file names) with virtual directories for archive contents."""
+    top = start_dir or folder_path
+    if os.path.isfile(top):
+        # The root itself is an archive
+        archives = [top]
+    else:
+        archives = []
+        for root, _, files in os.walk(top):
+            archives.extend(os.path.join(root, file) for file in files if file.lower().endswith('.zip'))
+            yield root, [file for file in files if not file.lower().endswith('.zip')]
+            if not recursive:
+                break
+
+    for archive_path in archives:
+        try:
+            members = get_archive_listing(archive_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"Failed to read archive {archive_path}: {str(e)}")
+            continue
+        directories = {}
+        for name in members:
+            directory, file = posixpath.split(name)
+            directories.setdefault(directory, []).append(file)
+        for directory, files in directories.items():
+            yield (archive_path + "/" + directory).rstrip("/"), files
+
+def crawl_asset_files(folder_path, extensions, start_dir=None, recursive=True):
+    """Walk one library root and collect (file_path, file_name, object_name) of importable files"""
+    return list(iter_asset_files(folder_path, extensions, start_dir, recursive))
+
+def iter_asset_files(folder_path, extensions, start_dir=None, recursive=True):
+    """crawl_asset_files as generator, for the background scan"""
+    for root, files in walk_library(folder_path, start_dir, recursive):
+        rel_path = os.path.relpath(root, folder_path)
+        for file in files:
+            ext = os.path.splitext(file)[1].lower()
+            if ext not in extensions:
+                continue
+
+            # Store path relative to the specific folder it was found in
+            base_name = os.path.splitext(file)[0]
+            if rel_path != '.':
+                object_name = os.path.join(folder_path, rel_path, base_name)
+            else:
+                object_name = os.path.join(folder_path, base_name)
+            yield os.path.join(root, file), file, object_name
+
+def probe_base_objects(file_path, extensions):
+    """List the mesh objects of a BASE file as (name, source_ref) pairs.
+    Formats without an inventory reader are imported once and removed again."""
+    try:
+        inventory = list_source_meshes(file_path)
+    except Exception as e:
+        print(f"Inventory failed for {file_path}, importing instead: {str(e)}")
+        inventory = None
+    if inventory is not None:
+        return inventory
+
+    ext = os.path.splitext(file_path)[1].lower()
+    pre_import_objects = set(bpy.data.objects)
+    pre_import_meshes = set(bpy.data.meshes)
+
+    extensions[ext](local_source_path(file_path))
+
+    new_objects = set(bpy.data.objects) - pre_import_objects
+    new_meshes = set(bpy.data.meshes) - pre_import_meshes
+
+    # Only add mesh objects (not empties)
+    objects = [(obj.name, "") for obj in sorted(new_objects, key=lambda x: x.name) if obj.type == 'MESH']
+
+    # Cleanup in one batch
+    bpy.data.batch_remove(list(new_objects) + list(new_meshes))
+    return objects
+
+def set_base_objects(lod, objects):
+    """Replace the object list of a BASE item, keeping selections of objects that still exist"""
+    objects = [(name, ref) for name, ref in objects]
+    if [(base_obj.name, base_obj.source_ref) for base_obj in lod.base_objects] == objects:
+        return
+    selected = {base_obj.name for base_obj in lod.base_objects if base_obj.selected}
+    lod.base_objects.clear()
+    for name, ref in objects:
+        base_obj = lod.base_objects.add()
+        base_obj.name = name
+        base_obj.source_ref = ref
+        base_obj.selected = name in selected
+
+def sync_lod_entries(props, entries, extensions, report=None, scope=None):
+    """Diff crawled files against props.lods in place.
+
+    New files are added, missing files removed and changed BASE files re-probed.
+    Unchanged items are left alone so their selection state survives the rescan.
+    With scope (a set of lod_file_key directories) only items in those directories can be removed.
+    Returns (added, removed, updated) counts.
+    """
+    existing = get_existing_lod_indices(props)
+    added, updated = merge_lod_entries(props, entries, extensions, existing, report)
+    removed = remove_missing_lod_entries(props, existing, {lod_file_key(entry[0]) for entry in entries}, scope)
+    return added, removed, updated
+
+def get_existing_lod_indices(props):
+    """lod_file_key -> index of the scanned items.
+    Index positions instead of item references - adding to the collection invalidates them."""
+    return {lod_file_key(get_lod_file_path(lod)): i for i, lod in enumerate(props.lods) if not lod.generated}
+
+def merge_lod_entries(props, entries, extensions, existing, report=None, probed=None):
+    """Add new and update changed files of a crawl. probed holds (signature, objects, counts)
+    per file from a background scan, None where the file has to be probed here.
+    Returns (added, updated) counts."""
+    lod_pattern = re.compile(r'lod(\d+)')
+    scan_index = get_scan_index()["files"]
+    probed = probed or {}
+
+    added = updated = 0
+    for file_path, file, object_name in entries:
+        key = lod_file_key(file_path)
+        signature, probed_objects, probed_counts = probed.get(key) or (get_file_signature(file_path), None, None)
+        index = existing.get(key)
+        entry = scan_index.get(key)
+        if not entry or entry.get("sig") != signature:
+            entry = {"sig": signature}
+        is_base = not lod_pattern.search(os.path.splitext(file)[0].lower())
+        # Items scanned before counts were recorded are updated once,
+        # BASE files whose object probe failed are probed again
+        if (index is not None and props.lods[index].file_signature == signature and "tris" in entry
+                and (not is_base or "objects" in entry)):
+            continue
+
+        if index is None:
+            lod_item = props.lods.add()
+            lod_item.name = file
+            lod_item.include = False
+            lod_item.object_name = object_name
+            existing[key] = len(props.lods) - 1
+            added += 1
+        else:
+            lod_item = props.lods[index]
+            updated += 1
+        lod_item.file_signature = signature
+
+        # Triangle counts for every file, from the index or the file headers
+        if "tris" not in entry:
+            entry.update(probed_counts or try_probe_mesh_counts(file_path) or {"tris": 0, "verts": 0})
+        lod_item.triangle_count = entry["tris"]
+        lod_item.vertex_count = entry["verts"]
+        scan_index[key] = entry
+
+        # If it's a base file, get object names from the index or by probing the file
+        if not is_base:
+            continue
+        if "objects" not in entry:
+            if probed_objects is not None:
+                entry["objects"] = probed_objects
+            else:
+                try:
+                    entry["objects"] = probe_base_objects(file_path, extensions)
+                except Exception as e:
+                    if report:
+                        report({'WARNING'}, f"Failed to scan {file}: {str(e)}")
+                    continue
+        set_base_objects(lod_item, entry["objects"])
+
+    return added, updated
+
+def remove_missing_lod_entries(props, existing, crawled, scope=None):
+    """Remove items whose files were not crawled, back to front so indices stay valid.
+    With scope only items in those directories are removed."""
+    scan_index = get_scan_index()["files"]
+    removed = 0
+    for key, index in sorted(existing.items(), key=lambda x: x[1], reverse=True):
+        if key not in crawled and (scope is None or os.path.dirname(key) in scope):
+            props.lods.remove(index)
+            scan_index.pop(key, None)
+            removed += 1
+    return removed
+
 class BaseObjectItem(PropertyGroup):
     name: StringProperty(
         name="Object Name",
@@ -60,6 +692,11 @@ class BaseObjectItem(PropertyGroup):
         description="Select this individual mesh to import",
         default=False
     )
+    source_ref: StringProperty(
+        name="Source Reference",
+        description="Where the mesh lives inside its file (glTF node, OBJ group or USD prim path)",
+        default=""
+    )
 
 class LODItem(PropertyGroup):
     name: StringProperty(
@@ -78,11 +715,38 @@ class LODItem(PropertyGroup):
         default=""
     )
     base_objects: bpy.props.CollectionProperty(type=BaseObjectItem)
+    file_signature: StringProperty(
+        name="File Signature",
+        description="Size and modification time of the file at the last scan",
+        default=""
+    )
+    source_path: StringProperty(
+        name="Source Path",
+        description="File to import when it is not stored next to the library files",
+        default=""
+    )
+    generated: BoolProperty(
+        name="Generated",
+        description="LOD level generated by the add-on instead of shipped with the library",
+        default=False
+    )
+    triangle_count: bpy.props.IntProperty(
+        name="Triangles",
+        description="Triangles in the file, read from its header at scan time",
+        default=0
+    )
+    vertex_count: bpy.props.IntProperty(
+        name="Vertices",
+        description="Vertices in the file, read from its header at scan time",
+        default=0
+    )
 
 class BatchImportProperties(PropertyGroup):
     def update_folder_path(self, context):
         # Only reset if the path actually changed
         if self.folder_path != self.last_scanned_path:
+            # A running scan holds item indices and fills the old folders' results in
+            cancel_background_scan()
             self.has_scanned = False
             self.last_scanned_path = ""
             self.search_term = ""
@@ -284,173 +948,475 @@ class BatchImportProperties(PropertyGroup):
         default=""
     )
 
-def create_folder_panel(folder_name):
-    valid_id = "".join(c for c in folder_name.upper() if c.isalnum() or c == '_')
-
-    class VIEW3D_PT_folder_panel(Panel):
-        bl_idname = f'VIEW3D_PT_FOLDER_{valid_id}_001'
-        bl_label = folder_name
-        bl_space_type = 'VIEW_3D'
-        bl_region_type = 'UI'
-        bl_category = "Assetporter beta"
-        bl_options = {'DEFAULT_CLOSED'}
-        bl_order = 2
-        folder = folder_name
-
-        @classmethod
-        def poll(cls, context):
-            if not hasattr(context.scene, "batch_import_props"):
-                return False
-            props = context.scene.batch_import_props
-            if not props.has_scanned or not props.lods:
-                return False
-
-            # Group objects by base name in this folder
-            object_groups = {}
-            lod_pattern = re.compile(r'lod(\d+)')
-            
-            # Check if panel name matches search term or if any objects match
-            has_visible_objects = False
-            if props.search_term:
-                # Check folder name
-                if props.search_term.lower() in cls.folder.lower():
-                    has_visible_objects = True
-                
-                # Always check objects even if folder name matches
-                for lod in props.lods:
-                    current_folder = os.path.basename(os.path.dirname(lod.object_name))
-                    if current_folder == cls.folder:
-                        base_name = os.path.splitext(os.path.basename(lod.name))[0]
-                        if any(props.search_term.lower() in part.lower() 
-                        for part in base_name.replace('\\', '/').split('/')):
-                            has_visible_objects = True
+    def update_watch_library(self, context):
+        if self.watch_library:
+            start_library_watch()
+        else:
+            stop_library_watch()
+
+    watch_library: BoolProperty(
+        name="Watch Library",
+        description="Poll the scanned folders and re-index changed folders automatically",
+        default=False,
+        update=update_watch_library
+    )
+    import_mode: EnumProperty(
+        name="Import Mode",
+        description="How selected files are brought into the scene",
+        items=[
+            ('LOCAL', "Local", "Import a full local copy of every file"),
+            ('INSTANCE', "Linked Instance", "Convert each file once into a cached .blend and place collection instances linked from it"),
+        ],
+        default='LOCAL'
+    )
+    importer_backend: EnumProperty(
+        name="Importer",
+        description="How OBJ, PLY and STL files are loaded",
+        items=[
+            ('OPERATOR', "Blender Importers", "Use Blender's import operators, native C++ ones where available"),
+            ('DIRECT', "Direct (NumPy)", "Parse OBJ/PLY/STL into arrays and build meshes with foreach_set, no operator overhead"),
+        ],
+        default='OPERATOR'
+    )
+    assemble_lods: BoolProperty(
+        name="Assemble LOD Sets",
+        description="Group the imported LODs of each asset under one parent with a child collection per level",
+        default=False
+    )
+
+    def update_lod_switching(self, context):
+        apply_lod_switching(context.scene)
+
+    lod_switch_mode: EnumProperty(
+        name="LOD Switching",
+        description="How LOD sets pick the level shown in the viewport",
+        items=[
+            ('DISTANCE', "Camera Distance", "Pick the level by distance to the scene camera"),
+            ('LEVEL', "Detail Level", "Show the same level for every LOD set"),
+        ],
+        default='DISTANCE',
+        update=update_lod_switching
+    )
+    lod_detail_level: bpy.props.IntProperty(
+        name="Detail Level",
+        description="LOD level shown by every LOD set (0 = most detailed)",
+        default=0,
+        min=0,
+        update=update_lod_switching
+    )
+    lod_switch_distance: bpy.props.FloatProperty(
+        name="Switch Distance",
+        description="Camera distance covered by each LOD level",
+        default=10.0,
+        min=0.001,
+        subtype='DISTANCE',
+        update=update_lod_switching
+    )
+    lod_ratios: StringProperty(
+        name="LOD Ratios",
+        description="Decimate ratios of generated LOD1, LOD2, ... relative to the BASE/LOD0 file, comma separated",
+        default="0.5, 0.25, 0.125"
+    )
+    derive_texture_resolutions: BoolProperty(
+        name="Derive Lower Resolutions",
+        description="Offer lower texture resolutions than shipped and create them from larger maps on demand",
+        default=False
+    )
+    pack_orm: BoolProperty(
+        name="Pack ORM Textures",
+        description="Merge ambient occlusion, roughness, metallic and opacity maps into one channel-packed image",
+        default=False
+    )
+    normal_convention: EnumProperty(
+        name="Normal Maps",
+        description="Convention of the normal maps, DirectX maps get their green channel flipped",
+        items=[
+            ('AUTO', "Auto", "DirectX if the file name contains _dx or directx"),
+            ('OPENGL', "OpenGL", "Use normal maps as they are"),
+            ('DIRECTX', "DirectX", "Flip the green channel of all normal maps")
+        ],
+        default='AUTO'
+    )
+    show_previews: BoolProperty(
+        name="Show Previews",
+        description="Show rendered previews next to each group in the folder panels",
+        default=True
+    )
+    preview_engine: EnumProperty(
+        name="Preview Engine",
+        description="Render engine used for preview thumbnails",
+        items=[
+            ('BLENDER_WORKBENCH', "Workbench", "Fast solid shading, no GPU features required"),
+            ('BLENDER_EEVEE_NEXT', "EEVEE", "Material preview quality"),
+        ],
+        default='BLENDER_WORKBENCH'
+    )
+    background_scan: BoolProperty(
+        name="Background Scan",
+        description="Scan in a background thread and fill the list while you keep working",
+        default=True
+    )
+    local_cache_dir: StringProperty(
+        name="Local Cache",
+        description="Local directory to copy library files to before importing them, for libraries on network drives (empty = off)",
+        default="",
+        subtype='DIR_PATH'
+    )
+    local_cache_size_gb: bpy.props.FloatProperty(
+        name="Local Cache Size (GB)",
+        description="Least recently used copies are removed above this size",
+        default=20.0,
+        min=0.1
+    )
+    staged_import: BoolProperty(
+        name="Staged Import",
+        description="Import into a hidden staging collection and reveal everything at the end",
+        default=True
+    )
+    triangle_budget: bpy.props.IntProperty(
+        name="Triangle Budget",
+        description="Fit Budget picks the most detailed LOD per asset that keeps the selection below this",
+        default=1000000,
+        min=0
+    )
+    auto_texture_resolution: BoolProperty(
+        name="Fit Texture Budget",
+        description="Pick the highest resolution per asset that keeps the decoded textures within the texture budget",
+        default=False
+    )
+    texture_budget_gb: bpy.props.FloatProperty(
+        name="Texture Budget (GB)",
+        description="Decoded texture memory the automatic resolution picking may use",
+        default=4.0,
+        min=0.1
+    )
+    journal_import: BoolProperty(
+        name="Resumable Import",
+        description="Log completed files next to the .blend and save checkpoints, a run after a crash continues where the last checkpoint ended",
+        default=False
+    )
+    checkpoint_interval: bpy.props.IntProperty(
+        name="Checkpoint Every",
+        description="Save the .blend after this many imported files, 0 only logs",
+        default=25,
+        min=0
+    )
+    memory_budget_gb: bpy.props.FloatProperty(
+        name="Memory Budget (GB)",
+        description="Defer files and use proxy textures when an import would exceed this much RAM (0 = off)",
+        default=0.0,
+        min=0.0,
+        soft_max=256.0
+    )
+    deferred_imports: StringProperty(
+        name="Deferred Imports",
+        description="Files deferred by the memory budget as JSON",
+        default=""
+    )
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes",
+        default=2,
+        min=1,
+        soft_max=8
+    )
+    watch_interval: bpy.props.FloatProperty(
+        name="Watch Interval",
+        description="Seconds between two library polls",
+        default=5.0,
+        min=1.0,
+        soft_max=60.0
+    )
+
+# Folder model shared by the folder panel, rebuilt only after a scan
+_folder_model_cache = {"key": None, "folders": []}
+
+def invalidate_folder_model():
+    """Drop the cached folder model so the next draw rebuilds it"""
+    _folder_model_cache["key"] = None
+    _selection_model_cache["key"] = None
+
+def get_folder_model(props):
+    """Group props.lods into folders and base name groups for the folder panel"""
+    key = (props.as_pointer(), len(props.lods), props.last_scanned_path)
+    if _folder_model_cache["key"] == key:
+        return _folder_model_cache["folders"]
+
+    lod_pattern = re.compile(r'lod(\d+)')
+    folders = {}
+    folder_order = {}
+
+    for index, lod in enumerate(props.lods):
+        folder_dir = os.path.dirname(lod.object_name)
+        folder_name = os.path.basename(folder_dir)
+        if not folder_name:
+            continue
+        if folder_name not in folders:
+            folder_order[folder_name] = folder_dir
+            folders[folder_name] = {
+                "name": folder_name,
+                # Readable part plus a hash of the path, 'Rock-1' and 'Rock 1' keep their own open state
+                "id": "".join(c for c in folder_name.upper() if c.isalnum() or c == '_')[:32] + "_" +
+                      hashlib.sha1(folder_dir.encode('utf-8')).hexdigest()[:8],
+                "items": [],
+                "parts": set(),
+                "names": [],
+                "groups": {}
+            }
+        folders[folder_name]["items"].append((os.path.basename(lod.name), index))
+
+    for folder in folders.values():
+        # Sort items by their original filename to maintain folder order
+        folder["items"].sort(key=lambda x: x[0])
+        for filename, index in folder.pop("items"):
+            base_name = os.path.splitext(filename)[0]
+            folder["names"].append(base_name.lower())
+            match = lod_pattern.search(base_name.lower())
+            if match:
+                base_name = base_name[:match.start()].rstrip('_')
+                lod_part = f"LOD{int(match.group(1))}"
             else:
-                has_visible_objects = True
+                lod_part = "BASE"
+            folder["parts"].add(lod_part)
+            folder["groups"].setdefault(base_name, []).append((index, lod_part))
+
+        for base_name, entries in folder["groups"].items():
+            entries.sort(key=lambda x: (0 if x[1] == "BASE" else int(x[1][3:])))
+
+    _folder_model_cache["key"] = key
+    _folder_model_cache["folders"] = [folders[name] for name in sorted(folders, key=lambda x: folder_order[x])]
+    return _folder_model_cache["folders"]
+
+# Selection engine: Quick Select and group ids as arrays aligned with props.lods,
+# so a click becomes one mask and one foreach_set instead of a Python loop over RNA
+_selection_model_cache = {"key": None}
+
+def get_selection_model(props):
+    key = (props.as_pointer(), len(props.lods), props.last_scanned_path)
+    if _selection_model_cache["key"] == key:
+        return _selection_model_cache
+
+    lod_pattern = re.compile(r'lod(\d+)')
+    part_codes = {"BASE": 0}
+    group_codes = {}
+    parts = np.zeros(len(props.lods), dtype=np.int32)
+    groups = np.zeros(len(props.lods), dtype=np.int32)
+    base_object_counts = np.zeros(len(props.lods), dtype=np.int32)
+
+    for index, lod in enumerate(props.lods):
+        base_name = os.path.splitext(os.path.basename(lod.name))[0]
+        match = lod_pattern.search(base_name.lower())
+        if match:
+            parts[index] = part_codes.setdefault(f"LOD{match.group(1)}", len(part_codes))
+            group_name = base_name[:match.start()].rstrip('_')
+        else:
+            group_name = base_name
+        groups[index] = group_codes.setdefault(group_name, len(group_codes))
+        base_object_counts[index] = len(lod.base_objects)
+
+    _selection_model_cache.update(key=key, part_codes=part_codes, group_codes=group_codes,
+                                  parts=parts, groups=groups, base_object_counts=base_object_counts)
+    return _selection_model_cache
+
+def set_lod_selection(props, include_mask, select_mask, state):
+    """Set include for the items in include_mask and select all base objects of the items in select_mask"""
+    include = np.zeros(len(props.lods), dtype=bool)
+    props.lods.foreach_get("include", include)
+    include[include_mask] = state
+    props.lods.foreach_set("include", include)
+
+    model = get_selection_model(props)
+    for index in np.flatnonzero(select_mask & (model["base_object_counts"] > 0)):
+        base_objects = props.lods[index].base_objects
+        base_objects.foreach_set("selected", np.full(len(base_objects), state, dtype=bool))
+
+def get_import_selection(props):
+    """Boolean mask of the items Import Selected would import"""
+    model = get_selection_model(props)
+    quick_parts = [model["part_codes"][lod.name] for lod in props.active_common_lods if lod.name in model["part_codes"]]
+    include = np.zeros(len(props.lods), dtype=bool)
+    props.lods.foreach_get("include", include)
+    mask = include | np.isin(model["parts"], quick_parts)
+
+    # BASE items count by their objects, not by include
+    base_indices = np.flatnonzero(model["parts"] == 0)
+    mask[base_indices] = 0 in quick_parts
+    if 0 not in quick_parts:
+        for index in base_indices:
+            mask[index] = any(obj.selected for obj in props.lods[index].base_objects)
+    return mask
+
+def get_triangle_counts(props):
+    triangles = np.zeros(len(props.lods), dtype=np.int64)
+    props.lods.foreach_get("triangle_count", triangles)
+    return triangles
+
+def format_triangles(count):
+    if count >= 1000000:
+        return f"{count / 1000000:.1f}M tris"
+    if count >= 1000:
+        return f"{count / 1000:.1f}k tris"
+    return f"{count} tris"
+
+def fit_levels_to_budget(levels, budget):
+    """Pick a level per key from costs ordered most detailed first. Every key starts at its
+    cheapest level, then the cheapest upgrades are taken while the total stays within budget.
+    Returns ({key: level index}, total)"""
+    current = {key: len(costs) - 1 for key, costs in levels.items()}
+    total = sum(costs[-1] for costs in levels.values())
+    upgrades = []
+    order = 0
+
+    def push(key):
+        nonlocal order
+        level = current[key]
+        if level > 0:
+            heapq.heappush(upgrades, (levels[key][level - 1] - levels[key][level], order, key))
+            order += 1
+
+    for key in levels:
+        push(key)
+    while upgrades:
+        delta, _, key = heapq.heappop(upgrades)
+        if total + delta > budget:
+            break
+        total += delta
+        current[key] -= 1
+        push(key)
+    return current, total
+
+def folder_is_visible(props, folder):
+    """Same visibility rules the old per-folder panels used in poll()"""
+    if props.search_term:
+        search = props.search_term.lower()
+        # Check folder name and objects in this folder
+        if search not in folder["name"].lower() and not any(search in name for name in folder["names"]):
+            return False
+
+    # Hide folder only if everything is quick-selected (not group-selected)
+    return not all(props.is_quick_selected(part) for part in folder["parts"])
+
+def draw_folder_groups(layout, props, folder, selected=None, triangles=None):
+    active_groups = props.group_active_states.split(',') if props.group_active_states else []
+
+    # Draw objects in original order
+    for base_name, entries in folder["groups"].items():
+        box = layout.box()
+        row = box.row(align=True)
+
+        # Expand/Collapse Button
+        clean_name = base_name.replace('\\', '/')
+        icon = 'TRIA_DOWN' if props.is_expanded(clean_name) else 'TRIA_RIGHT'
+        expand = row.operator("import_assets.toggle_expanded", text="", icon=icon, emboss=False)
+        expand.base_name = clean_name
+
+        # Add minimal spacing
+        row.separator(factor=0.2)
+
+        # Group Toggle Button
+        is_group_active = base_name in active_groups
+
+        # Preview of the BASE file or most detailed LOD
+        preview_icon = 0
+        if props.show_previews:
+            preview_icon = get_group_preview_icon(get_lod_file_path(props.lods[entries[0][0]]))
+            if preview_icon:
+                row.label(text="", icon_value=preview_icon)
+
+        group_row = row.row(align=True)
+        group_row.alignment = 'LEFT'
+        group_row.scale_y = 1.0
+        group_row.operator("import_assets.toggle_group",
+            text=" " + base_name + " ",
+            depress=is_group_active).base_name = base_name
+
+        # Triangles of the selected files in this group
+        if triangles is not None:
+            group_triangles = sum(int(triangles[index]) for index, _ in entries if selected[index])
+            if group_triangles:
+                count_row = row.row()
+                count_row.alignment = 'RIGHT'
+                count_row.label(text=format_triangles(group_triangles))
+
+        # Wenn expanded, zeige Inhalt
+        if not props.is_expanded(clean_name):
+            continue
 
-            # Hide panel if neither panel name nor objects match search
-            if not has_visible_objects:
-                return False
+        if preview_icon:
+            box.template_icon(icon_value=preview_icon, scale=5.0)
 
-            # Check if everything is quick-selected (not group-selected)
-            all_quick_selected = True
-            for lod in props.lods:
-                current_folder = os.path.basename(os.path.dirname(lod.object_name))
-                if current_folder == cls.folder:
-                    base_name = os.path.splitext(os.path.basename(lod.name))[0]
-                    match = lod_pattern.search(base_name.lower())
-                    if match:  # LOD items
-                        lod_name = f"LOD{match.group(1)}"
-                        if not props.is_quick_selected(lod_name):
-                            all_quick_selected = False
-                            break
-                    else:  # BASE items
-                        if not props.is_quick_selected("BASE"):
-                            all_quick_selected = False
-                            break
+        for index, lod_part in entries:
+            lod = props.lods[index]
+            if lod_part == "BASE":
+                base_quick_selected = props.is_quick_selected("BASE")
 
-            # Hide panel only if everything is quick-selected
-            if all_quick_selected:
-                return False
+                for base_obj in lod.base_objects:
+                    sub_row = box.row(align=True)
+                    sub_row.separator()
+                    button_row = sub_row.row()
+                    button_row.alignment = 'LEFT'
+                    button_row.scale_y = 1.0
+                    button_row.scale_x = 1.0
+                    button_row.enabled = not (base_quick_selected or is_group_active)
+                    # Nur den visuellen Zustand setzen
+                    depress = base_obj.selected or not button_row.enabled
+                    button = button_row.operator("import_assets.toggle_item",
+                        text=base_obj.name,
+                        depress=depress)
+                    button.is_base = True
+                    button.base_name = base_obj.name
+            else:
+                lod_quick_selected = props.is_quick_selected(lod_part)
+                sub_row = box.row(align=True)
+                sub_row.separator()
+                button_row = sub_row.row()
+                button_row.alignment = 'LEFT'
+                button_row.scale_y = 1.0
+                button_row.scale_x = 1.0
+                button_row.enabled = not (lod_quick_selected or is_group_active)
+                depress = lod_quick_selected or lod.include
+                button = button_row.operator("import_assets.toggle_item",
+                    text=f"{lod_part}  {format_triangles(lod.triangle_count)}" if lod.triangle_count else f"{lod_part}",
+                    depress=depress)
+                button.is_base = False
+                button.lod_name = lod.name
+
+class VIEW3D_PT_folder_panels(Panel):
+    """One panel with a collapsible sub-section per scanned folder"""
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Assetporter beta"
+    bl_label = ""
+    bl_options = {'HIDE_HEADER'}
+    bl_order = 2
+
+    @classmethod
+    def poll(cls, context):
+        if not hasattr(context.scene, "batch_import_props"):
+            return False
+        props = context.scene.batch_import_props
+        return bool(props.has_scanned and props.lods)
 
-            return True
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.batch_import_props
 
-        def draw(self, context):
-            layout = self.layout
-            props = context.scene.batch_import_props
-            
-            object_groups = {}
-            lod_pattern = re.compile(r'lod(\d+)')
-            
-            # First, collect and sort all objects in this folder while preserving folder order
-            folder_items = []
-            for lod in props.lods:
-                if os.path.basename(os.path.dirname(lod.object_name)) == self.folder:
-                    folder_items.append((os.path.basename(lod.name), lod))
-                    
-            # Sort items by their original filename to maintain folder order
-            folder_items.sort(key=lambda x: x[0])
-            
-            # Now group the sorted items
-            for filename, lod in folder_items:
-                base_name = os.path.splitext(filename)[0]
-                match = lod_pattern.search(base_name.lower())
-                if match:
-                    base_name = base_name[:match.start()].rstrip('_')
-                    lod_num = int(match.group(1))
-                    lod_part = f"LOD{lod_num}"
-                else:
-                    lod_part = "BASE"
-                
-                if (base_name not in object_groups):
-                    object_groups[base_name] = []
-                object_groups[base_name].append((lod, lod_part))
-            
-            # Draw objects in original order
-            for base_name in object_groups:
-                box = layout.box()
-                row = box.row(align=True)
-                
-                # Expand/Collapse Button
-                clean_name = base_name.replace('\\', '/')
-                icon = 'TRIA_DOWN' if props.is_expanded(clean_name) else 'TRIA_RIGHT'
-                expand = row.operator("import_assets.toggle_expanded", text="", icon=icon, emboss=False)
-                expand.base_name = clean_name
-                
-                # Add minimal spacing
-                row.separator(factor=0.2)
-                
-                # Group Toggle Button
-                active_groups = props.group_active_states.split(',') if props.group_active_states else []
-                is_group_active = base_name in active_groups
-                
-                group_row = row.row(align=True)
-                group_row.alignment = 'LEFT'
-                group_row.scale_y = 1.0
-                group_row.operator("import_assets.toggle_group", 
-                    text=" " + base_name + " ",
-                    depress=is_group_active).base_name = base_name
-
-                # Wenn expanded, zeige Inhalt
-                if props.is_expanded(clean_name):
-                    sorted_lods = sorted(object_groups[base_name], 
-                                    key=lambda x: (0 if x[1] == "BASE" else int(re.search(r'\d+', x[1]).group())))
-                    
-                    for lod, lod_part in sorted_lods:
-                        if lod_part == "BASE":
-                            base_quick_selected = props.is_quick_selected("BASE")
-                            
-                            for base_obj in lod.base_objects:
-                                sub_row = box.row(align=True)
-                                sub_row.separator()
-                                button_row = sub_row.row()
-                                button_row.alignment = 'LEFT'
-                                button_row.scale_y = 1.0
-                                button_row.scale_x = 1.0
-                                button_row.enabled = not (base_quick_selected or is_group_active)
-                                # Nur den visuellen Zustand setzen
-                                depress = base_obj.selected or not button_row.enabled
-                                button = button_row.operator("import_assets.toggle_item", 
-                                    text=base_obj.name,
-                                    depress=depress)
-                                button.is_base = True 
-                                button.base_name = base_obj.name
-                        else:
-                            lod_quick_selected = props.is_quick_selected(lod_part)
-                            sub_row = box.row(align=True)
-                            sub_row.separator()
-                            button_row = sub_row.row()
-                            button_row.alignment = 'LEFT'
-                            button_row.scale_y = 1.0
-                            button_row.scale_x = 1.0
-                            button_row.enabled = not (lod_quick_selected or is_group_active)
-                            depress = lod_quick_selected or lod.include
-                            button = button_row.operator("import_assets.toggle_item", 
-                                text=f"{lod_part}",
-                                depress=depress)
-                            button.is_base = False
-                            button.lod_name = lod.name
-
-    return VIEW3D_PT_folder_panel
+        selected = get_import_selection(props)
+        triangles = get_triangle_counts(props)
+
+        for folder in get_folder_model(props):
+            if not folder_is_visible(props, folder):
+                continue
+
+            # Layout panels keep their open state per idname, no class registration needed
+            header, body = layout.panel(f"ASSETPORTER_FOLDER_{folder['id']}", default_closed=True)
+            header.label(text=folder["name"])
+            folder_triangles = sum(int(triangles[index]) for entries in folder["groups"].values()
+                                   for index, _ in entries if selected[index])
+            if folder_triangles:
+                header.label(text=format_triangles(folder_triangles))
+            if body:
+                draw_folder_groups(body, props, folder, selected, triangles)
 
 class VIEW3D_PT_batch_import_panel(Panel):
     bl_space_type = 'VIEW_3D'
@@ -481,12 +1447,24 @@ class VIEW3D_PT_batch_import_panel(Panel):
         row.scale_y = 1.0
         row.operator("import_assets.scan_folder", text="Scan Folder", icon='VIEWZOOM')
         row.operator("import_assets.scan_textures", text="Scan Textures", icon='IMAGE_DATA')
+        row.prop(props, "watch_library", text="", icon='FILE_REFRESH')
+        row.operator("import_assets.generate_previews", text="", icon='RENDER_STILL')
+        if is_background_scan_running():
+            row = main_column.row(align=True)
+            count = sum(state["count"] for state in _scan_states.values() if state["thread"] is not None)
+            row.label(text=f"Scanning... {count} files", icon='TIME')
+            row.operator("import_assets.cancel_scan", text="", icon='CANCEL')
         
         # Import button
-        row = main_column.row()
+        row = main_column.row(align=True)
         row.scale_y = 1.0
         row.enabled = bool(props.has_scanned and props.lods)
         row.operator("import_assets.batch_import", text="Import Selected", icon='IMPORT')
+        row.prop(props, "import_mode", text="")
+        if props.deferred_imports not in ("", "[]"):
+            deferred_count = len(json.loads(props.deferred_imports))
+            main_column.operator("import_assets.batch_import", text=f"Import Deferred ({deferred_count})",
+                                 icon='TIME').deferred_only = True
 
         # Texture Type Quick Select box
         if props.textures:
@@ -510,10 +1488,19 @@ class VIEW3D_PT_batch_import_panel(Panel):
                                 text=display_name, 
                                 depress=is_active).lod_name = texture_type
 
+            # Decoded memory of the selected maps
+            row = box.row(align=True)
+            row.label(text=f"Textures: {format_memory(get_selected_texture_memory(props))}")
+            row.prop(props, "auto_texture_resolution", text="", icon='AUTO')
+            if props.auto_texture_resolution:
+                row.prop(props, "texture_budget_gb", text="Budget")
+
             # Add QuickRes section
             if props.textures and props.folder_path == props.last_scanned_path:
                 # Check number of unique resolutions
                 resolutions = json.loads(props.texture_resolution_cache) if props.texture_resolution_cache else {}
+                if props.derive_texture_resolutions:
+                    resolutions = add_derived_resolutions(resolutions)
                 
                 # Only show QuickRes if more than one resolution exists
                 if len(resolutions) > 1:
@@ -613,12 +1600,50 @@ class VIEW3D_PT_batch_import_panel(Panel):
                 is_active = any(lod.name == lod_name for lod in props.active_common_lods)
                 row.operator("import_assets.toggle_common_lod", text=lod_name, depress=is_active).lod_name = lod_name
 
+            row.operator("import_assets.generate_lods", text="", icon='MOD_DECIM')
+
+            # Triangle budget
+            row = box.row(align=True)
+            total_triangles = int(get_triangle_counts(props)[get_import_selection(props)].sum())
+            row.label(text=f"Selected: {format_triangles(total_triangles)}")
+            row.prop(props, "triangle_budget", text="Budget")
+            row.operator("import_assets.fit_triangle_budget", text="", icon='CON_SIZELIMIT')
+
             # Search box
             row = main_column.row(align=True)
             row.scale_y = 1.0
             row.scale_x = 1.5
             row.prop(props, "search_term", text="", icon='VIEWZOOM')
 
+        # Options
+        header, body = main_column.panel("ASSETPORTER_OPTIONS", default_closed=True)
+        header.label(text="Options")
+        if body:
+            body.use_property_split = True
+            body.prop(props, "importer_backend")
+            body.prop(props, "derive_texture_resolutions")
+            body.prop(props, "pack_orm")
+            body.prop(props, "normal_convention")
+            body.prop(props, "lod_ratios")
+            body.prop(props, "assemble_lods")
+            body.prop(props, "lod_switch_mode")
+            if props.lod_switch_mode == 'DISTANCE':
+                body.prop(props, "lod_switch_distance")
+            else:
+                body.prop(props, "lod_detail_level")
+            body.prop(props, "background_scan")
+            body.prop(props, "watch_interval")
+            body.prop(props, "worker_count")
+            body.prop(props, "memory_budget_gb")
+            body.prop(props, "staged_import")
+            body.prop(props, "local_cache_dir")
+            body.prop(props, "local_cache_size_gb")
+            body.prop(props, "journal_import")
+            if props.journal_import:
+                body.prop(props, "checkpoint_interval")
+            body.prop(props, "show_previews")
+            body.prop(props, "preview_engine")
+
 class OBJECT_OT_scan_folder(Operator):
     bl_idname = "import_assets.scan_folder"
     bl_label = "Scan Folder"
@@ -626,40 +1651,9 @@ class OBJECT_OT_scan_folder(Operator):
 
     def execute(self, context):
         props = context.scene.batch_import_props
-        folder_paths = [path.strip() for path in props.folder_path.split(';')]
-        lod_pattern = re.compile(r'lod(\d+)')
-
-        # Store base object selections
-        base_selections = {}
-        for lod in props.lods:
-            if hasattr(lod, 'base_objects'):
-                for base_obj in lod.base_objects:
-                    key = f"{lod.name}:{base_obj.name}"
-                    base_selections[key] = base_obj.selected
-
-        # Store LOD selections specifically
-        lod_states = {}
-        for lod in props.lods:
-            match = lod_pattern.search(lod.name.lower())
-            if match:  # Only store actual LOD selections
-                lod_states[lod.name] = lod.include
-
-        # Store Quick Select states
-        quick_select_states = [lod.name for lod in props.active_common_lods]
-
-        # Clear everything before scan
-        props.lods.clear()
-        props.common_lods.clear()
-        props.active_common_lods.clear()
 
         # Validate paths first
-        valid_paths = []
-        for folder_path in folder_paths:
-            abs_path = bpy.path.abspath(folder_path).replace("\\", "/")
-            if os.path.exists(abs_path):
-                valid_paths.append(abs_path)
-            else:
-                self.report({'WARNING'}, f"Invalid path: {folder_path}")
+        valid_paths = get_library_roots(props, report=self.report)
 
         if not valid_paths:
             props.has_scanned = False
@@ -667,86 +1661,30 @@ class OBJECT_OT_scan_folder(Operator):
             self.report({'ERROR'}, "No valid folder paths!")
             return {'CANCELLED'}
 
-        # Scan all valid folders
-        extensions = get_import_extensions()
-        
-        for folder_path in valid_paths:
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    ext = os.path.splitext(file)[1].lower()
-                    if ext not in extensions:
-                        continue
-                    
-                    # Clean the base name by removing LOD part
-                    base_name = os.path.splitext(file)[0]
-                    rel_path = os.path.relpath(root, folder_path)
-                    
-                    # Add file to LODs
-                    lod_item = props.lods.add()
-                    lod_item.name = file
-                    lod_item.include = False
-                    
-                    # Store path relative to the specific folder it was found in
-                    if rel_path != '.':
-                        lod_item.object_name = os.path.join(folder_path, rel_path, base_name)
-                    else:
-                        lod_item.object_name = os.path.join(folder_path, base_name)
-                    
-                    # If it's a base file, try to get object names
-                    is_base = not bool(lod_pattern.search(base_name.lower()))
-                    
-                    if is_base:
-                        try:
-                            file_path = os.path.join(root, file)
-                            pre_import_objects = set(bpy.data.objects)
-                            
-                            # Import the file
-                            extensions = get_import_extensions()
-                            if ext in extensions:
-                                extensions[ext](file_path)
-                            
-                            # Get new objects
-                            new_objects = set(bpy.data.objects) - pre_import_objects
-                            
-                            # Add each MESH object (not empty)
-                            for obj in sorted(new_objects, key=lambda x: x.name):
-                                if obj.type == 'MESH':  # Only add mesh objects
-                                    base_obj = lod_item.base_objects.add()
-                                    base_obj.name = obj.name
-                                    base_obj.selected = False
-                            
-                            # Cleanup
-                            for obj in new_objects:
-                                bpy.data.objects.remove(obj, do_unlink=True)
-                                
-                        except Exception as e:
-                            self.report({'WARNING'}, f"Failed to scan {file}: {str(e)}")
+        # Crawl all valid folders
+        extensions = get_import_extensions(props.importer_backend)
+        if props.background_scan:
+            start_background_scan('ASSETS', valid_paths, tuple(extensions))
+            self.report({'INFO'}, "Scanning in the background")
+            return {'FINISHED'}
 
-        # Restore base object selections
-        for lod in props.lods:
-            if hasattr(lod, 'base_objects'):
-                for base_obj in lod.base_objects:
-                    key = f"{lod.name}:{base_obj.name}"
-                    if key in base_selections:
-                        base_obj.selected = base_selections[key]
-
-        # Restore only LOD selections
-        for lod in props.lods:
-            match = lod_pattern.search(lod.name.lower())
-            if match and lod.name in lod_states:  # Only restore actual LOD selections
-                lod.include = lod_states[lod.name]
+        cancel_background_scan('ASSETS')
+        entries = []
+        for folder_path in valid_paths:
+            entries.extend(crawl_asset_files(folder_path, extensions))
 
-        # Restore Quick Select states
-        for lod_name in quick_select_states:
-            new_lod = props.active_common_lods.add()
-            new_lod.name = lod_name
+        # Diff against the current items instead of clearing - selections stay in place
+        added, removed, updated = sync_lod_entries(props, entries, extensions, report=self.report)
+        sync_generated_lods(props)
+        save_scan_index()
 
         props.has_scanned = True
         props.last_scanned_path = props.folder_path
 
-        # Re-register panels
-        register_folder_panels()
-        
+        # Rebuild folder model for the panels
+        refresh_folder_panels()
+
+        self.report({'INFO'}, f"Scan complete: {added} added, {removed} removed, {updated} updated")
         return {'FINISHED'}
 
 class OBJECT_OT_scan_textures(Operator):
@@ -764,85 +1702,160 @@ class OBJECT_OT_scan_textures(Operator):
         prev_quickres_states = props.active_quickres_states
         
         # Clear only textures collection, preserve states
+        cancel_background_scan('TEXTURES')
         props.textures.clear()
+
+        if props.background_scan:
+            start_background_scan('TEXTURES', folder_paths, TEXTURE_EXTENSIONS,
+                                  previous=(prev_active_lods, prev_active_resolutions, prev_quickres_states))
+            self.report({'INFO'}, "Scanning textures in the background")
+            return {'FINISHED'}
         
         # Dictionary to store resolutions
         resolutions = {}
+        duplicates = {}  # content hash -> paths
         
-        # Scan for texture files
+        # Scan for texture files, zip archives are listed without extracting them
+        entries = []
         for folder_path in folder_paths:
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    if file.lower().endswith(('.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp')):
-                        texture_item = props.textures.add()
-                        texture_item.name = file
-                        texture_item.object_name = os.path.join(root, file)
-                        
-                        # Get image resolution
-                        try:
-                            img = bpy.data.images.load(texture_item.object_name)
-                            resolution = f"{img.size[0]}x{img.size[1]}"
-                            if resolution not in resolutions:
-                                resolutions[resolution] = []
-                            resolutions[resolution].append(texture_item.object_name)
-                            bpy.data.images.remove(img)
-                        except Exception as e:
-                            print(f"Failed to process texture {file}: {str(e)}")
+            for root, files in walk_library(folder_path):
+                textures = [file for file in files if file.lower().endswith(TEXTURE_EXTENSIONS)]
+                for file, name, tiles in group_texture_tiles(textures):
+                    entries.append((os.path.join(root, file), name, tiles, None))
+        add_texture_items(props, entries, resolutions, duplicates)
+        finish_texture_scan(props, resolutions, duplicates,
+                            (prev_active_lods, prev_active_resolutions, prev_quickres_states))
+        return {'FINISHED'}
+
+TEXTURE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.dds', '.ktx2')
+
+def get_tile_set_hash(texture_path, tiles, info):
+    """Content hash of a tile set from the sampled hashes of all tiles.
+    Tile hashes are kept in info by file signature, unchanged tiles are not read again."""
+    folder = os.path.dirname(texture_path)
+    cached = info.get("tile_hashes", {})
+    tile_hashes = {}
+    digest = hashlib.blake2b(digest_size=16)
+    for number, file in tiles:
+        tile_path = os.path.join(folder, file)
+        signature = get_file_signature(tile_path)
+        sig, content_hash = cached.get(file, (None, None))
+        if sig != signature:
+            content_hash = sampled_content_hash(tile_path)
+        tile_hashes[file] = [signature, content_hash]
+        digest.update(f"{number}={content_hash};".encode())
+    info["tile_hashes"] = tile_hashes
+    return digest.hexdigest()
+
+def get_texture_tiles(texture_path):
+    """[tile number, file] of the tile set starting at texture_path, None for single images"""
+    entry = get_scan_index().get("textures", {}).get(lod_file_key(texture_path))
+    return entry.get("tiles") if entry else None
+
+def add_texture_items(props, entries, resolutions, duplicates):
+    """Add (path, name, tiles, scan index entry or None) to props.textures, grouping paths by resolution.
+    Tile sets are one item named with the <UDIM>/<UVTILE> token, their path is the first tile."""
+    index = get_scan_index().setdefault("textures", {})
+    for texture_path, file, tiles, entry in entries:
+        # Get image resolution from the header, cached with the content hash
+        try:
+            if entry:
+                index[lod_file_key(texture_path)] = entry
+            info = entry or get_texture_info(texture_path)
+            texture_item = props.textures.add()
+            texture_item.name = file
+            texture_item.object_name = texture_path
+            # The first tile's header stands for the whole set, the tile list is refreshed every scan.
+            # The hash covers all tiles, sets sharing a first tile are no duplicates.
+            if tiles:
+                info["tiles"] = tiles
+                info["hash"] = get_tile_set_hash(texture_path, tiles, info)
+            else:
+                info.pop("tiles", None)
+                if info.pop("tile_hashes", None) is not None:
+                    info["hash"] = sampled_content_hash(texture_path)
+            resolution = f"{info['width']}x{info['height']}"
+            if resolution not in resolutions:
+                resolutions[resolution] = []
+            resolutions[resolution].append(texture_path)
+            duplicates.setdefault(info["hash"], []).append(texture_path)
+
+            # Stored mip levels of DDS/KTX2 maps are offered like derived resolutions
+            for res_str in get_mip_resolutions(info):
+                resolutions.setdefault(res_str, [])
+        except Exception as e:
+            print(f"Failed to process texture {file}: {str(e)}")
+
+def finish_texture_scan(props, resolutions, duplicates, previous):
+    """Store the resolutions of a texture scan and restore the selections made before it"""
+    prev_active_lods, prev_active_resolutions, prev_quickres_states = previous
+
+    save_scan_index()
+    duplicate_count = sum(len(paths) - 1 for paths in duplicates.values())
+    if duplicate_count:
+        print(f"{duplicate_count} textures are identical copies and share one image")
+
+    # Store resolutions in cache without clearing previous states
+    if resolutions:  # Only update if we found textures
+        props.texture_resolution_cache = json.dumps(resolutions)
+    
+    # Process found textures
+    found_texture_types = set()
+    for texture in props.textures:
+        texture_name = texture.name.lower()
+        matched_type = False
         
-        # Store resolutions in cache without clearing previous states
-        if resolutions:  # Only update if we found textures
-            props.texture_resolution_cache = json.dumps(resolutions)
+        # Check for specific texture types
+        for type_name, keywords in texture_types.items():
+            if any(keyword in texture_name for keyword in keywords):
+                found_texture_types.add(type_name)
+                matched_type = True
+                break
         
-        # Process found textures
-        found_texture_types = set()
-        for texture in props.textures:
-            texture_name = texture.name.lower()
-            matched_type = False
-            
-            # Check for specific texture types
-            for type_name, keywords in texture_types.items():
-                if any(keyword in texture_name for keyword in keywords):
-                    found_texture_types.add(type_name)
-                    matched_type = True
-                    break
-            
-            # If no specific type matched, check if it's a base texture
-            if not matched_type and not any(keyword in texture_name 
-                for keywords in texture_types.values() 
-                for keyword in keywords):
-                found_texture_types.add("BASE")
-
-        # Restore QuickRes states
-        if prev_quickres_states:
-            props.active_quickres_states = prev_quickres_states
-
-        # Restore resolution selections while preserving existing ones
-        existing_resolutions = {res.name for res in props.active_texture_resolutions}
-        for res in prev_active_resolutions:
-            if res in resolutions and res not in existing_resolutions:
-                new_res = props.active_texture_resolutions.add()
-                new_res.name = res
-
-        # Restore texture type selections while preserving existing ones
-        existing_types = {lod.name for lod in props.active_common_lods}
-        for texture_type in found_texture_types:
-            if texture_type in prev_active_lods and texture_type not in existing_types:
-                new_lod = props.active_common_lods.add()
-                new_lod.name = texture_type
-
-        return {'FINISHED'}
+        # If no specific type matched, check if it's a base texture
+        if not matched_type and not any(keyword in texture_name 
+            for keywords in texture_types.values() 
+            for keyword in keywords):
+            found_texture_types.add("BASE")
+
+    # Restore QuickRes states
+    if prev_quickres_states:
+        props.active_quickres_states = prev_quickres_states
+
+    # Restore resolution selections while preserving existing ones
+    existing_resolutions = {res.name for res in props.active_texture_resolutions}
+    for res in prev_active_resolutions:
+        if res in resolutions and res not in existing_resolutions:
+            new_res = props.active_texture_resolutions.add()
+            new_res.name = res
+
+    # Restore texture type selections while preserving existing ones
+    existing_types = {lod.name for lod in props.active_common_lods}
+    for texture_type in found_texture_types:
+        if texture_type in prev_active_lods and texture_type not in existing_types:
+            new_lod = props.active_common_lods.add()
+            new_lod.name = texture_type
 
 class OBJECT_OT_batch_import(Operator): 
     bl_idname = "import_assets.batch_import"
     bl_label = "Import Selected"
     bl_description = "Import Selected"
+    # One undo step for the whole import, the nested importers push none
+    bl_options = {'REGISTER', 'UNDO'}
+
+    deferred_only: BoolProperty(
+        name="Deferred Only",
+        description="Import the files deferred by the memory budget",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
     
     def execute(self, context):
         props = context.scene.batch_import_props
         folder_paths = [path.strip() for path in props.folder_path.split(';')]
         imported_anything = False
         imported_objects = []
-        extensions = get_import_extensions()
+        extensions = get_import_extensions(props.importer_backend)
         
         # Get selected files from all folders
         selected_files = []
@@ -852,28 +1865,31 @@ class OBJECT_OT_batch_import(Operator):
         print(f"Number of LODs in props.lods: {len(props.lods)}")
         
         # First pass: collect all files to import, removing active_folder check
-        for lod in props.lods:
-            print(f"\nChecking LOD: {lod.name}")
-            print(f"File folder: {os.path.dirname(lod.object_name)}")
+        if self.deferred_only:
+            selected_files = get_deferred_imports(props)
+        else:
+            for lod in props.lods:
+                print(f"\nChecking LOD: {lod.name}")
+                print(f"File folder: {os.path.dirname(lod.object_name)}")
             
-            # Check if this is a LOD file first
-            match = re.search(r'lod(\d+)', lod.name.lower())
-            if match:  # This is a LOD item
-                lod_name = f"LOD{match.group(1)}"
-                is_quick_selected = props.is_quick_selected(lod_name)
-                print(f"LOD item: {lod_name} - Quick selected: {is_quick_selected}, Include: {lod.include}")
+                # Check if this is a LOD file first
+                match = re.search(r'lod(\d+)', lod.name.lower())
+                if match:  # This is a LOD item
+                    lod_name = f"LOD{match.group(1)}"
+                    is_quick_selected = props.is_quick_selected(lod_name)
+                    print(f"LOD item: {lod_name} - Quick selected: {is_quick_selected}, Include: {lod.include}")
                 
-                if is_quick_selected or lod.include:
-                    selected_files.append((lod, None))
-                    print(f"Adding LOD file: {lod.name}")
-            else:  # This is a BASE item
-                is_quick_selected = props.is_quick_selected("BASE")
-                print(f"BASE item - Quick selected: {is_quick_selected}")
-                if is_quick_selected or any(obj.selected for obj in lod.base_objects):
-                    selected_objects = [obj for obj in lod.base_objects if obj.selected or is_quick_selected]
-                    if selected_objects:
-                        selected_files.append((lod, selected_objects))
-                        print(f"Adding BASE file: {lod.name} with {len(selected_objects)} objects")
+                    if is_quick_selected or lod.include:
+                        selected_files.append((lod, None))
+                        print(f"Adding LOD file: {lod.name}")
+                else:  # This is a BASE item
+                    is_quick_selected = props.is_quick_selected("BASE")
+                    print(f"BASE item - Quick selected: {is_quick_selected}")
+                    if is_quick_selected or any(obj.selected for obj in lod.base_objects):
+                        selected_objects = [obj for obj in lod.base_objects if obj.selected or is_quick_selected]
+                        if selected_objects:
+                            selected_files.append((lod, selected_objects))
+                            print(f"Adding BASE file: {lod.name} with {len(selected_objects)} objects")
 
         print(f"\nSelected files count: {len(selected_files)}")
         print("Selected files:")
@@ -891,108 +1907,249 @@ class OBJECT_OT_batch_import(Operator):
         # Track imported objects and collections
         container_collections = {}
         imported_objects = []
+        placed_instances = []
+        lod_sets = {}  # (collection, base name) -> {lod: [objects]}
         processed_meshes = set()  # Track processed meshes
-
-        # Import objects
-        for lod, selected_objects in selected_files:
-            file_path = os.path.join(os.path.dirname(lod.object_name), lod.name)
-            ext = os.path.splitext(lod.name)[1].lower()
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
-            clean_base_name = re.sub(r'_lod\d+.*$', '', base_name)
+        budget = int(props.memory_budget_gb * 1024 ** 3)
+        deferred = []
+
+        # Journaled imports skip the files an unfinished earlier run completed and saved
+        journal = None
+        if props.journal_import:
+            journal = open_import_journal(props.checkpoint_interval)
+            if journal is None:
+                self.report({'WARNING'}, "Save the file first, journaled imports resume from its checkpoints")
+            elif journal["completed"]:
+                remaining = []
+                for lod, selected_objects in selected_files:
+                    record = journal["completed"].get(lod_file_key(get_lod_file_path(lod)))
+                    # A record whose collection was removed since is imported again
+                    collection = bpy.data.collections.get(record.get("collection", "")) if record else None
+                    if record is None or (not record.get("instances") and collection is None):
+                        remaining.append((lod, selected_objects))
+                        continue
+                    objects = [bpy.data.objects[name] for name in record["objects"]]
+                    if record.get("instances"):
+                        placed_instances.extend(objects)
+                        continue
+                    container_collections[record["collection"]] = collection
+                    imported_objects.extend(objects)
+                    lod_sets.setdefault((record["collection"], record["base"]), {}).setdefault(record["lod"], []).extend(objects)
+                print(f"Resuming import: {len(selected_files) - len(remaining)} files done by an earlier run")
+                selected_files = remaining
+            if journal is not None:
+                journal["pending"] = {lod_file_key(get_lod_file_path(lod)) for lod, _ in selected_files}
+
+        # Instance mode: convert every source once, placements only link the cached .blend
+        if props.import_mode == 'INSTANCE':
+            errors = convert_sources_to_blends([get_lod_file_path(lod) for lod, _ in selected_files], props.worker_count)
+            for file_path, error in errors.items():
+                self.report({'WARNING'}, f"Failed to convert {os.path.basename(file_path)}: {error}")
+
+        # Copy sources from network roots to the local cache ahead of the import loop
+        if configure_local_cache(props) and props.import_mode == 'LOCAL':
+            prefetch_local_copies([get_lod_file_path(lod) for lod, _ in selected_files])
+
+        # One import session: objects staged out of the depsgraph
+        with import_session(context, props.staged_import) as session:
+            # Import objects
+            for lod, selected_objects in selected_files:
+                file_path = get_lod_file_path(lod)
+
+                # Over the memory budget: split the job, the rest is imported by a later run
+                if budget and props.import_mode == 'LOCAL' and imported_objects:
+                    if deferred or not fits_memory_budget(budget, estimate_import_cost(file_path)):
+                        deferred.append((lod, selected_objects))
+                        continue
+                ext = os.path.splitext(lod.name)[1].lower()
+                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                clean_base_name = re.sub(r'_lod\d+.*$', '', base_name)
             
-            # Get LOD number from filename
-            lod_match = re.search(r'_lod(\d+)', base_name.lower())
-            current_lod = lod_match.group(1) if lod_match else "base"
+                # Get LOD number from filename
+                lod_match = re.search(r'_lod(\d+)', base_name.lower())
+                current_lod = lod_match.group(1) if lod_match else "base"
             
-            try:
-                folder_name = os.path.basename(os.path.dirname(file_path))
-                collection_name = f"{folder_name}"
+                try:
+                    folder_name = os.path.basename(os.path.dirname(file_path))
+                    collection_name = f"{folder_name}"
                 
-                # Create or get collection
-                if collection_name not in container_collections:
-                    existing_collection = bpy.data.collections.get(collection_name)
-                    if existing_collection:
-                        container_collections[collection_name] = existing_collection
-                    else:
-                        container_collections[collection_name] = bpy.data.collections.new(collection_name)
-                        bpy.context.scene.collection.children.link(container_collections[collection_name])
+                    # Create or get collection
+                    if collection_name not in container_collections:
+                        existing_collection = bpy.data.collections.get(collection_name)
+                        if existing_collection:
+                            container_collections[collection_name] = existing_collection
+                        else:
+                            container_collections[collection_name] = bpy.data.collections.new(collection_name)
+                            bpy.context.scene.collection.children.link(container_collections[collection_name])
+
+                    if props.import_mode == 'INSTANCE':
+                        # Partial BASE selections instance only the chosen objects
+                        source_keys = None
+                        if selected_objects and len(selected_objects) < len(lod.base_objects):
+                            source_keys = [get_source_key(obj.name, obj.source_ref) for obj in selected_objects]
+
+                        collections = link_asset_collections(file_path, source_keys)
+                        if not collections:
+                            self.report({'ERROR'}, f"No converted objects of {lod.name} match the selection")
+                            continue
+                        file_instances = []
+                        for coll in collections:
+                            instance = bpy.data.objects.new(f"{clean_base_name}_LOD{current_lod}", None)
+                            instance.instance_type = 'COLLECTION'
+                            instance.instance_collection = coll
+                            container_collections[collection_name].objects.link(instance)
+                            placed_instances.append(instance)
+                            file_instances.append(instance.name)
+                            print(f"Placed instance: {instance.name}")
+                        journal_completed_file(journal, session, {"file": lod_file_key(file_path),
+                                                                  "objects": file_instances, "instances": True})
+                        continue
 
-                print(f"Importing: {file_path}")
-                pre_import_objects = set(bpy.data.objects)
-                pre_import_meshes = set(bpy.data.meshes)
+                    print(f"Importing: {file_path}")
+                    pre_import_objects = set(bpy.data.objects)
+                    pre_import_meshes = set(bpy.data.meshes)
                 
-                # Import the file
-                extensions[ext](file_path)
+                    # Import the file - partial BASE selections read only the selected meshes where possible
+                    partial_selection = selected_objects and len(selected_objects) < len(lod.base_objects)
+                    if partial_selection:
+                        read_selectively = import_selected_objects(local_source_path(file_path), selected_objects, extensions)
+                    else:
+                        extensions[ext](local_source_path(file_path))
                 
-                new_objects = set(bpy.data.objects) - pre_import_objects
-                new_meshes = set(bpy.data.meshes) - pre_import_meshes
-
-                # Process each new object
-                for obj in new_objects:
-                    if obj.type == 'MESH':
-                        # Generate target names
-                        original_mesh_name = obj.data.name if obj.data else ""
-                        target_base = f"{clean_base_name}_LOD{current_lod}"
+                    new_objects = set(bpy.data.objects) - pre_import_objects
+                    new_meshes = set(bpy.data.meshes) - pre_import_meshes
+                    file_objects = []
+
+                    if partial_selection and not read_selectively:
+                        # Drop unselected objects right away in one batch
+                        keep_names = {obj.name for obj in selected_objects}
+                        dropped = [obj for obj in new_objects
+                                   if obj.type == 'MESH' and re.sub(r'\.\d{3}$', '', obj.name) not in keep_names]
+                        dropped_meshes = [obj.data for obj in dropped if obj.data in new_meshes and obj.data.users == 1]
+                        new_objects -= set(dropped)
+                        bpy.data.batch_remove(dropped + dropped_meshes)
+
+                    # Process each new object
+                    for obj in new_objects:
+                        if obj.type == 'MESH':
+                            # Generate target names
+                            original_mesh_name = obj.data.name if obj.data else ""
+                            target_base = f"{clean_base_name}_LOD{current_lod}"
                         
-                        # Preserve mesh suffixes if present
-                        if '_' in original_mesh_name:
-                            mesh_suffix = original_mesh_name.split('_', 1)[1]
-                            target_name = f"{target_base}_{mesh_suffix}"
-                        else:
-                            target_name = target_base
-
-                        # Always process mesh first
-                        if obj.data:
-                            # Clear materials from mesh
-                            obj.data.materials.clear()
-                            # Rename mesh to match target name
-                            obj.data.name = target_name
-
-                        # Rename object to match mesh
-                        obj.name = target_name
-
-                        # Move to collection
-                        for coll in obj.users_collection:
-                            coll.objects.unlink(obj)
-                        container_collections[collection_name].objects.link(obj)
-                        imported_objects.append(obj)
-                        print(f"Imported: {target_name}")
-
-                    else:
-                        # Remove non-mesh objects
-                        bpy.data.objects.remove(obj, do_unlink=True)
-
-                    # Remove orphaned materials
-                    for mat in bpy.data.materials:
-                        if not mat.users:
-                            bpy.data.materials.remove(mat)
+                            # Preserve mesh suffixes if present
+                            if '_' in original_mesh_name:
+                                mesh_suffix = original_mesh_name.split('_', 1)[1]
+                                target_name = f"{target_base}_{mesh_suffix}"
+                            else:
+                                target_name = target_base
+
+                            # Always process mesh first
+                            if obj.data:
+                                # Clear materials from mesh
+                                obj.data.materials.clear()
+                                # Rename mesh to match target name
+                                obj.data.name = target_name
+
+                            # Rename object to match mesh
+                            obj.name = target_name
+
+                            # Move to collection - staged objects move when the session reveals them
+                            if session["staging"]:
+                                session["placed"].append((obj, container_collections[collection_name]))
+                            else:
+                                for coll in obj.users_collection:
+                                    coll.objects.unlink(obj)
+                                container_collections[collection_name].objects.link(obj)
+                            imported_objects.append(obj)
+                            file_objects.append(obj.name)
+                            lod_sets.setdefault((collection_name, clean_base_name), {}).setdefault(current_lod, []).append(obj)
+                            print(f"Imported: {target_name}")
 
-            except Exception as e:
-                self.report({'WARNING'}, f"Failed to import {lod.name}: {str(e)}")
-                continue
-
-        # Only assign materials if textures are selected AND resolutions are selected
-        if (props.textures and 
-            props.active_texture_resolutions and  # Check if resolutions are selected
-            any(lod.name for lod in props.active_common_lods)):  # Check if texture types are selected
+                        else:
+                            # Remove non-mesh objects
+                            bpy.data.objects.remove(obj, do_unlink=True)
+
+                        # Remove orphaned materials
+                        for mat in bpy.data.materials:
+                            if not mat.users:
+                                bpy.data.materials.remove(mat)
+
+                    journal_completed_file(journal, session, {"file": lod_file_key(file_path), "objects": file_objects,
+                                                              "collection": collection_name, "base": clean_base_name,
+                                                              "lod": current_lod})
+
+                except Exception as e:
+                    self.report({'WARNING'}, f"Failed to import {lod.name}: {str(e)}")
+                    continue
+
+            reveal_staged_objects(session)
+
+            # Group the LODs of each asset under one parent with a child collection per level
+            if props.assemble_lods:
+                for (collection_name, base_name), levels in lod_sets.items():
+                    if len(levels) > 1:
+                        assemble_lod_set(container_collections[collection_name], base_name, levels)
+                apply_lod_switching(context.scene)
+
+            # Only assign materials if textures are selected AND resolutions are selected
+            if (props.textures and 
+                (props.active_texture_resolutions or props.auto_texture_resolution) and  # Check if resolutions are selected
+                any(lod.name for lod in props.active_common_lods)):  # Check if texture types are selected
             
-            # Get selected textures
-            selected_textures = []
-            for texture in props.textures:
-                texture_type = None
-                for type_name, keywords in texture_types.items():
-                    if any(keyword in texture.name.lower() for keyword in keywords):
-                        texture_type = type_name
-                        break
-                
-                if texture_type and any(lod.name == texture_type for lod in props.active_common_lods):
-                    selected_textures.append(texture.object_name)
-
-            # Only proceed with material assignment if we have both textures and resolutions selected
-            if selected_textures:
-                assign_materials_to_objects(imported_objects, selected_textures)
-        else:
-            print("Skipping material assignment - no resolutions or texture types selected")
+                # Get selected textures
+                selected_textures = get_selected_texture_paths(props)
+
+                max_texture_size = None
+                texture_resolutions = None
+                if props.auto_texture_resolution and selected_textures:
+                    # Highest resolution per imported asset that fits the texture budget
+                    object_bases = {re.sub(r'_lod\d+.*$', '', os.path.splitext(obj.name)[0].lower())
+                                    for obj in imported_objects}
+                    assets = {base: maps_by_type
+                              for base, maps_by_type in group_asset_textures(props, selected_textures).items()
+                              if any(base in obj_base or obj_base in base for obj_base in object_bases)}
+                    texture_budget = props.texture_budget_gb * 1024 ** 3
+                    texture_resolutions, texture_cost = fit_texture_budget(assets, texture_budget,
+                                                                           props.derive_texture_resolutions)
+                    print(f"Texture budget: {format_memory(texture_cost)} for {len(assets)} assets")
+                    if texture_cost > texture_budget:
+                        self.report({'WARNING'}, f"Even the lowest texture resolutions need {format_memory(texture_cost)}")
+
+                # Fall back to proxy textures if the full resolution maps would exceed the budget
+                elif budget and selected_textures:
+                    selected_resolutions = {res.name for res in props.active_texture_resolutions}
+                    texture_cost = 0
+                    for tex_path in selected_textures:
+                        info = get_texture_info(tex_path)
+                        if f"{info['width']}x{info['height']}" in selected_resolutions:
+                            texture_cost += estimate_texture_memory(info)
+                    if not fits_memory_budget(budget, texture_cost):
+                        max_texture_size = PROXY_TEXTURE_SIZE
+                        self.report({'WARNING'}, f"Textures exceed the memory budget, using {PROXY_TEXTURE_SIZE}px proxies")
+
+                # Only proceed with material assignment if we have both textures and resolutions selected
+                if selected_textures:
+                    assign_materials_to_objects(imported_objects, selected_textures, max_texture_size, texture_resolutions)
+            else:
+                print("Skipping material assignment - no resolutions or texture types selected")
+
+        save_local_cache_index()
+        save_scan_index()
+        close_import_journal(journal)
+        if journal and journal["skipped_checkpoints"]:
+            self.report({'WARNING'}, f"{journal['skipped_checkpoints']} checkpoints skipped, the file could not be saved")
+        props.deferred_imports = json.dumps([
+            [lod_file_key(get_lod_file_path(lod)), [obj.name for obj in objects] if objects is not None else None]
+            for lod, objects in deferred
+        ])
+        if deferred:
+            self.report({'WARNING'}, f"Memory budget reached, {len(deferred)} files deferred - "
+                                      "save, restart Blender and use Import Deferred")
+            return {'FINISHED'}
+
+        if placed_instances:
+            self.report({'INFO'}, f"Successfully placed {len(placed_instances)} linked instances")
+            return {'FINISHED'}
 
         self.report({'INFO'}, f"Successfully imported {len(imported_objects)} objects")
         return {'FINISHED'}
@@ -1005,7 +2162,6 @@ class OBJECT_OT_toggle_common_lod(Operator):
     
     def execute(self, context):
         props = context.scene.batch_import_props
-        lod_pattern = re.compile(r'lod(\d+)')
         
         # Check if already quick-selected
         is_quick_selected = props.is_quick_selected(self.lod_name)
@@ -1014,47 +2170,17 @@ class OBJECT_OT_toggle_common_lod(Operator):
             # Activate quick-select and select all
             new_lod = props.active_common_lods.add()
             new_lod.name = self.lod_name
-            
-            # Select all matching objects
-            if self.lod_name == "BASE":
-                for lod in props.lods:
-                    if not lod_pattern.search(lod.name.lower()):
-                        if hasattr(lod, 'base_objects'):
-                            for base_obj in lod.base_objects:
-                                base_obj.selected = True
-                        lod.include = True
-            else:
-                target_lod_num = self.lod_name[3:]
-                for lod in props.lods:
-                    match = lod_pattern.search(lod.name.lower())
-                    if match and match.group(1) == target_lod_num:
-                        lod.include = True
-                        if hasattr(lod, 'base_objects'):
-                            for base_obj in lod.base_objects:
-                                base_obj.selected = True
         else:
             # Deactivate quick-select
             for i, lod in enumerate(props.active_common_lods):
                 if lod.name == self.lod_name:
                     props.active_common_lods.remove(i)
                     break
-            
-            # Deselect all matching objects
-            if self.lod_name == "BASE":
-                for lod in props.lods:
-                    if not lod_pattern.search(lod.name.lower()):
-                        if hasattr(lod, 'base_objects'):
-                            for base_obj in lod.base_objects:
-                                base_obj.selected = False
-                        lod.include = False
-            else:
-                target_lod_num = self.lod_name[3:]
-                for lod in props.lods:
-                    match = lod_pattern.search(lod.name.lower())
-                    if match and match.group(1) == target_lod_num:
-                        lod.include = False
-                        if hasattr(lod, 'base_objects'):
-                            base_obj.selected = False
+
+        # Select or deselect all matching objects in one go
+        model = get_selection_model(props)
+        mask = model["parts"] == model["part_codes"].get(self.lod_name, -1)
+        set_lod_selection(props, mask, mask, not is_quick_selected)
         
         context.area.tag_redraw()
         return {'FINISHED'}
@@ -1067,25 +2193,62 @@ class OBJECT_OT_select_all_lods(Operator):
         props = context.scene.batch_import_props
         
         # If all are selected, deselect all
-        if len(props.active_common_lods) > 0:
+        state = len(props.active_common_lods) == 0
+        if not state:
             props.active_common_lods.clear()
-            # Deselect all LODs
-            for lod in props.lods:
-                lod.include = False
-                if hasattr(lod, 'base_objects'):
-                    for base_obj in lod.base_objects:
-                        base_obj.selected = False
-        else:
-            # Select all LODs and BASE
-            lod_pattern = re.compile(r'lod(\d+)')
-            for lod in props.lods:
-                lod.include = True
-                if hasattr(lod, 'base_objects'):
-                    for base_obj in lod.base_objects:
-                        base_obj.selected = True
+
+        # Select or deselect all LODs and BASE
+        mask = np.ones(len(props.lods), dtype=bool)
+        set_lod_selection(props, mask, mask, state)
         
         return {'FINISHED'}
 
+class OBJECT_OT_fit_triangle_budget(Operator):
+    bl_idname = "import_assets.fit_triangle_budget"
+    bl_label = "Fit Budget"
+    bl_description = "Select the most detailed LOD per asset that keeps the selection under the triangle budget"
+
+    def execute(self, context):
+        props = context.scene.batch_import_props
+        model = get_selection_model(props)
+        part_names = {code: name for name, code in model["part_codes"].items()}
+        triangles = get_triangle_counts(props)
+
+        # Levels per asset, most detailed first - BASE files only count for assets without LOD files
+        assets = {}
+        for index, lod in enumerate(props.lods):
+            part = part_names[model["parts"][index]]
+            level = -1 if part == "BASE" else int(part[3:])
+            key = (os.path.dirname(lod.object_name), int(model["groups"][index]))
+            assets.setdefault(key, []).append((level, index))
+        levels = {}
+        for key, candidates in assets.items():
+            levels[key] = sorted([c for c in candidates if c[0] >= 0] or candidates)
+        current, total = fit_levels_to_budget(
+            {key: [int(triangles[index]) for _, index in candidates] for key, candidates in levels.items()},
+            props.triangle_budget)
+
+        # Explicit selection - Quick Select and group toggles would override it
+        for i in reversed(range(len(props.active_common_lods))):
+            if props.active_common_lods[i].name in model["part_codes"]:
+                props.active_common_lods.remove(i)
+        props.group_active_states = ""
+
+        include = np.zeros(len(props.lods), dtype=bool)
+        for key, candidates in levels.items():
+            include[candidates[current[key]][1]] = True
+        props.lods.foreach_set("include", include)
+        for index in np.flatnonzero(model["base_object_counts"] > 0):
+            base_objects = props.lods[index].base_objects
+            base_objects.foreach_set("selected", np.full(len(base_objects), include[index], dtype=bool))
+
+        if total > props.triangle_budget:
+            self.report({'WARNING'}, f"Even the lowest LODs need {format_triangles(total)}")
+        else:
+            self.report({'INFO'}, f"Selected {len(levels)} assets with {format_triangles(total)}")
+        context.area.tag_redraw()
+        return {'FINISHED'}
+
 class OBJECT_OT_toggle_expanded(Operator):
     bl_idname = "import_assets.toggle_expanded"
     bl_label = ""  # Removed duplicate "Toggle Expanded"
@@ -1183,7 +2346,6 @@ class OBJECT_OT_toggle_group(Operator):
     
     def execute(self, context):
         props = context.scene.batch_import_props
-        lod_pattern = re.compile(r'lod(\d+)')
         
         # Check if group is currently active
         active_groups = props.group_active_states.split(',') if props.group_active_states else []
@@ -1199,22 +2361,11 @@ class OBJECT_OT_toggle_group(Operator):
             active_groups.remove(self.base_name)
         props.group_active_states = ','.join(filter(None, active_groups))
         
-        # Update selections for both BASE and LOD items
-        for lod in props.lods:
-            base_name = os.path.splitext(os.path.basename(lod.name))[0]
-            match = lod_pattern.search(base_name.lower())
-            
-            # Get clean base name for comparison
-            if match:
-                clean_base_name = base_name[:match.start()].rstrip('_')
-                if clean_base_name == self.base_name:
-                    # This is a LOD - set both include state and visual state
-                    lod.include = new_state
-            else:
-                clean_base_name = base_name
-                if clean_base_name == self.base_name and hasattr(lod, 'base_objects'):
-                    for base_obj in lod.base_objects:
-                        base_obj.selected = new_state
+        # Update selections for both BASE and LOD items: LODs get include, BASE items their objects
+        model = get_selection_model(props)
+        in_group = model["groups"] == model["group_codes"].get(self.base_name, -1)
+        is_base = model["parts"] == 0
+        set_lod_selection(props, in_group & ~is_base, in_group & is_base, new_state)
         
         # Force redraw
         for area in context.screen.areas:
@@ -1363,7 +2514,532 @@ def find_base_texture_name(texture_name):
     base_name = re.sub(r'\.\d{3}$', '', base_name)
     return base_name
 
-def create_material_from_textures(obj_name, texture_paths):
+def get_texture_type(tex_name):
+    """Texture type of a lower case file name, None for untyped maps"""
+    for type_name, keywords in texture_types.items():
+        if any(keyword in tex_name for keyword in keywords):
+            # Map ambientocclusion to ambient_occlusion and translucency to translucent
+            if 'ambientocclusion' in tex_name:
+                return 'ambient_occlusion'
+            if 'translucency' in tex_name:
+                return 'translucent'
+            return type_name
+    return None
+
+def get_texture_base(tex_name):
+    """Asset part of a lower case texture file name, matched against object names"""
+    tex_base = os.path.splitext(tex_name)[0]
+    tex_base = re.sub(r'_(?:albedo|diffuse|normal|roughness|metallic|height|ambientocclusion|opacity|translucency|specular|cavity|fuzz|gloss).*$', '', tex_base)
+    tex_base = re.sub(r'_(?:8bit|16bit).*$', '', tex_base)
+    tex_base = re.sub(r'_\d+ppm$', '', tex_base)
+    tex_base = re.sub(r'_lod\d+.*$', '', tex_base)
+    return tex_base
+
+def get_selected_texture_paths(props):
+    """Paths of the scanned textures whose type is quick-selected"""
+    selected_types = {lod.name for lod in props.active_common_lods}
+    selected_textures = []
+    for texture in props.textures:
+        texture_type = None
+        for type_name, keywords in texture_types.items():
+            if any(keyword in texture.name.lower() for keyword in keywords):
+                texture_type = type_name
+                break
+        if texture_type in selected_types:
+            selected_textures.append(texture.object_name)
+    return selected_textures
+
+def read_texture_resolution(texture_path):
+    """'WxH' of a texture the scan doesn't know"""
+    info = get_texture_info(texture_path)
+    return f"{info['width']}x{info['height']}"
+
+def get_texture_resolution_map(props):
+    """Texture path -> 'WxH' from the texture scan"""
+    resolutions = json.loads(props.texture_resolution_cache) if props.texture_resolution_cache else {}
+    return {path: resolution for resolution, paths in resolutions.items() for path in paths}
+
+def add_derived_resolutions(resolutions, min_size=1024):
+    """Offer the halved resolutions that can be derived from scanned maps, down to min_size"""
+    derived = dict(resolutions)
+    for res_str in resolutions:
+        width, height = map(int, res_str.split('x'))
+        while max(width, height) > min_size:
+            width, height = width // 2, height // 2
+            derived.setdefault(f"{width}x{height}", [])
+    return derived
+
+# Content hashes, memoized per file signature
+_content_hashes = {}
+
+def file_content_hash(file_path):
+    signature = get_file_signature(file_path)
+    cached = _content_hashes.get(file_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open_source_file(file_path) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    _content_hashes[file_path] = (signature, digest.hexdigest())
+    return _content_hashes[file_path][1]
+
+def sampled_content_hash(file_path, block_size=4096, blocks=16):
+    """Fast content hash: file size plus blake2b of evenly spaced blocks"""
+    archive_path, member = split_archive_path(file_path)
+    if archive_path:
+        # Seeking in compressed members means decompressing, the CRC is free
+        return hashlib.blake2b(get_file_signature(file_path).encode(), digest_size=16).hexdigest()
+    size = os.path.getsize(file_path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(file_path, 'rb') as f:
+        if size <= block_size * blocks:
+            digest.update(f.read())
+        else:
+            step = (size - block_size) // (blocks - 1)
+            for i in range(blocks):
+                f.seek(i * step)
+                digest.update(f.read(block_size))
+    return digest.hexdigest()
+
+def probe_image_header(file_path):
+    """Width, height, channels and bit depth from the image header without decoding it.
+    Returns a dict or None for unknown formats."""
+    with open_source_file(file_path) as f:
+        head = f.read(32)
+        if head[:4] == b'DDS ' or head[:12] == KTX2_IDENTIFIER:
+            f.seek(0)
+            layout = parse_gpu_texture_header(read_gpu_texture_header(f))
+            if layout is None:
+                print(f"Unsupported DDS/KTX2 layout or format: {file_path}")
+                return None
+            name, _, _ = GPU_TEXTURE_FORMATS[layout["dxgi"]]
+            return {"width": layout["width"], "height": layout["height"], "channels": 4,
+                    "bit_depth": 16 if name == 'BC6H' else 8, "format": name, "mips": len(layout["levels"])}
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+            width, height, bit_depth, color_type = int.from_bytes(head[16:20], 'big'), int.from_bytes(head[20:24], 'big'), head[24], head[25]
+            channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(color_type, 4)
+            return {"width": width, "height": height, "channels": channels, "bit_depth": bit_depth}
+        if head[:2] == b'\xff\xd8':
+            # Walk the segments up to the start of frame
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue
+                length = int.from_bytes(f.read(2), 'big')
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    frame = f.read(6)
+                    return {"width": int.from_bytes(frame[3:5], 'big'), "height": int.from_bytes(frame[1:3], 'big'),
+                            "channels": frame[5], "bit_depth": frame[0]}
+                f.seek(length - 2, 1)
+        if head[:2] == b'BM':
+            bits = int.from_bytes(head[28:30], 'little')
+            return {"width": int.from_bytes(head[18:22], 'little', signed=True),
+                    "height": abs(int.from_bytes(head[22:26], 'little', signed=True)),
+                    "channels": max(bits // 8, 1), "bit_depth": 8}
+        if head[:4] in (b'II*\x00', b'MM\x00*'):
+            order = 'little' if head[:2] == b'II' else 'big'
+            f.seek(int.from_bytes(head[4:8], order))
+            count = int.from_bytes(f.read(2), order)
+            tags = {}
+            for _ in range(count):
+                entry = f.read(12)
+                tag, kind = int.from_bytes(entry[0:2], order), int.from_bytes(entry[2:4], order)
+                # SHORT values sit left-aligned in the value field
+                tags[tag] = int.from_bytes(entry[8:10] if kind == 3 else entry[8:12], order)
+            if 256 not in tags or 257 not in tags:
+                return None
+            channels = tags.get(277, 1)
+            # BitsPerSample is an offset for more than two samples, assume 8 bit then
+            bit_depth = tags.get(258, 8) if channels <= 2 else 8
+            return {"width": tags[256], "height": tags[257], "channels": channels, "bit_depth": bit_depth}
+        if file_path.lower().endswith('.tga') and len(head) >= 18:
+            bits = head[16]
+            return {"width": int.from_bytes(head[12:14], 'little'), "height": int.from_bytes(head[14:16], 'little'),
+                    "channels": max(bits // 8, 1), "bit_depth": 8}
+    return None
+
+def get_mip_texture(texture_path, level=0):
+    """DDS with the mip chain of a DDS/KTX2 texture from level on, copied without resampling.
+    KTX2 files get a DX10 header so Blender can load them.
+    Cached by path and file signature, only the header and the copied levels are read."""
+    key = hashlib.blake2b(f"{lod_file_key(texture_path)}|{get_file_signature(texture_path)}".encode(),
+                          digest_size=16).hexdigest()
+    output = os.path.join(get_cache_dir("textures"), f"{key}_mip{level}.dds")
+    if os.path.exists(output):
+        return output
+
+    with open_source_file(texture_path) as f:
+        layout = parse_gpu_texture_header(read_gpu_texture_header(f))
+        if layout is None or level >= len(layout["levels"]):
+            raise ValueError(f"No mip level {level} in {os.path.basename(texture_path)}")
+        width, height = get_mip_size(layout, level)
+
+        with open(output + ".part", 'wb') as out:
+            out.write(build_dds_header(layout, level))
+            for offset, length in layout["levels"][level:]:
+                f.seek(offset)
+                data = f.read(length)
+                if len(data) < length:
+                    raise ValueError(f"Truncated mip level in {os.path.basename(texture_path)}")
+                out.write(data)
+    os.replace(output + ".part", output)
+    print(f"Extracted mip {level} of {os.path.basename(texture_path)}: {width}x{height}")
+    return output
+
+def get_mip_resolutions(info, min_size=1024):
+    """'WxH' of the stored mip levels below the full size, down to min_size"""
+    layout = {"width": info["width"], "height": info["height"]}
+    resolutions = []
+    for level in range(1, info.get("mips", 1)):
+        width, height = get_mip_size(layout, level)
+        if max(width, height) < min_size:
+            break
+        resolutions.append(f"{width}x{height}")
+    return resolutions
+
+def pick_texture_mip(textures, selected_resolutions):
+    """Largest selected resolution stored as a mip level of a DDS/KTX2 map.
+    textures are (path, 'WxH', info), returns (source_path, level, (width, height)) or None."""
+    best = None
+    for path, resolution, info in textures:
+        layout = {"width": info["width"], "height": info["height"]}
+        for level in range(1, info.get("mips", 1)):
+            width, height = get_mip_size(layout, level)
+            if f"{width}x{height}" in selected_resolutions and (best is None or width * height > best[2][0] * best[2][1]):
+                best = (path, level, (width, height))
+    return best
+
+def get_loadable_texture_path(texture_path):
+    """File Blender can load for a texture: KTX2 is repackaged as DDS"""
+    if texture_path.lower().endswith('.ktx2'):
+        return get_mip_texture(texture_path, 0)
+    return local_source_path(texture_path)
+
+def get_texture_info(texture_path):
+    """Header info and content hash of a texture, cached in the scan index by file signature"""
+    index = get_scan_index().setdefault("textures", {})
+    key = lod_file_key(texture_path)
+    entry = probe_texture_entry(texture_path, index)
+    if entry:
+        index[key] = entry
+        return entry
+
+    # Unknown header, let Blender decode it
+    img = bpy.data.images.load(local_source_path(texture_path), check_existing=False)
+    info = {"width": img.size[0], "height": img.size[1], "channels": img.channels, "bit_depth": img.depth // max(img.channels, 1)}
+    bpy.data.images.remove(img)
+
+    entry = dict(info, sig=get_file_signature(texture_path), hash=sampled_content_hash(texture_path))
+    index[key] = entry
+    return entry
+
+def probe_texture_entry(texture_path, index):
+    """Scan index entry of a texture from the index or its header, None if the header is unknown.
+    No bpy access, safe to call from the background scan."""
+    signature = get_file_signature(texture_path)
+    entry = index.get(lod_file_key(texture_path))
+    if entry and entry.get("sig") == signature:
+        return entry
+
+    try:
+        info = probe_image_header(texture_path)
+    except (OSError, struct.error) as e:
+        print(f"Failed to read header of {texture_path}: {str(e)}")
+        return None
+    if not info:
+        return None
+    return dict(info, sig=signature, hash=sampled_content_hash(texture_path))
+
+# Content hash -> image name
+_texture_images = {}
+
+def load_texture_image(texture_path):
+    """Image datablock of a texture, shared between byte-identical files.
+
+    Images are matched by content hash instead of basename, so different
+    files with the same name stay separate.
+    """
+    content_hash = get_texture_info(texture_path)["hash"]
+    img = bpy.data.images.get(_texture_images.get(content_hash, ""))
+    if img and img.get("assetporter_hash") == content_hash:
+        return img
+
+    # Images can also come from a saved file
+    for img in bpy.data.images:
+        if img.get("assetporter_hash") == content_hash:
+            _texture_images[content_hash] = img.name
+            return img
+
+    img = bpy.data.images.load(get_loadable_texture_path(texture_path), check_existing=False)
+    tiles = get_texture_tiles(texture_path)
+    if tiles:
+        # One tiled image for the whole set, the tiles sit next to the first one
+        img.source = 'TILED'
+        if "<UDIM>" not in img.filepath and "<UVTILE>" not in img.filepath:
+            folder, file = os.path.split(img.filepath)
+            img.filepath = os.path.join(folder, group_texture_tiles([file for _, file in tiles])[0][1])
+        for number, _ in tiles:
+            if not img.tiles.get(number):
+                img.tiles.new(tile_number=number)
+    img["assetporter_hash"] = content_hash
+    _texture_images[content_hash] = img.name
+    return img
+
+def get_texture_output_ext(*texture_paths):
+    """File type of a map derived from the textures: EXR if any of them has more than 8 bits,
+    PNG would cut those to 8 bit"""
+    return ".exr" if any(get_texture_info(path).get("bit_depth", 8) > 8 for path in texture_paths) else ".png"
+
+def get_texture_variant_path(texture_path, width, height):
+    """Content-addressed cache path of a downscaled texture"""
+    ext = get_texture_output_ext(texture_path)
+    return os.path.join(get_cache_dir("textures"), f"{file_content_hash(texture_path)}_{width}x{height}{ext}")
+
+def pick_texture_variant(textures, selected_resolutions):
+    """Largest selected resolution that can be derived from a larger map with the same aspect.
+    Returns (source_path, (width, height)) or None."""
+    targets = [tuple(map(int, res.split('x'))) for res in selected_resolutions]
+    best = None
+    for path, resolution in textures:
+        width, height = map(int, resolution.split('x'))
+        for target_width, target_height in targets:
+            if target_width >= width or target_height >= height:
+                continue
+            if abs(target_width / target_height - width / height) > 0.01:
+                continue
+            # Prefer the largest target, then the smallest source
+            score = (target_width * target_height, -(width * height))
+            if best is None or score > best[0]:
+                best = (score, path, (target_width, target_height))
+    return (best[1], best[2]) if best else None
+
+def group_asset_textures(props, texture_paths):
+    """Scanned textures per asset and type: {texture base: {type: [(path, 'WxH', info)]}}.
+    Only uses the scan index, safe to call while drawing."""
+    resolution_by_path = get_texture_resolution_map(props)
+    index = get_scan_index().get("textures", {})
+    assets = {}
+    for path in texture_paths:
+        info = index.get(lod_file_key(path))
+        resolution = resolution_by_path.get(path)
+        if not info or not resolution:
+            continue
+        tex_name = os.path.basename(path).lower()
+        maps = assets.setdefault(get_texture_base(tex_name), {}).setdefault(get_texture_type(tex_name), [])
+        maps.append((path, resolution, info))
+    return assets
+
+def texture_selection_cost(maps_by_type, selected_resolutions, derive=False):
+    """Decoded memory of the maps of one asset for the selected resolutions,
+    picked the same way as assign_materials_to_objects does"""
+    cost = 0
+    for maps in maps_by_type.values():
+        native = [info for _, resolution, info in maps if resolution in selected_resolutions]
+        if native:
+            cost += sum(estimate_texture_memory(info) for info in native)
+            continue
+        mip = pick_texture_mip(maps, selected_resolutions)
+        if mip:
+            source, _, (width, height) = mip
+            info = next(info for path, _, info in maps if path == source)
+            cost += estimate_texture_memory(dict(info, width=width, height=height))
+            continue
+        sources = [(path, resolution) for path, resolution, info in maps if not info.get("tiles")]
+        variant = pick_texture_variant(sources, selected_resolutions) if derive else None
+        if variant:
+            source, (width, height) = variant
+            info = next(info for path, _, info in maps if path == source)
+            cost += estimate_texture_memory(dict(info, width=width, height=height))
+    return cost
+
+def fit_texture_budget(assets, budget, derive=False):
+    """Highest resolution per asset that keeps the decoded textures within budget.
+    Returns ({texture base: 'WxH'}, total)"""
+    levels = {}
+    for base, maps_by_type in assets.items():
+        resolutions = {resolution for maps in maps_by_type.values() for _, resolution, _ in maps}
+        for maps in maps_by_type.values():
+            for _, _, info in maps:
+                resolutions.update(get_mip_resolutions(info))
+        if derive:
+            resolutions = set(add_derived_resolutions(dict.fromkeys(resolutions)))
+        ordered = sorted(resolutions, key=lambda x: tuple(map(int, x.split('x'))), reverse=True)
+        levels[base] = [(res_str, texture_selection_cost(maps_by_type, {res_str}, derive)) for res_str in ordered]
+
+    current, total = fit_levels_to_budget({base: [cost for _, cost in options] for base, options in levels.items()}, budget)
+    return {base: levels[base][level][0] for base, level in current.items()}, total
+
+# Texture memory of the panel selection, recomputed when the selection changes
+_texture_memory_cache = {"key": None, "total": 0}
+
+def get_selected_texture_memory(props):
+    """Decoded memory of the selected texture types and resolutions, or of the budget picks in auto mode"""
+    key = (len(props.textures), hash(props.texture_resolution_cache),
+           tuple(sorted(lod.name for lod in props.active_common_lods)),
+           tuple(sorted(res.name for res in props.active_texture_resolutions)),
+           props.auto_texture_resolution, props.texture_budget_gb, props.derive_texture_resolutions,
+           len(get_scan_index().get("textures", {})))
+    if _texture_memory_cache["key"] == key:
+        return _texture_memory_cache["total"]
+
+    assets = group_asset_textures(props, get_selected_texture_paths(props))
+    if props.auto_texture_resolution:
+        _, total = fit_texture_budget(assets, props.texture_budget_gb * 1024 ** 3, props.derive_texture_resolutions)
+    else:
+        selected_resolutions = {res.name for res in props.active_texture_resolutions}
+        total = sum(texture_selection_cost(maps_by_type, selected_resolutions, props.derive_texture_resolutions)
+                    for maps_by_type in assets.values())
+    _texture_memory_cache.update(key=key, total=total)
+    return total
+
+def format_memory(size):
+    if size >= 1024 ** 3:
+        return f"{size / 1024 ** 3:.1f} GB"
+    return f"{size / 1024 ** 2:.0f} MB"
+
+def read_image_pixels(texture_path, size=None):
+    """Pixels of a texture as float32 array (height, width, channels), optionally scaled to size"""
+    img = bpy.data.images.load(get_loadable_texture_path(texture_path), check_existing=False)
+    try:
+        img.colorspace_settings.name = 'Non-Color'
+        if size and tuple(img.size) != tuple(size):
+            img.scale(*size)
+        width, height = img.size
+        pixels = np.empty(width * height * img.channels, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+        return pixels.reshape(height, width, img.channels)
+    finally:
+        bpy.data.images.remove(img)
+
+def write_image_pixels(pixels, output_path):
+    """Save an RGBA float array as PNG, or as float EXR for .exr outputs"""
+    height, width = pixels.shape[:2]
+    base, ext = os.path.splitext(output_path)
+    img = bpy.data.images.new(os.path.basename(output_path), width, height, alpha=True,
+                              float_buffer=ext == '.exr')
+    try:
+        img.colorspace_settings.name = 'Non-Color'
+        img.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).ravel())
+
+        # Write next to the target first so readers never see a half written file
+        temp_path = base + ".tmp" + ext
+        img.filepath_raw = temp_path
+        img.file_format = 'OPEN_EXR' if ext == '.exr' else 'PNG'
+        img.save()
+        os.replace(temp_path, output_path)
+    finally:
+        bpy.data.images.remove(img)
+
+def to_rgba(pixels):
+    """Expand grayscale/RGB pixel arrays to RGBA"""
+    channels = pixels.shape[2]
+    if channels == 4:
+        return pixels
+    rgba = np.ones(pixels.shape[:2] + (4,), dtype=np.float32)
+    rgba[..., :3] = pixels[..., :3] if channels >= 3 else pixels[..., :1]
+    return rgba
+
+def invert_texture(pixels):
+    """Gloss -> roughness"""
+    pixels[..., :3] = 1.0 - pixels[..., :3]
+    return pixels
+
+def flip_green_texture(pixels):
+    """DirectX -> OpenGL normal map"""
+    pixels[..., 1] = 1.0 - pixels[..., 1]
+    return pixels
+
+def specular_level_texture(pixels):
+    """Specular color (F0, sRGB) -> Principled 'Specular IOR Level', where 0.5 equals F0 0.04"""
+    rgb = pixels[..., :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    level = np.clip(linear @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32) / 0.08, 0.0, 1.0)
+    pixels[..., :3] = level[..., None]
+    return pixels
+
+TEXTURE_FIXUPS = {
+    'invert': invert_texture,
+    'flip_green': flip_green_texture,
+    'specular_level': specular_level_texture,
+}
+
+def get_fixed_texture(texture_path, fixup):
+    """Cached copy of a texture with a fixup from TEXTURE_FIXUPS applied"""
+    ext = get_texture_output_ext(texture_path)
+    output = os.path.join(get_cache_dir("textures"), f"{file_content_hash(texture_path)}_{fixup}{ext}")
+    if not os.path.exists(output):
+        pixels = to_rgba(read_image_pixels(texture_path))
+        write_image_pixels(TEXTURE_FIXUPS[fixup](pixels), output)
+        print(f"Converted {os.path.basename(texture_path)} ({fixup}): {output}")
+    return output
+
+def is_directx_normal(texture_path, convention):
+    if convention == 'AUTO':
+        name = os.path.basename(texture_path).lower()
+        return '_dx' in name or 'directx' in name
+    return convention == 'DIRECTX'
+
+def apply_texture_fixups(processed_textures, normal_convention='AUTO'):
+    """Convert maps in place so every detected type can be wired directly"""
+    # Fixups write single images, tile sets are used as they are
+    tiled = {type_name for type_name, path in processed_textures.items() if get_texture_tiles(path)}
+    if 'gloss' in processed_textures:
+        gloss = processed_textures.pop('gloss')
+        if 'roughness' not in processed_textures and 'gloss' not in tiled:
+            processed_textures['roughness'] = get_fixed_texture(gloss, 'invert')
+    if ('normal' in processed_textures and 'normal' not in tiled and
+            is_directx_normal(processed_textures['normal'], normal_convention)):
+        processed_textures['normal'] = get_fixed_texture(processed_textures['normal'], 'flip_green')
+    if 'specular' in processed_textures and 'specular' not in tiled:
+        processed_textures['specular'] = get_fixed_texture(processed_textures['specular'], 'specular_level')
+
+# Packed channels and the value used when a map is missing
+ORM_CHANNELS = (
+    ('ambient_occlusion', 1.0),
+    ('roughness', 0.5),
+    ('metallic', 0.0),
+    ('opacity', 1.0),
+)
+
+def get_packed_orm_texture(processed_textures):
+    """Channel-pack AO/roughness/metallic (opacity in alpha) into one cached image"""
+    key = hashlib.blake2b(digest_size=16)
+    for type_name, default in ORM_CHANNELS:
+        path = processed_textures.get(type_name)
+        key.update(f"{type_name}={file_content_hash(path) if path else default};".encode())
+    # 16 bit or float maps keep their precision
+    ext = get_texture_output_ext(*[path for path in processed_textures.values() if path])
+    output = os.path.join(get_cache_dir("textures"), f"{key.hexdigest()}_orm{ext}")
+    if os.path.exists(output):
+        return output
+
+    packed = None
+    for index, (type_name, default) in enumerate(ORM_CHANNELS):
+        path = processed_textures.get(type_name)
+        # All channels take the size of the first map found
+        channel = read_image_pixels(path, packed.shape[1::-1] if packed is not None else None)[..., 0] if path else None
+        if packed is None:
+            if channel is None:
+                continue
+            packed = np.empty(channel.shape + (4,), dtype=np.float32)
+            packed[..., :index] = [value for _, value in ORM_CHANNELS[:index]]
+        packed[..., index] = default if channel is None else channel
+
+    write_image_pixels(packed, output)
+    print(f"Packed ORM texture: {output}")
+    return output
+
+def get_enabled_socket(sockets, name):
+    """Socket by name among the ones the node's data type enables,
+    the Mix node has a Factor/A/B/Result per data type"""
+    return next(socket for socket in sockets if socket.name == name and socket.enabled)
+
+def create_material_from_textures(obj_name, texture_paths, resolution=None):
     # Check if any textures are selected first
     props = bpy.context.scene.batch_import_props
     if not any(lod.name for lod in props.active_common_lods):
@@ -1371,14 +3047,12 @@ def create_material_from_textures(obj_name, texture_paths):
         return None
 
     # Get resolution only from first texture to avoid loading all images
-    first_texture = texture_paths[0]
-    img = bpy.data.images.load(first_texture)
-    resolution = f"{img.size[0]}x{img.size[1]}"
-    bpy.data.images.remove(img)
+    if resolution is None:
+        resolution = read_texture_resolution(texture_paths[0])
 
     # Create material name
     base_name = re.sub(r'\.\d+$', '', obj_name.split('_')[0])
-    material_name = f"{base_name}_{resolution}_Material"
+    material_name = f"{base_name}_{resolution}_{'ORM_' if props.pack_orm else ''}Material"
 
     # Check for existing material first
     existing_material = bpy.data.materials.get(material_name)
@@ -1403,6 +3077,24 @@ def create_material_from_textures(obj_name, texture_paths):
         print("No matching textures found for selected types")
         return None
 
+    try:
+        apply_texture_fixups(processed_textures, props.normal_convention)
+    except Exception as e:
+        print(f"Error converting textures for {obj_name}: {str(e)}")
+
+    # Merge the grayscale maps into one image, worth it from two maps on
+    packed_types = [type_name for type_name, _ in ORM_CHANNELS
+                    if type_name in processed_textures and not get_texture_tiles(processed_textures[type_name])]
+    if props.pack_orm and len(packed_types) >= 2:
+        try:
+            orm_path = get_packed_orm_texture({type_name: processed_textures[type_name] for type_name in packed_types})
+            for type_name in packed_types:
+                del processed_textures[type_name]
+            processed_textures['orm'] = orm_path
+        except Exception as e:
+            print(f"Error packing ORM texture for {obj_name}: {str(e)}")
+            packed_types = []
+
     # Create material with minimal node setup
     material = bpy.data.materials.new(name=material_name)
     material.use_nodes = True
@@ -1443,12 +3135,13 @@ def create_material_from_textures(obj_name, texture_paths):
     # Process only selected texture types
     spacing = 280
     current_pos = len(processed_textures) * spacing / 2
+    diffuse_color = None
+    multiply_colors = []  # AO/cavity darken the base color
 
     for texture_type, texture_path in processed_textures.items():
         try:
-            # Load image only if not already loaded
-            img_name = os.path.basename(texture_path)
-            img = bpy.data.images.get(img_name) or bpy.data.images.load(texture_path)
+            # Load image only if no identical file is loaded already
+            img = load_texture_image(texture_path)
             img.use_fake_user = True
 
             # Create and set up texture node
@@ -1458,9 +3151,14 @@ def create_material_from_textures(obj_name, texture_paths):
             tex_image.parent = texture_frame
             links.new(mapping.outputs['Vector'], tex_image.inputs['Vector'])
 
+            # Everything but color maps holds data
+            if texture_type != 'diffuse':
+                img.colorspace_settings.name = 'Non-Color'
+
             # Connect to appropriate input based on type
             if texture_type == 'diffuse':
-                links.new(tex_image.outputs['Color'], principled.inputs['Base Color'])
+                diffuse_color = tex_image.outputs['Color']
+                links.new(diffuse_color, principled.inputs['Base Color'])
             elif texture_type == 'roughness':
                 links.new(tex_image.outputs['Color'], principled.inputs['Roughness'])
             elif texture_type == 'metallic':
@@ -1468,6 +3166,37 @@ def create_material_from_textures(obj_name, texture_paths):
             elif texture_type == 'opacity':
                 links.new(tex_image.outputs['Color'], principled.inputs['Alpha'])
                 material.blend_method = 'BLEND'
+            elif texture_type == 'orm':
+                img.colorspace_settings.name = 'Non-Color'
+                img.alpha_mode = 'CHANNEL_PACKED'
+                separate = nodes.new('ShaderNodeSeparateColor')
+                separate.location = (-270, current_pos)
+                links.new(tex_image.outputs['Color'], separate.inputs['Color'])
+                if 'roughness' in packed_types:
+                    links.new(separate.outputs['Green'], principled.inputs['Roughness'])
+                if 'metallic' in packed_types:
+                    links.new(separate.outputs['Blue'], principled.inputs['Metallic'])
+                if 'opacity' in packed_types:
+                    links.new(tex_image.outputs['Alpha'], principled.inputs['Alpha'])
+                    material.blend_method = 'BLEND'
+                if 'ambient_occlusion' in packed_types:
+                    multiply_colors.append(separate.outputs['Red'])
+            elif texture_type in ('ambient_occlusion', 'cavity'):
+                multiply_colors.append(tex_image.outputs['Color'])
+            elif texture_type == 'specular':
+                links.new(tex_image.outputs['Color'], principled.inputs['Specular IOR Level'])
+            elif texture_type == 'fuzz':
+                links.new(tex_image.outputs['Color'], principled.inputs['Sheen Weight'])
+            elif texture_type == 'translucent':
+                links.new(tex_image.outputs['Color'], principled.inputs['Subsurface Weight'])
+            elif texture_type == 'height':
+                displacement = nodes.new('ShaderNodeDisplacement')
+                displacement.location = (100, -700)
+                displacement.inputs['Scale'].default_value = 0.02
+                links.new(tex_image.outputs['Color'], displacement.inputs['Height'])
+                links.new(displacement.outputs['Displacement'], output.inputs['Displacement'])
+                # Without it Eevee and Cycles only bump
+                material.displacement_method = 'BOTH'
             elif texture_type == 'normal':
                 normal_map = nodes.new('ShaderNodeNormalMap')
                 normal_map.location = (-270, current_pos)
@@ -1484,10 +3213,31 @@ def create_material_from_textures(obj_name, texture_paths):
             print(f"Error processing texture {texture_path}: {str(e)}")
             continue
 
+    # Chain AO/cavity onto the base color
+    if diffuse_color and multiply_colors:
+        color = diffuse_color
+        for i, factor_color in enumerate(multiply_colors):
+            multiply = nodes.new('ShaderNodeMix')
+            multiply.data_type = 'RGBA'
+            multiply.blend_type = 'MULTIPLY'
+            multiply.location = (-270, 400 + i * 200)
+            get_enabled_socket(multiply.inputs, 'Factor').default_value = 1.0
+            links.new(color, get_enabled_socket(multiply.inputs, 'A'))
+            links.new(factor_color, get_enabled_socket(multiply.inputs, 'B'))
+            color = get_enabled_socket(multiply.outputs, 'Result')
+        links.new(color, principled.inputs['Base Color'])
+
     return material
 
-def assign_materials_to_objects(imported_objects, selected_textures):
-    """Assign materials to objects with texture matching"""
+def fit_texture_size(width, height, max_size):
+    """Halve a resolution until it fits into max_size"""
+    while max(width, height) > max_size:
+        width, height = width // 2, height // 2
+    return width, height
+
+def assign_materials_to_objects(imported_objects, selected_textures, max_texture_size=None, texture_resolutions=None):
+    """Assign materials to objects with texture matching. texture_resolutions maps texture base
+    names to the resolution picked by the texture budget and overrides the selected resolutions."""
     if not selected_textures:
         print("No textures selected for material assignment")
         return
@@ -1517,7 +3267,17 @@ def assign_materials_to_objects(imported_objects, selected_textures):
     
     # Store created materials
     materials = {}
-    
+
+    # Resolutions come from the texture scan, no image loads needed
+    resolution_by_path = get_texture_resolution_map(props)
+    selected_types = {lod.name for lod in props.active_common_lods}
+    selected_resolutions = {res.name for res in props.active_texture_resolutions}
+    print(f"Selected texture types: {selected_types}")
+    print(f"Selected resolutions: {selected_resolutions}")
+
+    object_textures = []
+    variant_jobs = {}
+
     for obj in imported_objects:
         print(f"\nProcessing object: {obj.name}")
         
@@ -1532,63 +3292,128 @@ def assign_materials_to_objects(imported_objects, selected_textures):
         
         print(f"Looking for textures matching: {obj_base}")
         
-        # Get selected texture types
-        selected_types = {lod.name for lod in props.active_common_lods}
-        selected_resolutions = {res.name for res in props.active_texture_resolutions}
-        
-        print(f"Selected texture types: {selected_types}")
-        print(f"Selected resolutions: {selected_resolutions}")
-        
+        candidates = {}  # texture type -> [(path, resolution)]
+        matched_bases = set()
         for tex_path in selected_textures:
             tex_name = os.path.basename(tex_path).lower()
             print(f"Checking texture: {tex_name}")
-            
-            # Get texture type - Modified texture type detection
-            tex_type = None
-            for type_name, keywords in texture_types.items():
-                if any(keyword in tex_name.lower() for keyword in keywords):
-                    tex_type = type_name
-                    # Map albedo to diffuse
-                    if type_name == 'diffuse' and 'albedo' in tex_name.lower():
-                        tex_type = 'diffuse'
-                    # Map ambientocclusion to ambient_occlusion
-                    elif 'ambientocclusion' in tex_name.lower():
-                        tex_type = 'ambient_occlusion'
-                    # Map translucency to translucent
-                    elif 'translucency' in tex_name.lower():
-                        tex_type = 'translucent'
-                    break
+            tex_type = get_texture_type(tex_name)
             
             # Check if texture type is selected
             if tex_type not in selected_types:
                 print(f"  Texture type {tex_type} not selected")
                 continue
 
-            # Check resolution
-            img = bpy.data.images.load(tex_path)
-            resolution = f"{img.size[0]}x{img.size[1]}"
-            bpy.data.images.remove(img)
-            
-            if resolution not in selected_resolutions:
-                print(f"  Resolution {resolution} not selected")
-                continue
-            
-            # Check name match with improved base name extraction
-            tex_base = os.path.splitext(tex_name)[0]
-            tex_base = re.sub(r'_(?:albedo|diffuse|normal|roughness|metallic|height|ambientocclusion|opacity|translucency|specular|cavity|fuzz|gloss).*$', '', tex_base)
-            tex_base = re.sub(r'_(?:8bit|16bit).*$', '', tex_base)
-            tex_base = re.sub(r'_\d+ppm$', '', tex_base)
-            tex_base = re.sub(r'_lod\d+.*$', '', tex_base)
-            
+            tex_base = get_texture_base(tex_name)
             if tex_base in obj_base or obj_base in tex_base:
-                matching_textures.append(tex_path)
-                print(f"  Added matching texture: {tex_name} ({tex_type})")
-        
-        print(f"Found {len(matching_textures)} matching textures")
+                resolution = resolution_by_path.get(tex_path) or read_texture_resolution(tex_path)
+                resolution_by_path[tex_path] = resolution
+                candidates.setdefault(tex_type, []).append((tex_path, resolution))
+                matched_bases.add(tex_base)
+
+        # Budget mode picks one resolution per asset instead of the selected ones
+        object_resolutions = selected_resolutions
+        if texture_resolutions is not None:
+            object_resolutions = {texture_resolutions[base] for base in matched_bases if base in texture_resolutions}
+
+        for tex_type, textures in candidates.items():
+            native = [path for path, resolution in textures if resolution in object_resolutions]
+            if native and max_texture_size:
+                # Proxy textures: downscaled copies of the selected maps
+                proxies = []
+                for path in native:
+                    width, height = map(int, resolution_by_path[path].split('x'))
+                    if max(width, height) <= max_texture_size or get_texture_tiles(path):
+                        proxies.append(path)
+                        continue
+                    width, height = fit_texture_size(width, height, max_texture_size)
+                    # Maps with stored mips have the proxy size already
+                    mip = pick_texture_mip([(path, None, get_texture_info(path))], {f"{width}x{height}"})
+                    if mip:
+                        output = get_mip_texture(path, mip[1])
+                        resolution_by_path[output] = f"{width}x{height}"
+                        proxies.append(output)
+                        continue
+                    output = get_texture_variant_path(path, width, height)
+                    if not os.path.exists(output) and output not in variant_jobs:
+                        variant_jobs[output] = {
+                            "type": 'DOWNSCALE',
+                            "source": get_mip_texture(path) if path.lower().endswith('.ktx2') else path,
+                            "output": output,
+                            "width": width,
+                            "height": height,
+                            "non_color": tex_type != 'diffuse'
+                        }
+                    resolution_by_path[output] = f"{width}x{height}"
+                    proxies.append(output)
+                native = proxies
+            if native:
+                matching_textures.extend(native)
+                print(f"  Added matching {tex_type} textures: {[os.path.basename(path) for path in native]}")
+                continue
+
+            # A stored mip level serves the resolution without resampling
+            mip = pick_texture_mip([(path, resolution, get_texture_info(path)) for path, resolution in textures],
+                                   object_resolutions)
+            if mip:
+                source, level, (width, height) = mip
+                try:
+                    output = get_mip_texture(source, level)
+                    resolution_by_path[output] = f"{width}x{height}"
+                    matching_textures.append(output)
+                    print(f"  Added {tex_type} mip level {level} of {os.path.basename(source)}")
+                    continue
+                except (OSError, ValueError) as e:
+                    print(f"  Failed to extract mip level {level} of {os.path.basename(source)}: {str(e)}")
+            if not props.derive_texture_resolutions:
+                print(f"  No {tex_type} texture in the selected resolutions")
+                continue
+
+            # Requested resolution missing on disk - derive it from a larger map
+            variant = pick_texture_variant([(path, resolution) for path, resolution in textures
+                                            if not get_texture_tiles(path)], object_resolutions)
+            if variant is None:
+                print(f"  No larger {tex_type} texture to derive the selected resolutions from")
+                continue
+            source, (width, height) = variant
+            output = get_texture_variant_path(source, width, height)
+            if not os.path.exists(output) and output not in variant_jobs:
+                variant_jobs[output] = {
+                    "type": 'DOWNSCALE',
+                    "source": get_mip_texture(source) if source.lower().endswith('.ktx2') else source,
+                    "output": output,
+                    "width": width,
+                    "height": height,
+                    "non_color": tex_type != 'diffuse'
+                }
+            resolution_by_path[output] = f"{width}x{height}"
+            matching_textures.append(output)
+            print(f"  Added derived {tex_type} texture: {os.path.basename(source)} -> {width}x{height}")
+
+        object_textures.append((obj, obj_base, matching_textures))
+
+    # Textures load from the local cache, copy them while the variants are created
+    prefetch_local_copies({path for _, _, matching_textures in object_textures for path in matching_textures
+                           if path not in variant_jobs})
+
+    # Create missing variants in parallel background processes before building materials
+    if variant_jobs:
+        print(f"Deriving {len(variant_jobs)} texture variants")
+        results = run_worker_jobs(list(variant_jobs.values()), props.worker_count)
+        for job, result in zip(list(variant_jobs.values()), results):
+            if not result.get("ok"):
+                print(f"Failed to derive {job['source']}: {result.get('error')}")
+                for obj, obj_base, matching_textures in object_textures:
+                    if job["output"] in matching_textures:
+                        matching_textures.remove(job["output"])
+
+    for obj, obj_base, matching_textures in object_textures:
+        print(f"Found {len(matching_textures)} matching textures for {obj.name}")
         
         if matching_textures:
             # Create or reuse material
-            material = create_material_from_textures(obj_base, matching_textures)
+            material = create_material_from_textures(obj_base, matching_textures,
+                                                     resolution_by_path.get(matching_textures[0]))
             
             # Assign material
             obj.data.materials.clear()  # Clear existing materials
@@ -1597,6 +3422,1133 @@ def assign_materials_to_objects(imported_objects, selected_textures):
     
     print("=== DEBUG: MATERIAL ASSIGNMENT END ===\n")
 
+# Library watch: polls directory mtimes and re-indexes only the folders that changed
+_watch_state = {"roots": (), "dirs": {}, "pending": set(), "removed": set()}
+
+def snapshot_library_dirs(root, start_dir=None):
+    """Map every directory below start_dir to (root, mtime_ns)"""
+    dirs = {}
+    for current, _, _ in os.walk(start_dir or root):
+        try:
+            dirs[current] = (root, os.stat(current).st_mtime_ns)
+        except OSError:
+            pass
+    return dirs
+
+def poll_library_changes(roots):
+    """Stat every known directory once and queue the ones whose entries changed"""
+    state = _watch_state
+    if tuple(roots) != state["roots"]:
+        # First poll or different roots - take a fresh snapshot, nothing to queue yet
+        state["roots"] = tuple(roots)
+        state["dirs"] = {}
+        state["pending"].clear()
+        state["removed"].clear()
+        for root in roots:
+            state["dirs"].update(snapshot_library_dirs(root))
+        return
+
+    for directory, (root, mtime) in list(state["dirs"].items()):
+        try:
+            current_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            # Folder was deleted, forget it and drop its items
+            del state["dirs"][directory]
+            state["removed"].add(directory)
+            state["pending"].discard(directory)
+            continue
+        if current_mtime == mtime:
+            continue
+
+        state["dirs"][directory] = (root, current_mtime)
+        state["pending"].add(directory)
+
+        # New sub folders are picked up with everything inside them
+        try:
+            subdirs = [entry.path for entry in os.scandir(directory) if entry.is_dir()]
+        except OSError:
+            continue
+        for subdir in subdirs:
+            if subdir not in state["dirs"]:
+                new_dirs = snapshot_library_dirs(root, subdir)
+                state["dirs"].update(new_dirs)
+                state["pending"].update(new_dirs)
+
+def reindex_library_changes(props, max_dirs=20):
+    """Run queued folders through the scan pipeline, a limited number per call"""
+    state = _watch_state
+    if not state["pending"] and not state["removed"]:
+        return False
+
+    extensions = get_import_extensions(props.importer_backend)
+    entries = []
+    scope = {lod_file_key(directory) for directory in state["removed"]}
+    state["removed"].clear()
+
+    for directory in sorted(state["pending"])[:max_dirs]:
+        state["pending"].discard(directory)
+        root = state["dirs"].get(directory, (None, 0))[0]
+        if root is None:
+            continue
+        scope.add(lod_file_key(directory))
+        entries.extend(crawl_asset_files(root, extensions, start_dir=directory, recursive=False))
+
+    # Items of deleted folders live in sub folders of the removed ones as well
+    removed_prefixes = tuple(key + os.sep for key in scope)
+    for lod in props.lods:
+        directory = lod_file_key(os.path.dirname(get_lod_file_path(lod)))
+        if directory.startswith(removed_prefixes):
+            scope.add(directory)
+
+    added, removed, updated = sync_lod_entries(props, entries, extensions, scope=scope)
+    if added or removed or updated:
+        sync_generated_lods(props)
+        save_scan_index()
+        refresh_folder_panels()
+        print(f"Library watch: {added} added, {removed} removed, {updated} updated")
+    return True
+
+def library_watch_timer():
+    scene = getattr(bpy.context, "scene", None)
+    props = getattr(scene, "batch_import_props", None)
+    if props is None or not props.watch_library:
+        return None
+
+    # Only watch what has been scanned - a changed path needs a regular scan first.
+    # A running background scan holds item indices, wait for it
+    if props.has_scanned and props.folder_path == props.last_scanned_path and not is_background_scan_running():
+        try:
+            poll_library_changes(get_library_roots(props))
+            reindex_library_changes(props)
+        except Exception as e:
+            print(f"Library watch failed: {str(e)}")
+    return props.watch_interval
+
+def start_library_watch():
+    _watch_state["roots"] = ()
+    if not bpy.app.timers.is_registered(library_watch_timer):
+        bpy.app.timers.register(library_watch_timer, first_interval=1.0, persistent=True)
+
+def stop_library_watch():
+    if bpy.app.timers.is_registered(library_watch_timer):
+        bpy.app.timers.unregister(library_watch_timer)
+
+@persistent
+def library_watch_load_post(dummy):
+    """Resume watching after loading a file that has the watch enabled"""
+    props = getattr(bpy.context.scene, "batch_import_props", None)
+    if props and props.watch_library:
+        start_library_watch()
+    else:
+        stop_library_watch()
+
+def library_watch_register_timer():
+    """One-shot after register: the open file may have the watch enabled already.
+    The context is restricted while the add-on registers, so this runs from a timer."""
+    library_watch_load_post(None)
+    return None
+
+# Background scan: one thread per kind walks and probes the library, a timer merges
+# their results into props in batches on the main thread
+_scan_states = {
+    kind: {"thread": None, "kind": kind, "results": None, "cancel": None, "roots": [],
+           "existing": {}, "crawled": set(), "resolutions": {}, "duplicates": {}, "previous": None,
+           "count": 0}
+    for kind in ('ASSETS', 'TEXTURES')
+}
+
+def background_scan_worker(kind, roots, extensions, results, cancel, batch_size=200):
+    """Walk, probe and classify files - runs in a thread, no bpy access"""
+    index = get_scan_index()
+    files_index = index["files"]
+    textures_index = index.get("textures", {})
+    lod_pattern = re.compile(r'lod(\d+)')
+    batch = []
+    try:
+        for folder_path in roots:
+            if kind == 'ASSETS':
+                entries = ((entry[0], entry) for entry in iter_asset_files(folder_path, extensions))
+            else:
+                entries = ((os.path.join(root, file), (os.path.join(root, file), name, tiles))
+                           for root, files in walk_library(folder_path)
+                           for file, name, tiles in group_texture_tiles(
+                               [file for file in files if file.lower().endswith(extensions)]))
+
+            for file_path, entry in entries:
+                if cancel.is_set():
+                    return
+                if kind == 'ASSETS':
+                    signature = get_file_signature(file_path)
+                    objects = counts = None
+                    cached = files_index.get(lod_file_key(file_path))
+                    if not cached or cached.get("sig") != signature:
+                        cached = {}
+                    if "tris" not in cached:
+                        counts = try_probe_mesh_counts(file_path)
+                    is_base = not lod_pattern.search(os.path.splitext(entry[1])[0].lower())
+                    if is_base and "objects" not in cached:
+                        try:
+                            objects = list_source_meshes(file_path)
+                        except Exception as e:
+                            print(f"Inventory failed for {file_path}: {str(e)}")
+                    batch.append((entry, signature, objects, counts))
+                else:
+                    batch.append(entry + (probe_texture_entry(file_path, textures_index),))
+
+                if len(batch) >= batch_size:
+                    results.put(batch)
+                    batch = []
+        if batch:
+            results.put(batch)
+    finally:
+        results.put(None)  # Done
+
+def start_background_scan(kind, roots, extensions, previous=None):
+    """Start a scan of kind, restarting a running one of the same kind. The other kind keeps running."""
+    cancel_background_scan(kind)
+    state = _scan_states[kind]
+    props = bpy.context.scene.batch_import_props
+    if kind == 'ASSETS':
+        # Folder panels show the results as they come in
+        props.has_scanned = True
+        props.last_scanned_path = props.folder_path
+    state.update(
+        roots=roots, results=queue.Queue(), cancel=threading.Event(),
+        existing=get_existing_lod_indices(props) if kind == 'ASSETS' else {},
+        crawled=set(), resolutions={}, duplicates={}, previous=previous, count=0
+    )
+    get_scan_index()
+    state["thread"] = threading.Thread(
+        target=background_scan_worker,
+        args=(kind, roots, extensions, state["results"], state["cancel"]),
+        daemon=True
+    )
+    state["thread"].start()
+    if not bpy.app.timers.is_registered(background_scan_timer):
+        bpy.app.timers.register(background_scan_timer, first_interval=0.1)
+
+def background_scan_timer(max_batches=5):
+    """Merge finished batches into props - a few per tick so the UI stays responsive"""
+    props = getattr(getattr(bpy.context, "scene", None), "batch_import_props", None)
+    if props is None or not is_background_scan_running():
+        return None
+
+    changes = [merge_scan_batches(props, state, max_batches)
+               for state in _scan_states.values() if state["thread"] is not None]
+    # Idle ticks leave the panels alone, progress keeps the preview caches
+    if 'FINISHED' in changes:
+        refresh_folder_panels()
+    elif 'MERGED' in changes:
+        refresh_folder_panels(clear_previews=False)
+    return 0.1 if is_background_scan_running() else None
+
+def merge_scan_batches(props, state, max_batches):
+    """Merge up to max_batches results of one scan, finish it once its thread is done.
+    Returns 'FINISHED', 'MERGED' or None if nothing came in."""
+    finished = False
+    merged = False
+    for _ in range(max_batches):
+        try:
+            batch = state["results"].get_nowait()
+        except queue.Empty:
+            break
+        if batch is None:
+            finished = True
+            break
+        state["count"] += len(batch)
+        merged = True
+
+        if state["kind"] == 'ASSETS':
+            entries = [entry for entry, _, _, _ in batch]
+            probed = {lod_file_key(entry[0]): (signature, objects, counts) for entry, signature, objects, counts in batch}
+            state["crawled"].update(probed)
+            extensions = get_import_extensions(props.importer_backend)
+            merge_lod_entries(props, entries, extensions, state["existing"], probed=probed)
+        else:
+            add_texture_items(props, batch, state["resolutions"], state["duplicates"])
+
+    if not finished:
+        return 'MERGED' if merged else None
+
+    if not state["cancel"].is_set():
+        if state["kind"] == 'ASSETS':
+            removed = remove_missing_lod_entries(props, state["existing"], state["crawled"])
+            sync_generated_lods(props)
+            save_scan_index()
+            print(f"Background scan complete: {state['count']} files, {removed} removed")
+        else:
+            finish_texture_scan(props, state["resolutions"], state["duplicates"], state["previous"])
+    state["thread"] = None
+    return 'FINISHED'
+
+def is_background_scan_running(kind=None):
+    return any(state["thread"] is not None for state_kind, state in _scan_states.items()
+               if kind in (None, state_kind))
+
+def cancel_background_scan(kind=None):
+    """Stop the scan threads, or only the one of kind, already merged results stay"""
+    cancelled = False
+    for state_kind, state in _scan_states.items():
+        if state["thread"] is None or kind not in (None, state_kind):
+            continue
+        state["cancel"].set()
+        state["thread"].join(timeout=5.0)
+        state["thread"] = None
+        cancelled = True
+    if not cancelled:
+        return
+    if not is_background_scan_running() and bpy.app.timers.is_registered(background_scan_timer):
+        bpy.app.timers.unregister(background_scan_timer)
+    save_scan_index()
+
+@persistent
+def background_scan_load_pre(dummy):
+    # Results belong to the scene of the old file
+    cancel_background_scan()
+
+class OBJECT_OT_cancel_scan(Operator):
+    bl_idname = "import_assets.cancel_scan"
+    bl_label = "Cancel Scan"
+    bl_description = "Stop the background scan, files found so far stay in the list"
+
+    def execute(self, context):
+        cancel_background_scan()
+        refresh_folder_panels()
+        return {'FINISHED'}
+
+# LOD sets: assembled assets show one LOD level at a time, by camera distance or a global detail level
+_lod_roots = []
+
+def assemble_lod_set(parent_collection, base_name, levels):
+    """Move the imported LODs of one asset into a set collection with one child collection per level"""
+    set_collection = bpy.data.collections.new(f"{base_name}_LODs")
+    parent_collection.children.link(set_collection)
+
+    root = bpy.data.objects.new(f"{base_name}_LOD_Root", None)
+    root.empty_display_type = 'PLAIN_AXES'
+    set_collection.objects.link(root)
+
+    # BASE first, then LOD0, LOD1, ... from most to least detailed
+    for level in sorted(levels, key=lambda x: -1 if x == "base" else int(x)):
+        level_collection = bpy.data.collections.new(f"{base_name}_LOD{level}")
+        set_collection.children.link(level_collection)
+        for obj in levels[level]:
+            for coll in obj.users_collection:
+                coll.objects.unlink(obj)
+            level_collection.objects.link(obj)
+            obj.parent = root
+
+    root["assetporter_lod_set"] = set_collection
+    _lod_roots.append(root.name)
+    return root
+
+def apply_lod_switching(scene):
+    """Show only the active level of every LOD set"""
+    props = getattr(scene, "batch_import_props", None)
+    if props is None:
+        return
+    camera = scene.camera
+    step = max(props.lod_switch_distance, 0.001)
+
+    for root_name in list(_lod_roots):
+        root = bpy.data.objects.get(root_name)
+        set_collection = root.get("assetporter_lod_set") if root else None
+        if set_collection is None:
+            _lod_roots.remove(root_name)
+            continue
+
+        levels = list(set_collection.children)
+        if not levels:
+            continue
+        if props.lod_switch_mode == 'DISTANCE' and camera is not None:
+            distance = (camera.matrix_world.translation - root.matrix_world.translation).length
+            active = int(distance / step)
+        else:
+            active = props.lod_detail_level
+        active = min(active, len(levels) - 1)
+
+        for i, level_collection in enumerate(levels):
+            hide = i != active
+            # Only write on change, the write itself triggers another depsgraph update
+            if level_collection.hide_viewport != hide:
+                level_collection.hide_viewport = hide
+
+@persistent
+def lod_switch_depsgraph_post(scene, depsgraph):
+    props = getattr(scene, "batch_import_props", None)
+    if not _lod_roots or props is None or props.lod_switch_mode != 'DISTANCE':
+        return
+    if any(update.is_updated_transform for update in depsgraph.updates):
+        apply_lod_switching(scene)
+
+@persistent
+def lod_switch_frame_post(scene, depsgraph=None):
+    if _lod_roots:
+        apply_lod_switching(scene)
+
+@persistent
+def lod_switch_load_post(dummy):
+    """Collect the LOD sets of the loaded file"""
+    _lod_roots[:] = [obj.name for obj in bpy.data.objects if obj.get("assetporter_lod_set") is not None]
+
+# Background workers: headless Blender processes running worker.py, one job each
+_worker_state = {"queue": [], "running": [], "max_workers": 2}
+
+def start_worker_process(job):
+    """Write the job file and launch a headless Blender for it"""
+    # Workers read real files, archive members are extracted first
+    if "source" in job:
+        job = dict(job, source=local_source_path(job["source"]))
+    fd, job_path = tempfile.mkstemp(suffix=".json", dir=get_cache_dir("jobs"))
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(job, f)
+
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+    with open(os.path.splitext(job_path)[0] + ".log", 'w') as log:
+        process = subprocess.Popen(
+            [bpy.app.binary_path, "--background", "--factory-startup",
+             "--python", worker_script, "--", job_path],
+            stdout=log, stderr=subprocess.STDOUT
+        )
+    return process, job_path
+
+def read_worker_result(process, job_path):
+    """Collect the result of a finished worker and remove its job files"""
+    stem = os.path.splitext(job_path)[0]
+    try:
+        with open(stem + ".result.json", 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = {"ok": False, "error": f"Worker exited with code {process.returncode}, see {stem}.log"}
+        return result
+
+    for path in (job_path, stem + ".result.json", stem + ".log"):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return result
+
+def queue_worker_job(job, callback=None, max_workers=2):
+    """Run a job in the background pool, callback(job, result) is called on the main thread"""
+    _worker_state["queue"].append((job, callback))
+    _worker_state["max_workers"] = max(1, max_workers)
+    # Workers outlive file loads, their results only go to caches and the current scene
+    if not bpy.app.timers.is_registered(worker_pool_timer):
+        bpy.app.timers.register(worker_pool_timer, first_interval=0.1, persistent=True)
+
+def worker_pool_timer():
+    state = _worker_state
+
+    still_running = []
+    for process, job_path, job, callback in state["running"]:
+        if process.poll() is None:
+            still_running.append((process, job_path, job, callback))
+            continue
+        result = read_worker_result(process, job_path)
+        if not result.get("ok"):
+            print(f"Worker job {job['type']} failed: {result.get('error')}")
+        if callback:
+            try:
+                callback(job, result)
+            except Exception as e:
+                print(f"Worker callback failed: {str(e)}")
+    state["running"] = still_running
+
+    while state["queue"] and len(state["running"]) < state["max_workers"]:
+        job, callback = state["queue"].pop(0)
+        try:
+            process, job_path = start_worker_process(job)
+        except OSError as e:
+            print(f"Failed to start worker: {str(e)}")
+            continue
+        state["running"].append((process, job_path, job, callback))
+
+    if not state["running"] and not state["queue"]:
+        return None
+    return 0.25
+
+def run_worker_jobs(jobs, max_workers=2):
+    """Run jobs in parallel and wait for all of them, results are returned in job order"""
+    results = [None] * len(jobs)
+    pending = list(enumerate(jobs))
+    running = []
+
+    while pending or running:
+        while pending and len(running) < max(1, max_workers):
+            i, job = pending.pop(0)
+            try:
+                process, job_path = start_worker_process(job)
+            except OSError as e:
+                results[i] = {"ok": False, "error": str(e)}
+                continue
+            running.append((i, process, job_path))
+
+        for entry in list(running):
+            i, process, job_path = entry
+            if process.poll() is not None:
+                results[i] = read_worker_result(process, job_path)
+                running.remove(entry)
+        if running:
+            time.sleep(0.05)
+
+    return results
+
+def cancel_worker_jobs():
+    """Drop queued jobs and stop running workers"""
+    _worker_state["queue"].clear()
+    for process, job_path, job, callback in _worker_state["running"]:
+        process.kill()
+    _worker_state["running"].clear()
+
+# Linked instances: each source file is converted once into a cached .blend and linked from there
+LINKED_ROOT_COLLECTION = "Assetporter_Asset"
+
+def get_linked_blend_path(file_path):
+    return os.path.join(get_cache_dir("linked"), get_source_cache_key(file_path) + ".blend")
+
+def get_linked_keys_path(file_path):
+    """Child collection name -> source key of a converted source, written by the worker"""
+    return os.path.join(get_cache_dir("linked"), get_source_cache_key(file_path) + ".keys.json")
+
+def get_source_key(name, ref):
+    """Mesh of a source file as the scan and the worker both see it: the source ref where
+    the format has one, else the object name without Blender's .001 suffix"""
+    return ref or re.sub(r'\.\d{3}$', '', name)
+
+def convert_sources_to_blends(file_paths, max_workers=2):
+    """Convert sources without a cached .blend in parallel workers, returns {file_path: error}"""
+    jobs = []
+    for file_path in dict.fromkeys(file_paths):
+        blend_path = get_linked_blend_path(file_path)
+        if not os.path.exists(blend_path) or not os.path.exists(get_linked_keys_path(file_path)):
+            jobs.append({
+                "type": 'CONVERT',
+                "source": file_path,
+                "output": blend_path,
+                "keys_output": get_linked_keys_path(file_path),
+                "collection": LINKED_ROOT_COLLECTION
+            })
+
+    errors = {}
+    for job, result in zip(jobs, run_worker_jobs(jobs, max_workers)):
+        if not result.get("ok"):
+            errors[job["source"]] = result.get("error", "")
+        elif result.get("missing_materials"):
+            print(f"Converted {os.path.basename(job['source'])} without materials: {result['missing_materials']}")
+    return errors
+
+def link_asset_collections(file_path, source_keys=None):
+    """Link the root collection, or only the per-object collections matching source_keys
+    (see get_source_key), of a converted source. Linking the same collection again
+    returns the already linked one."""
+    if source_keys is None:
+        wanted = [LINKED_ROOT_COLLECTION]
+    else:
+        with open(get_linked_keys_path(file_path), 'r', encoding='utf-8') as f:
+            collection_keys = json.load(f)
+        wanted = [name for name, key in collection_keys.items() if key in set(source_keys)]
+        if not wanted:
+            return []
+    with bpy.data.libraries.load(get_linked_blend_path(file_path), link=True) as (data_from, data_to):
+        data_to.collections = [name for name in data_from.collections if name in wanted]
+    return [coll for coll in data_to.collections if coll is not None]
+
+# Generated LODs: missing levels decimated by the workers, cached next to the scan index
+def parse_lod_ratios(text):
+    ratios = []
+    for part in text.replace(';', ',').split(','):
+        try:
+            ratio = float(part)
+        except ValueError:
+            continue
+        if 0.0 < ratio < 1.0:
+            ratios.append(ratio)
+    return ratios
+
+def sync_generated_lods(props):
+    """Add cached generated LODs next to their source as if they were shipped files"""
+    lod_pattern = re.compile(r'lod(\d+)')
+    generated = get_scan_index().get("generated", {})
+
+    shipped = set()
+    sources = {}
+    for lod in props.lods:
+        if lod.generated:
+            continue
+        stem = os.path.splitext(lod.name)[0]
+        match = lod_pattern.search(stem.lower())
+        if match:
+            shipped.add((os.path.dirname(lod.object_name), stem[:match.start()].rstrip('_'), int(match.group(1))))
+        sources[lod_file_key(get_lod_file_path(lod))] = lod.file_signature
+
+    # Only levels whose source is unchanged and that the library doesn't ship itself
+    wanted = {}
+    for source_key, record in generated.items():
+        if source_key not in sources or sources[source_key] != record.get("sig"):
+            continue
+        for level, path in record.get("levels", {}).items():
+            if (record["object_dir"], record["base_name"], int(level)) in shipped or not os.path.exists(path):
+                continue
+            wanted[lod_file_key(path)] = (path, record)
+
+    existing = {lod_file_key(lod.source_path): i for i, lod in enumerate(props.lods) if lod.generated}
+    for key, index in sorted(existing.items(), key=lambda x: x[1], reverse=True):
+        if key not in wanted:
+            props.lods.remove(index)
+
+    for key, (path, record) in wanted.items():
+        if key in existing:
+            continue
+        lod_item = props.lods.add()
+        lod_item.name = os.path.basename(path)
+        lod_item.include = False
+        lod_item.object_name = os.path.join(record["object_dir"], os.path.splitext(lod_item.name)[0])
+        lod_item.source_path = path
+        lod_item.generated = True
+        lod_item.file_signature = get_file_signature(path)
+        counts = try_probe_mesh_counts(path) or {"tris": 0, "verts": 0}
+        lod_item.triangle_count = counts["tris"]
+        lod_item.vertex_count = counts["verts"]
+
+def lods_generated(job, result):
+    if not result.get("ok"):
+        return
+    generated = get_scan_index().setdefault("generated", {})
+    record = generated.get(job["source_key"])
+    if record is None or record.get("sig") != job["sig"]:
+        record = generated[job["source_key"]] = {
+            "sig": job["sig"],
+            "object_dir": job["object_dir"],
+            "base_name": job["base_name"],
+            "levels": {}
+        }
+    for level, ratio, output in job["levels"]:
+        if os.path.exists(output):
+            record["levels"][str(level)] = output
+    save_scan_index()
+
+    props = getattr(bpy.context.scene, "batch_import_props", None)
+    # Removing items would shift the indices a running asset scan holds,
+    # the scan syncs the generated levels itself when it finishes
+    if props and not is_background_scan_running('ASSETS'):
+        sync_generated_lods(props)
+        refresh_folder_panels()
+
+class OBJECT_OT_generate_lods(Operator):
+    bl_idname = "import_assets.generate_lods"
+    bl_label = "Generate Missing LODs"
+    bl_description = "Decimate BASE/LOD0 files into the missing LOD levels in background Blender processes"
+
+    def execute(self, context):
+        props = context.scene.batch_import_props
+        ratios = parse_lod_ratios(props.lod_ratios)
+        if not ratios:
+            self.report({'ERROR'}, "No valid LOD ratios!")
+            return {'CANCELLED'}
+
+        generated = get_scan_index().get("generated", {})
+        queued = 0
+        for folder in get_folder_model(props):
+            for base_name, entries in folder["groups"].items():
+                index, lod_part = entries[0]
+                source = props.lods[index]
+                if lod_part not in ("BASE", "LOD0") or source.generated:
+                    continue
+
+                source_path = get_lod_file_path(source)
+                source_key = lod_file_key(source_path)
+                signature = get_file_signature(source_path)
+                record = generated.get(source_key, {})
+                cached = record.get("levels", {}) if record.get("sig") == signature else {}
+                present = {part for _, part in entries}
+
+                output_dir = get_cache_dir("generated_lods", get_source_cache_key(source_path))
+                levels = []
+                for level, ratio in enumerate(ratios, start=1):
+                    if f"LOD{level}" in present or str(level) in cached:
+                        continue
+                    levels.append([level, ratio, os.path.join(output_dir, f"{base_name}_lod{level}.obj")])
+                if not levels:
+                    continue
+
+                queue_worker_job({
+                    "type": 'DECIMATE',
+                    "source": source_path,
+                    "source_key": source_key,
+                    "sig": signature,
+                    "object_dir": os.path.dirname(source.object_name),
+                    "base_name": base_name,
+                    "levels": levels
+                }, lods_generated, max_workers=props.worker_count)
+                queued += 1
+
+        self.report({'INFO'}, f"Generating LODs for {queued} assets in the background")
+        return {'FINISHED'}
+
+# Asset previews rendered by the workers and cached on disk by file signature
+_preview_collections = {}
+_preview_keys = {}
+_preview_pending = set()
+_preview_missing = set()
+
+def get_preview_collection():
+    if "main" not in _preview_collections:
+        _preview_collections["main"] = bpy.utils.previews.new()
+    return _preview_collections["main"]
+
+def get_preview_key(file_path):
+    """Cache key of a preview - changes whenever the file changes"""
+    if file_path not in _preview_keys:
+        _preview_keys[file_path] = get_source_cache_key(file_path)
+    return _preview_keys[file_path]
+
+def get_preview_path(key):
+    return os.path.join(get_cache_dir("previews"), key + ".png")
+
+def get_group_preview_icon(file_path):
+    """icon_value of the cached preview for a file, 0 if there is none yet"""
+    pcoll = get_preview_collection()
+    key = get_preview_key(file_path)
+    if key in pcoll:
+        return pcoll[key].icon_id
+    if key in _preview_missing:
+        return 0
+
+    preview_path = get_preview_path(key)
+    if os.path.exists(preview_path):
+        return pcoll.load(key, preview_path, 'IMAGE').icon_id
+    # Remember the miss so draws don't stat the cache again
+    _preview_missing.add(key)
+    return 0
+
+def preview_rendered(job, result):
+    _preview_pending.discard(job["key"])
+    _preview_missing.discard(job["key"])
+    if result.get("ok"):
+        refresh_folder_panels()
+
+class OBJECT_OT_generate_previews(Operator):
+    bl_idname = "import_assets.generate_previews"
+    bl_label = "Generate Previews"
+    bl_description = "Render missing previews of all asset groups in background Blender processes"
+
+    def execute(self, context):
+        props = context.scene.batch_import_props
+        queued = 0
+
+        for folder in get_folder_model(props):
+            for base_name, entries in folder["groups"].items():
+                # BASE file or the most detailed LOD represents the group
+                file_path = get_lod_file_path(props.lods[entries[0][0]])
+                key = get_preview_key(file_path)
+                if key in _preview_pending or key in get_preview_collection():
+                    continue
+                if os.path.exists(get_preview_path(key)):
+                    _preview_missing.discard(key)
+                    continue
+                _preview_pending.add(key)
+                queue_worker_job({
+                    "type": 'THUMBNAIL',
+                    "key": key,
+                    "source": file_path,
+                    "output": get_preview_path(key),
+                    "engine": props.preview_engine,
+                    "size": 128
+                }, preview_rendered, max_workers=props.worker_count)
+                queued += 1
+
+        self.report({'INFO'}, f"Rendering {queued} previews in the background")
+        return {'FINISHED'}
+
+# Local read-through cache: copies of library files on a local disk, validated by
+# size/mtime and evicted least recently used first once the size cap is reached
+_local_cache = {"dir": None, "max_bytes": 0, "index": None, "futures": {}, "pool": None}
+_local_cache_lock = threading.Lock()
+
+def configure_local_cache(props):
+    """Apply the cache settings, returns True if the cache is on"""
+    cache_dir = bpy.path.abspath(props.local_cache_dir) if props.local_cache_dir else None
+    with _local_cache_lock:
+        if cache_dir != _local_cache["dir"]:
+            _local_cache.update(dir=cache_dir, index=None, futures={})
+        _local_cache["max_bytes"] = int(props.local_cache_size_gb * 1024 ** 3)
+    return cache_dir is not None
+
+def get_local_cache_index():
+    if _local_cache["index"] is None:
+        try:
+            with open(os.path.join(_local_cache["dir"], "index.json"), 'r', encoding='utf-8') as f:
+                _local_cache["index"] = json.load(f)
+        except (OSError, ValueError):
+            _local_cache["index"] = {}
+    return _local_cache["index"]
+
+def save_local_cache_index():
+    if not _local_cache["dir"] or _local_cache["index"] is None:
+        return
+    index_path = os.path.join(_local_cache["dir"], "index.json")
+    with _local_cache_lock:
+        try:
+            with open(index_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(_local_cache["index"], f)
+            os.replace(index_path + ".tmp", index_path)
+        except OSError as e:
+            print(f"Failed to save local cache index: {str(e)}")
+
+def get_local_cache_key(file_path):
+    return hashlib.sha1(lod_file_key(file_path).encode('utf-8')).hexdigest()[:16]
+
+def get_sidecar_files(file_path):
+    """Relative paths of the files a .gltf references or of the other tiles of a tile set,
+    None if one lies outside its folder"""
+    if os.path.splitext(file_path)[1].lower() != '.gltf':
+        tiles = get_texture_tiles(file_path) or []
+        return [file for _, file in tiles if file != os.path.basename(file_path)]
+    gltf = read_gltf_json(file_path)
+    sidecars = []
+    for item in gltf.get("buffers", []) + gltf.get("images", []):
+        uri = item.get("uri")
+        if not uri or uri.startswith("data:"):
+            continue
+        relative = os.path.normpath(urllib.parse.unquote(uri))
+        if os.path.isabs(relative) or relative.startswith(".."):
+            return None
+        sidecars.append(relative)
+    return sidecars
+
+def evict_local_cache(keep):
+    """Drop least recently used copies until the cache fits its size cap - call with the lock held"""
+    index = get_local_cache_index()
+    total = sum(entry["size"] for entry in index.values())
+    pinned = {get_local_cache_key(path) for path in _local_cache["futures"]} | {keep}
+    for key in sorted(index, key=lambda k: index[k]["atime"]):
+        if total <= _local_cache["max_bytes"]:
+            break
+        if key in pinned:
+            continue
+        shutil.rmtree(os.path.join(_local_cache["dir"], key), ignore_errors=True)
+        total -= index.pop(key)["size"]
+
+def copy_to_local_cache(file_path):
+    """Local copy of a file, copied on first access and again when its size or mtime change.
+    Runs in the prefetch threads, so no bpy calls in here."""
+    key = get_local_cache_key(file_path)
+    signature = get_file_signature(file_path)
+    local_dir = os.path.join(_local_cache["dir"], key)
+    local_path = os.path.join(local_dir, os.path.basename(file_path))
+    with _local_cache_lock:
+        entry = get_local_cache_index().get(key)
+        if entry and entry["sig"] == signature and os.path.exists(local_path):
+            entry["atime"] = time.time()
+            return local_path
+
+    sidecars = get_sidecar_files(file_path)
+    if sidecars is None:
+        return file_path
+
+    size = 0
+    source_dir = os.path.dirname(file_path)
+    for relative in [os.path.basename(file_path)] + sidecars:
+        target = os.path.join(local_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(source_dir, relative), target + ".part")
+        os.replace(target + ".part", target)
+        size += os.path.getsize(target)
+
+    with _local_cache_lock:
+        get_local_cache_index()[key] = {"source": file_path, "sig": signature, "size": size, "atime": time.time()}
+        evict_local_cache(keep=key)
+    return local_path
+
+def prefetch_local_copies(file_paths, max_workers=4):
+    """Copy files in background threads while earlier ones are imported"""
+    if not _local_cache["dir"]:
+        return
+    if _local_cache["pool"] is None:
+        _local_cache["pool"] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assetporter_prefetch")
+    with _local_cache_lock:
+        for file_path in file_paths:
+            # Archive members are extracted on the main thread when they are read
+            if file_path not in _local_cache["futures"] and not split_archive_path(file_path)[0]:
+                _local_cache["futures"][file_path] = _local_cache["pool"].submit(copy_to_local_cache, file_path)
+
+def local_source_path(file_path):
+    """Path to read a library file from: the extracted file for archive members,
+    its local copy if the cache is on"""
+    archive_path, member = split_archive_path(file_path)
+    if archive_path:
+        return extract_archive_member(archive_path, member)
+    if not _local_cache["dir"]:
+        return file_path
+    with _local_cache_lock:
+        future = _local_cache["futures"].pop(file_path, None)
+    try:
+        return future.result() if future else copy_to_local_cache(file_path)
+    except OSError as e:
+        print(f"Failed to cache {file_path} locally: {str(e)}")
+        return file_path
+
+def shutdown_local_cache():
+    save_local_cache_index()
+    if _local_cache["pool"] is not None:
+        _local_cache["pool"].shutdown(wait=False, cancel_futures=True)
+        _local_cache["pool"] = None
+    _local_cache["futures"] = {}
+
+# Import session: bulk imports without per-file depsgraph updates
+STAGING_COLLECTION = "Assetporter_Staging"
+
+@contextlib.contextmanager
+def import_session(context, staged=True):
+    """Import many files as one operation.
+
+    Undo is batched by the calling operator: its UNDO flag keeps the nested
+    importers from pushing steps. Staged sessions import into a collection
+    that is disabled in viewports, so the depsgraph skips the new objects
+    until reveal_staged_objects links them to their targets in one go.
+    """
+    view_layer = context.view_layer
+    active_collection = view_layer.active_layer_collection.collection
+    session = {"staging": None, "placed": []}
+
+    if staged:
+        staging = bpy.data.collections.new(STAGING_COLLECTION)
+        staging.hide_viewport = True
+        context.scene.collection.children.link(staging)
+        # Importers link new objects to the active collection
+        view_layer.active_layer_collection = view_layer.layer_collection.children[staging.name]
+        session["staging"] = staging
+
+    try:
+        yield session
+    finally:
+        reveal_staged_objects(session)
+        layer_collection = find_layer_collection(view_layer.layer_collection, active_collection)
+        if layer_collection:
+            view_layer.active_layer_collection = layer_collection
+
+def find_layer_collection(layer_collection, collection):
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = find_layer_collection(child, collection)
+        if found:
+            return found
+    return None
+
+def reveal_staged_objects(session):
+    """Move the staged objects to their target collections and drop the staging collection"""
+    staging = session["staging"]
+    if staging is None:
+        return
+    for obj, collection in session["placed"]:
+        collection.objects.link(obj)
+    session["placed"] = []
+    session["staging"] = None
+    bpy.data.collections.remove(staging)
+
+# Import journal: every completed file is appended to a jsonl file next to the .blend,
+# which is saved every few files. A run after a crash skips what the last save contains.
+def get_import_journal_path():
+    if not bpy.data.filepath:
+        return None
+    return os.path.splitext(bpy.data.filepath)[0] + ".import_journal.jsonl"
+
+def read_import_journal(journal_path):
+    """Completed files of an unfinished run whose objects are in the current file: key -> record"""
+    completed = {}
+    if not os.path.exists(journal_path):
+        return completed
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # Torn last line of a crash
+            if record.get("event") == "done":
+                completed[record["file"]] = record
+
+    # Files done after the last checkpoint never made it into the saved .blend
+    return {key: record for key, record in completed.items()
+            if all(name in bpy.data.objects for name in record["objects"])}
+
+def open_import_journal(interval):
+    """Journal state for a batch import, None for unsaved files that have nothing to resume from"""
+    journal_path = get_import_journal_path()
+    if journal_path is None:
+        return None
+    completed = read_import_journal(journal_path)
+    if completed:
+        # Checkpoints save the empty staging collection of the crashed session
+        stale = [coll for coll in bpy.data.collections
+                 if coll.name.startswith(STAGING_COLLECTION) and not coll.all_objects]
+        if stale:
+            bpy.data.batch_remove(stale)
+
+    journal = {"path": journal_path, "completed": completed, "count": 0, "interval": interval,
+               "pending": set(), "skipped_checkpoints": 0, "file": open(journal_path, 'a', encoding='utf-8')}
+    write_journal_record(journal, {"event": "start", "resumed": len(completed), "time": time.time()})
+    return journal
+
+def write_journal_record(journal, record):
+    journal["file"].write(json.dumps(record) + "\n")
+    journal["file"].flush()
+    os.fsync(journal["file"].fileno())
+
+def journal_completed_file(journal, session, record):
+    """Append a completed file and save a checkpoint every interval files"""
+    if journal is None:
+        return
+    write_journal_record(journal, dict(record, event="done"))
+    journal["pending"].discard(record["file"])
+    journal["count"] += 1
+    if journal["interval"] and journal["count"] % journal["interval"] == 0:
+        if not bpy.data.filepath:
+            # Nothing to save to, the journal alone can't bring the objects back
+            journal["skipped_checkpoints"] += 1
+            print(f"Checkpoint skipped after {journal['count']} files: the file has no path")
+            return
+        # Staged objects have to sit in their target collections when the file is saved
+        flush_staged_objects(session)
+        try:
+            bpy.ops.wm.save_mainfile()
+        except RuntimeError as e:
+            journal["skipped_checkpoints"] += 1
+            print(f"Checkpoint skipped after {journal['count']} files: {str(e)}")
+            return
+        write_journal_record(journal, {"event": "checkpoint", "files": journal["count"], "time": time.time()})
+        print(f"Checkpoint saved after {journal['count']} files")
+
+def close_import_journal(journal):
+    """Drop the journal once every queued file is done. Deferred or failed files keep it,
+    the next run resumes from it."""
+    if journal is None:
+        return
+    journal["file"].close()
+    if journal["pending"]:
+        print(f"Keeping import journal, {len(journal['pending'])} files not done")
+        return
+    os.remove(journal["path"])
+
+def flush_staged_objects(session):
+    """Link the staged objects to their targets now and keep staging the next ones"""
+    staging = session["staging"]
+    if staging is None:
+        return
+    for obj, collection in session["placed"]:
+        collection.objects.link(obj)
+        staging.objects.unlink(obj)
+    session["placed"] = []
+
+# Memory budget: estimate import costs up front and watch the process RSS while importing
+IMPORT_MEMORY_FACTORS = {'.obj': 3, '.fbx': 4, '.glb': 2, '.gltf': 2, '.ply': 2, '.stl': 2, '.usd': 4, '.usda': 3, '.usdc': 4}
+BYTES_PER_VERTEX = 200  # positions, loops, normals, UVs and undo copies
+PROXY_TEXTURE_SIZE = 1024
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+class MACH_TASK_BASIC_INFO(ctypes.Structure):
+    _pack_ = 4
+    _fields_ = [
+        ("virtual_size", ctypes.c_uint64),
+        ("resident_size", ctypes.c_uint64),
+        ("resident_size_max", ctypes.c_uint64),
+        ("user_time", ctypes.c_int32 * 2),
+        ("system_time", ctypes.c_int32 * 2),
+        ("policy", ctypes.c_int32),
+        ("suspend_count", ctypes.c_int32),
+    ]
+
+MACH_TASK_BASIC_INFO_FLAVOR = 20
+
+def get_process_rss():
+    """Resident memory of Blender in bytes, None if it can't be measured"""
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if sys.platform == "win32":
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            kernel32 = ctypes.windll.kernel32
+            psapi = ctypes.windll.psapi
+            kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+            psapi.GetProcessMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), ctypes.c_ulong]
+            if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except (AttributeError, OSError):
+            pass
+        return None
+
+    # macOS: current resident size from the Mach task info. getrusage only has the peak,
+    # which never drops after a purge - without task_info the budget check is skipped.
+    if sys.platform == "darwin":
+        try:
+            libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
+            task = ctypes.c_uint32.in_dll(libc, "mach_task_self_")
+            info = MACH_TASK_BASIC_INFO()
+            count = ctypes.c_uint32(ctypes.sizeof(info) // 4)
+            libc.task_info.argtypes = [ctypes.c_uint32, ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+            if libc.task_info(task, MACH_TASK_BASIC_INFO_FLAVOR, ctypes.byref(info), ctypes.byref(count)) == 0:
+                return info.resident_size
+        except (AttributeError, OSError, ValueError):
+            pass
+    return None
+
+def estimate_import_cost(file_path):
+    """Rough memory cost of importing a file, from the vertex count of the scan index or the file size"""
+    entry = get_scan_index()["files"].get(lod_file_key(file_path), {})
+    if entry.get("verts"):
+        return entry["verts"] * BYTES_PER_VERTEX
+    ext = os.path.splitext(file_path)[1].lower()
+    size = get_file_signature(file_path).split(":")[0]
+    return int(size or 0) * IMPORT_MEMORY_FACTORS.get(ext, 3)
+
+def estimate_texture_memory(info):
+    """Memory of a loaded image: Blender keeps 4 channels, high bit depths as floats.
+    Tile sets count every tile at the size of the first one."""
+    tiles = len(info.get("tiles") or [None])
+    return info["width"] * info["height"] * 4 * (4 if info.get("bit_depth", 8) > 8 else 1) * tiles
+
+def fits_memory_budget(budget, cost):
+    """Check the current RSS against the budget.
+    Nothing is purged here, orphan data of the open file may be the user's own."""
+    rss = get_process_rss()
+    if rss is None or rss + cost <= budget:
+        return True
+    print(f"Memory budget: {rss / 1024 ** 3:.2f} GB used, next file needs ~{cost / 1024 ** 3:.2f} GB")
+    return rss + cost <= budget
+
+def get_deferred_imports(props):
+    """Files left over by a run that hit the memory budget, as (lod, selected_objects)"""
+    by_key = {lod_file_key(get_lod_file_path(lod)): lod for lod in props.lods}
+    selected_files = []
+    for key, object_names in json.loads(props.deferred_imports or "[]"):
+        lod = by_key.get(key)
+        if lod is None:
+            continue
+        selected_objects = None
+        if object_names is not None:
+            selected_objects = [obj for obj in lod.base_objects if obj.name in object_names]
+        selected_files.append((lod, selected_objects))
+    return selected_files
+
 # Define base_classes at module level
 base_classes = [
     BaseObjectItem,
@@ -1607,13 +4559,18 @@ base_classes = [
     OBJECT_OT_batch_import,
     OBJECT_OT_toggle_common_lod,
     OBJECT_OT_select_all_lods,
+    OBJECT_OT_fit_triangle_budget,
     OBJECT_OT_toggle_expanded,
     OBJECT_OT_toggle_all_expanded,
     OBJECT_OT_toggle_item,
     OBJECT_OT_toggle_group,
     OBJECT_OT_toggle_texture_resolution,
     OBJECT_OT_toggle_texture_section,
-    VIEW3D_PT_batch_import_panel
+    OBJECT_OT_generate_previews,
+    OBJECT_OT_generate_lods,
+    OBJECT_OT_cancel_scan,
+    VIEW3D_PT_batch_import_panel,
+    VIEW3D_PT_folder_panels
 ]
 
 def register():
@@ -1625,59 +4582,19 @@ def register():
 
     bpy.types.Scene.batch_import_props = PointerProperty(type=BatchImportProperties)
 
-    # Register folder panels
-    register_folder_panels()
+    bpy.app.handlers.load_pre.append(background_scan_load_pre)
+    bpy.app.handlers.load_post.append(library_watch_load_post)
+    bpy.app.handlers.load_post.append(lod_switch_load_post)
+    bpy.app.handlers.depsgraph_update_post.append(lod_switch_depsgraph_post)
+    bpy.app.handlers.frame_change_post.append(lod_switch_frame_post)
+    bpy.app.timers.register(library_watch_register_timer, first_interval=0.1)
 
-def register_folder_panels():
-    """Register panels for each folder - called after scanning"""
-    
-    def get_props():
-        """Safely get props if they exist"""
-        if hasattr(bpy.types.Scene, "batch_import_props"):
-            if hasattr(bpy, "context") and hasattr(bpy.context, "scene"):
-                return getattr(bpy.context.scene, "batch_import_props", None)
-        return None
-    
-    # Store existing panel classes before removing them
-    existing_panels = []
-    for cls_name in dir(bpy.types):
-        if cls_name.startswith('VIEW3D_PT_FOLDER_'):
-            try:
-                panel_class = getattr(bpy.types, cls_name)
-                existing_panels.append(panel_class)
-            except Exception:
-                pass
-    
-    # Unregister existing panels
-    for panel_class in existing_panels:
-        try:
-            bpy.utils.unregister_class(panel_class)
-        except Exception:
-            pass
-    
-    # Create new panels
-    props = get_props()
-    if props and hasattr(props, "lods"):
-        folder_order = {}
-        
-        # Collect folders and their first occurrence for ordering
-        for lod in props.lods:
-            folder = os.path.basename(os.path.dirname(lod.object_name))
-            if folder and folder not in folder_order:
-                folder_order[folder] = os.path.dirname(lod.object_name)
-    
-        # Sort folders based on their full paths
-        sorted_folders = sorted(folder_order.keys(), 
-                            key=lambda x: folder_order[x])
-        
-        # Register panel for each folder in order
-        for i, folder in enumerate(sorted_folders, start=2):  # Changed this line
-            try:
-                panel_class = create_folder_panel(folder)
-                panel_class.bl_order = i
-                bpy.utils.register_class(panel_class)
-            except Exception as e:
-                print(f"Failed to register panel for {folder}: {str(e)}")
+def refresh_folder_panels(clear_previews=True):
+    """Rebuild the folder model after a scan and redraw - no classes are registered"""
+    invalidate_folder_model()
+    if clear_previews:
+        _preview_keys.clear()
+        _preview_missing.clear()
 
     # Safer UI refresh
     try:
@@ -1689,15 +4606,26 @@ def register_folder_panels():
         pass
 
 def unregister():
-    # First unregister the folder panels
-    for cls_name in dir(bpy.types):
-        if (cls_name.startswith('VIEW3D_PT_FOLDER_')):
-            try:
-                panel_class = getattr(bpy.types, cls_name)
-                bpy.utils.unregister_class(panel_class)
-            except Exception:
-                pass
-    
+    # Stop background polling and workers
+    if bpy.app.timers.is_registered(library_watch_register_timer):
+        bpy.app.timers.unregister(library_watch_register_timer)
+    stop_library_watch()
+    cancel_background_scan()
+    cancel_worker_jobs()
+    shutdown_local_cache()
+    for pcoll in _preview_collections.values():
+        bpy.utils.previews.remove(pcoll)
+    _preview_collections.clear()
+    for handlers, handler in (
+        (bpy.app.handlers.load_pre, background_scan_load_pre),
+        (bpy.app.handlers.load_post, library_watch_load_post),
+        (bpy.app.handlers.load_post, lod_switch_load_post),
+        (bpy.app.handlers.depsgraph_update_post, lod_switch_depsgraph_post),
+        (bpy.app.handlers.frame_change_post, lod_switch_frame_post),
+    ):
+        if handler in handlers:
+            handlers.remove(handler)
+
     # Remove property
     try:
         if hasattr(bpy.types.Scene, "batch_import_props"):
@@ -0,0 +1,358 @@
+# Mesh file parsers for the direct importers
+#
+# Plain NumPy, no bpy: every parser returns mesh dicts with name, positions (N, 3),
+# loop_vertices, loop_totals and optional loop_uvs (L, 2) / vertex_normals (N, 3) /
+# loop_normals (L, 3). build_mesh_object in the add-on turns them into meshes.
+
+import re
+import numpy as np
+
+GLTF_COMPONENT_TYPES = {5120: 'i1', 5121: 'u1', 5122: 'i2', 5123: 'u2', 5125: 'u4', 5126: 'f4'}
+GLTF_TYPE_SIZES = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+
+# glTF is Y-up, Blender is Z-up. OBJ too: wm.obj_import defaults to forward -Z, up Y
+GLTF_TO_BLENDER = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])
+
+def parse_obj(data, object_filter=None):
+    """Parse OBJ text into one mesh per o/g group, object_filter limits which groups are built"""
+    positions = []
+    uvs = []
+    normals = []
+    groups = []
+    current = None
+
+    # Objects start at 'o' lines, files without any fall back to 'g' groups
+    group_key = b'o ' if (data.startswith(b'o ') or b'\no ' in data) else b'g '
+
+    for line in data.splitlines():
+        if line.startswith(b'v '):
+            positions.append(line[2:])
+        elif line.startswith(b'vt '):
+            uvs.append(line[3:])
+        elif line.startswith(b'vn '):
+            normals.append(line[3:])
+        elif line.startswith(b'f '):
+            if current is None:
+                current = {"name": "", "faces": []}
+                groups.append(current)
+            # Negative indices count back from the elements read so far
+            current["faces"].append((line[2:], len(positions), len(uvs), len(normals)))
+        elif line.startswith(group_key):
+            name = line[2:].strip().decode('utf-8', 'replace')
+            if current is not None and not current["faces"]:
+                current["name"] = name
+            else:
+                current = {"name": name, "faces": []}
+                groups.append(current)
+
+    # Only the first three coordinates, vertex colors may follow
+    all_positions = np.array(b' '.join(b' '.join(v.split()[:3]) for v in positions).split(), dtype=np.float32).reshape(-1, 3)
+    all_positions = all_positions @ GLTF_TO_BLENDER.T
+    all_uvs = None
+    if uvs:
+        all_uvs = np.array(b' '.join(b' '.join(vt.split()[:2]) for vt in uvs).split(), dtype=np.float32).reshape(-1, 2)
+    all_normals = None
+    if normals:
+        all_normals = np.array(b' '.join(normals).split(), dtype=np.float32).reshape(-1, 3) @ GLTF_TO_BLENDER.T
+
+    meshes = []
+    for group in groups:
+        if not group["faces"] or (object_filter is not None and group["name"] not in object_filter):
+            continue
+
+        # Per corner: vertex, uv and normal reference plus the element counts at its face line
+        refs = []
+        counts = []
+        loop_totals = []
+        for face, *face_counts in group["faces"]:
+            corners = face.split()
+            loop_totals.append(len(corners))
+            for corner in corners:
+                parts = corner.split(b'/')
+                refs.append([int(part) if part else 0 for part in (parts + [b'', b''])[:3]])
+                counts.append(face_counts)
+
+        # OBJ indices are 1-based, 0 marks a missing reference
+        refs = np.array(refs, dtype=np.int64).reshape(-1, 3)
+        refs = np.where(refs < 0, refs + np.array(counts, dtype=np.int64).reshape(-1, 3), refs - 1)
+        vertex_refs, uv_refs, normal_refs = refs.T
+        used, loop_vertices = np.unique(vertex_refs, return_inverse=True)
+
+        mesh_data = {
+            "name": group["name"] or "Mesh",
+            "positions": all_positions[used],
+            "loop_vertices": loop_vertices,
+            "loop_totals": np.array(loop_totals, dtype=np.int32)
+        }
+        if all_uvs is not None and np.all(uv_refs >= 0):
+            mesh_data["loop_uvs"] = all_uvs[uv_refs]
+        if all_normals is not None and np.all(normal_refs >= 0):
+            mesh_data["loop_normals"] = all_normals[normal_refs]
+        meshes.append(mesh_data)
+
+    return meshes
+
+PLY_TYPES = {
+    b'char': 'i1', b'int8': 'i1', b'uchar': 'u1', b'uint8': 'u1',
+    b'short': 'i2', b'int16': 'i2', b'ushort': 'u2', b'uint16': 'u2',
+    b'int': 'i4', b'int32': 'i4', b'uint': 'u4', b'uint32': 'u4',
+    b'float': 'f4', b'float32': 'f4', b'double': 'f8', b'float64': 'f8'
+}
+
+def parse_ply_header(data):
+    """Return (format, elements, body_offset) of a PLY file"""
+    end = data.find(b'end_header')
+    if not data.startswith(b'ply') or end < 0:
+        raise ValueError("Not a PLY file")
+    body_offset = data.index(b'\n', end) + 1
+
+    ply_format = None
+    elements = []
+    for line in data[:end].splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == b'format':
+            ply_format = parts[1].decode()
+        elif parts[0] == b'element':
+            elements.append({"name": parts[1].decode(), "count": int(parts[2]), "properties": []})
+        elif parts[0] == b'property' and elements:
+            if parts[1] == b'list':
+                elements[-1]["properties"].append((parts[4].decode(), PLY_TYPES[parts[2]], PLY_TYPES[parts[3]]))
+            else:
+                elements[-1]["properties"].append((parts[2].decode(), PLY_TYPES[parts[1]], None))
+    return ply_format, elements, body_offset
+
+def parse_ply(data, name="Mesh"):
+    ply_format, elements, offset = parse_ply_header(data)
+    byte_order = {'binary_little_endian': '<', 'binary_big_endian': '>'}.get(ply_format)
+    tokens = data[offset:].split() if byte_order is None else None
+    token_pos = 0
+    vertices = None
+    loop_vertices = loop_totals = None
+
+    for element in elements:
+        count = element["count"]
+        has_lists = any(list_type for _, _, list_type in element["properties"])
+
+        if not has_lists:
+            if byte_order:
+                dtype = np.dtype([(prop, byte_order + prop_type) for prop, prop_type, _ in element["properties"]])
+                values = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+                offset += dtype.itemsize * count
+            else:
+                width = len(element["properties"])
+                flat = np.array(tokens[token_pos:token_pos + width * count], dtype=np.float64).reshape(count, width)
+                token_pos += width * count
+                values = {prop: flat[:, i] for i, (prop, _, _) in enumerate(element["properties"])}
+            if element["name"] == 'vertex':
+                vertices = values
+            continue
+
+        if element["name"] != 'face' or len(element["properties"]) != 1:
+            raise ValueError(f"Unsupported PLY element layout: {element['name']}")
+        _, count_type, index_type = element["properties"][0]
+
+        if byte_order:
+            # Fast path: every face has the same corner count as the first one
+            corner_count = int(np.frombuffer(data, dtype=byte_order + count_type, count=1, offset=offset)[0]) if count else 0
+            dtype = np.dtype([('n', byte_order + count_type), ('i', byte_order + index_type, (corner_count,))])
+            faces = np.frombuffer(data, dtype=dtype, count=count, offset=offset) if count and dtype.itemsize * count <= len(data) - offset else None
+            if faces is not None and np.all(faces['n'] == corner_count):
+                loop_vertices = faces['i'].ravel()
+                loop_totals = np.full(count, corner_count, dtype=np.int32)
+                offset += dtype.itemsize * count
+            else:
+                count_dtype = np.dtype(byte_order + count_type)
+                index_dtype = np.dtype(byte_order + index_type)
+                loops = []
+                totals = []
+                for _ in range(count):
+                    n = int(np.frombuffer(data, dtype=count_dtype, count=1, offset=offset)[0])
+                    offset += count_dtype.itemsize
+                    loops.append(np.frombuffer(data, dtype=index_dtype, count=n, offset=offset))
+                    offset += index_dtype.itemsize * n
+                    totals.append(n)
+                loop_vertices = np.concatenate(loops) if loops else np.zeros(0, dtype=np.int32)
+                loop_totals = np.array(totals, dtype=np.int32)
+        else:
+            loops = []
+            totals = []
+            for _ in range(count):
+                n = int(tokens[token_pos])
+                loops.extend(tokens[token_pos + 1:token_pos + 1 + n])
+                token_pos += 1 + n
+                totals.append(n)
+            loop_vertices = np.array(loops, dtype=np.int64)
+            loop_totals = np.array(totals, dtype=np.int32)
+
+    if vertices is None or loop_vertices is None:
+        raise ValueError("PLY file has no vertex or face data")
+
+    mesh_data = {
+        "name": name,
+        "positions": np.column_stack([vertices['x'], vertices['y'], vertices['z']]),
+        "loop_vertices": loop_vertices,
+        "loop_totals": loop_totals
+    }
+    names = vertices.dtype.names if hasattr(vertices, 'dtype') else tuple(vertices)
+    if all(axis in names for axis in ('nx', 'ny', 'nz')):
+        mesh_data["vertex_normals"] = np.column_stack([vertices['nx'], vertices['ny'], vertices['nz']])
+    for u, v in (('s', 't'), ('u', 'v'), ('texture_u', 'texture_v')):
+        if u in names and v in names:
+            mesh_data["loop_uvs"] = np.column_stack([vertices[u], vertices[v]])[loop_vertices]
+            break
+    return [mesh_data]
+
+def parse_stl(data, name="Mesh"):
+    """Parse binary or ASCII STL, welding the per-triangle corners into shared vertices"""
+    if len(data) >= 84 and 84 + 50 * int.from_bytes(data[80:84], 'little') == len(data):
+        count = int.from_bytes(data[80:84], 'little')
+        dtype = np.dtype([('normal', '<f4', (3,)), ('corners', '<f4', (3, 3)), ('attribute', '<u2')])
+        corners = np.frombuffer(data, dtype=dtype, count=count, offset=84)['corners'].reshape(-1, 3)
+    else:
+        coords = re.findall(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)', data)
+        corners = np.array(coords, dtype=np.float32).reshape(-1, 3)
+
+    positions, loop_vertices = np.unique(corners, axis=0, return_inverse=True)
+    return [{
+        "name": name,
+        "positions": positions,
+        "loop_vertices": loop_vertices.ravel(),
+        "loop_totals": np.full(len(corners) // 3, 3, dtype=np.int32)
+    }]
+
+def read_gltf_accessor(gltf, buffers, index):
+    """Accessor data as a (count, width) array, viewing the buffer without copying where possible"""
+    accessor = gltf["accessors"][index]
+    width = GLTF_TYPE_SIZES[accessor["type"]]
+    dtype = np.dtype('<' + GLTF_COMPONENT_TYPES[accessor["componentType"]])
+    count = accessor["count"]
+    if "bufferView" not in accessor:
+        return np.zeros((count, width), dtype=dtype)
+
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    buffer = buffers[view["buffer"]]
+    offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    stride = view.get("byteStride", 0)
+    if stride and stride != dtype.itemsize * width:
+        values = np.ndarray((count, width), dtype=dtype, buffer=buffer, offset=offset, strides=(stride, dtype.itemsize))
+    else:
+        values = np.frombuffer(buffer, dtype=dtype, count=count * width, offset=offset).reshape(count, width)
+
+    if accessor.get("normalized") and dtype.kind in 'iu':
+        values = np.maximum(values / np.iinfo(dtype).max, -1.0)
+    return values
+
+def gltf_node_matrix(node):
+    if "matrix" in node:
+        return np.array(node["matrix"], dtype=np.float64).reshape(4, 4).T
+
+    x, y, z, w = node.get("rotation", (0.0, 0.0, 0.0, 1.0))
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)]
+    ])
+    matrix = np.identity(4)
+    matrix[:3, :3] = rotation * np.array(node.get("scale", (1.0, 1.0, 1.0)))
+    matrix[:3, 3] = node.get("translation", (0.0, 0.0, 0.0))
+    return matrix
+
+def gltf_world_matrices(gltf):
+    """World matrix of every node reachable from the scenes"""
+    matrices = {}
+    nodes = gltf.get("nodes", [])
+    stack = [(root, np.identity(4)) for scene in gltf.get("scenes", []) for root in scene.get("nodes", [])]
+    if not stack:
+        stack = [(i, np.identity(4)) for i in range(len(nodes))]
+    while stack:
+        index, parent = stack.pop()
+        if index in matrices:
+            continue
+        matrices[index] = parent @ gltf_node_matrix(nodes[index])
+        stack.extend((child, matrices[index]) for child in nodes[index].get("children", []))
+    return matrices
+
+def get_gltf_node_name(gltf, index):
+    node = gltf["nodes"][index]
+    return node.get("name") or gltf["meshes"][node["mesh"]].get("name") or f"Node_{index}"
+
+def get_gltf_node_material_count(gltf, index):
+    """Distinct materials the primitives of a mesh node use, the slots an importer creates"""
+    primitives = gltf["meshes"][gltf["nodes"][index]["mesh"]].get("primitives", [])
+    return len({primitive["material"] for primitive in primitives if "material" in primitive})
+
+def match_gltf_node_objects(inventory, object_names):
+    """Node index (source ref) per object name of a stock glTF import.
+
+    The importer names objects like get_gltf_node_name, Blender suffixes repeated
+    names with .001, .002 in creation order - repeats are matched in node order.
+    Objects without a matching node are left out.
+    """
+    refs_by_name = {}
+    for name, ref in inventory:
+        refs_by_name.setdefault(name, []).append(ref)
+
+    def suffix_order(object_name):
+        match = re.match(r'^(.*)\.(\d{3})$', object_name)
+        return (match.group(1), int(match.group(2))) if match else (object_name, 0)
+
+    matched = {}
+    # Exact names first, a node may be named 'Rock.001' itself
+    for object_name in object_names:
+        if refs_by_name.get(object_name):
+            matched[object_name] = refs_by_name[object_name].pop(0)
+    for object_name in sorted(set(object_names) - set(matched), key=suffix_order):
+        refs = refs_by_name.get(suffix_order(object_name)[0])
+        if refs:
+            matched[object_name] = refs.pop(0)
+    return matched
+
+def parse_gltf_nodes(gltf, buffers, node_filter=None):
+    """Build mesh data for mesh nodes (triangle primitives), baking the node transforms"""
+    matrices = gltf_world_matrices(gltf)
+    meshes = []
+    for index, node in enumerate(gltf.get("nodes", [])):
+        if "mesh" not in node or (node_filter is not None and index not in node_filter):
+            continue
+
+        positions, normals, uvs, loops = [], [], [], []
+        vertex_offset = 0
+        for primitive in gltf["meshes"][node["mesh"]].get("primitives", []):
+            attributes = primitive.get("attributes", {})
+            if primitive.get("mode", 4) != 4 or "POSITION" not in attributes:
+                continue
+            primitive_positions = read_gltf_accessor(gltf, buffers, attributes["POSITION"])
+            if "indices" in primitive:
+                indices = read_gltf_accessor(gltf, buffers, primitive["indices"]).ravel()
+            else:
+                indices = np.arange(len(primitive_positions))
+            positions.append(primitive_positions)
+            loops.append(indices.astype(np.int64) + vertex_offset)
+            if "NORMAL" in attributes:
+                normals.append(read_gltf_accessor(gltf, buffers, attributes["NORMAL"]))
+            if "TEXCOORD_0" in attributes:
+                uvs.append(read_gltf_accessor(gltf, buffers, attributes["TEXCOORD_0"]))
+            vertex_offset += len(primitive_positions)
+        if not positions:
+            continue
+
+        matrix = matrices.get(index, np.identity(4))
+        linear = GLTF_TO_BLENDER @ matrix[:3, :3]
+        loop_vertices = np.concatenate(loops)
+        mesh_data = {
+            "name": get_gltf_node_name(gltf, index),
+            "positions": np.concatenate(positions) @ linear.T + GLTF_TO_BLENDER @ matrix[:3, 3],
+            "loop_vertices": loop_vertices,
+            "loop_totals": np.full(len(loop_vertices) // 3, 3, dtype=np.int32)
+        }
+        if len(normals) == len(positions):
+            vertex_normals = np.concatenate(normals) @ np.linalg.inv(linear)
+            lengths = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+            mesh_data["vertex_normals"] = vertex_normals / np.where(lengths > 0, lengths, 1.0)
+        if len(uvs) == len(positions):
+            vertex_uvs = np.concatenate(uvs)
+            mesh_data["loop_uvs"] = np.column_stack([vertex_uvs[:, 0], 1.0 - vertex_uvs[:, 1]])[loop_vertices]
+        meshes.append(mesh_data)
+    return meshes
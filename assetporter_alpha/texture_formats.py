@@ -0,0 +1,114 @@
+# Texture file helpers without bpy: tile set detection and DDS/KTX2 headers
+
+import re
+import struct
+
+# UDIM tiles only with a '.' before the number, name_1024.png is a resolution suffix
+UDIM_PATTERN = re.compile(r'^(.*\.)(1\d{3})(\.[^.]+)$')
+UVTILE_PATTERN = re.compile(r'^(.*[._])u(\d+)_v(\d+)(\.[^.]+)$', re.IGNORECASE)
+
+def group_texture_tiles(files):
+    """Collapse UDIM (name.1001.png) and UVTILE (name_u1_v1.png) tiles of one folder into tile sets.
+    Returns (first file, display name, [[tile number, file]] or None) per texture, in file order."""
+    textures = {}
+    for file in files:
+        match = UDIM_PATTERN.match(file)
+        if match:
+            key, tile = (match.group(1), "<UDIM>", match.group(3)), int(match.group(2))
+        else:
+            match = UVTILE_PATTERN.match(file)
+            if not match:
+                textures[file] = [(None, file)]
+                continue
+            key = (match.group(1), "<UVTILE>", match.group(4))
+            tile = 1001 + int(match.group(2)) - 1 + (int(match.group(3)) - 1) * 10
+        textures.setdefault(key, []).append((tile, file))
+
+    grouped = []
+    for key, tiles in textures.items():
+        tiles.sort()
+        # Tile sets start in the first UV row, numbers without a tile in 1001-1010
+        # are more likely versions or frame numbers
+        if isinstance(key, str) or not any(1001 <= tile <= 1010 for tile, _ in tiles):
+            grouped.extend((file, file, None) for _, file in tiles)
+        else:
+            grouped.append((tiles[0][1], "".join(key), [list(tile) for tile in tiles]))
+    return grouped
+
+# DXGI format -> (name, block size in pixels, bytes per block)
+GPU_TEXTURE_FORMATS = {
+    71: ('BC1', 4, 8), 72: ('BC1', 4, 8), 74: ('BC2', 4, 16), 75: ('BC2', 4, 16),
+    77: ('BC3', 4, 16), 78: ('BC3', 4, 16), 80: ('BC4', 4, 8), 81: ('BC4', 4, 8),
+    83: ('BC5', 4, 16), 84: ('BC5', 4, 16), 95: ('BC6H', 4, 16), 96: ('BC6H', 4, 16),
+    98: ('BC7', 4, 16), 99: ('BC7', 4, 16),
+    28: ('RGBA8', 1, 4), 29: ('RGBA8', 1, 4), 87: ('BGRA8', 1, 4), 91: ('BGRA8', 1, 4),
+}
+DDS_FOURCC_FORMATS = {b'DXT1': 71, b'DXT3': 74, b'DXT5': 77, b'ATI1': 80, b'BC4U': 80, b'BC4S': 81,
+                      b'ATI2': 83, b'BC5U': 83, b'BC5S': 84}
+KTX2_IDENTIFIER = b'\xabKTX 20\xbb\r\n\x1a\n'
+KTX2_VK_FORMATS = {131: 71, 132: 72, 133: 71, 134: 72, 135: 74, 136: 75, 137: 77, 138: 78, 139: 80, 140: 81,
+                   141: 83, 142: 84, 143: 95, 144: 96, 145: 98, 146: 99, 37: 28, 43: 29, 44: 87, 50: 91}
+
+def get_mip_size(layout, level):
+    return max(layout["width"] >> level, 1), max(layout["height"] >> level, 1)
+
+def read_gpu_texture_header(f):
+    """Header bytes of a DDS or KTX2 file, up to the end of the KTX2 level index"""
+    header = f.read(148)
+    if header[:12] == KTX2_IDENTIFIER and len(header) >= 44:
+        end = 80 + 24 * max(int.from_bytes(header[40:44], 'little'), 1)
+        header += f.read(max(end - len(header), 0))
+    return header
+
+def parse_gpu_texture_header(header):
+    """Size, DXGI format and (offset, length) per mip level of a DDS or KTX2 file.
+    None for cube maps, arrays, volumes, supercompressed KTX2 and unknown formats."""
+    if header[:4] == b'DDS ':
+        height, width, _, _, mips = struct.unpack_from('<5I', header, 12)
+        pf_flags, fourcc = struct.unpack_from('<I4s', header, 80)
+        if struct.unpack_from('<I', header, 112)[0] & 0x200200:  # Cube map or volume
+            return None
+        offset = 128
+        if pf_flags & 0x4 and fourcc == b'DX10':
+            dxgi, dimension, misc, array_size = struct.unpack_from('<4I', header, 128)
+            if dimension != 3 or misc & 0x4 or array_size > 1:
+                return None
+            offset = 148
+        elif pf_flags & 0x4:
+            dxgi = DDS_FOURCC_FORMATS.get(fourcc)
+        else:
+            return None  # Uncompressed legacy layouts load through Blender
+        if dxgi not in GPU_TEXTURE_FORMATS:
+            return None
+        layout = {"width": width, "height": height, "dxgi": dxgi, "levels": []}
+        _, block, block_bytes = GPU_TEXTURE_FORMATS[dxgi]
+        for level in range(max(mips, 1)):
+            level_width, level_height = get_mip_size(layout, level)
+            length = -(-level_width // block) * -(-level_height // block) * block_bytes
+            layout["levels"].append((offset, length))
+            offset += length
+        return layout
+
+    if header[:12] == KTX2_IDENTIFIER:
+        vk_format, _, width, height, depth, layers, faces, levels, supercompression = struct.unpack_from('<9I', header, 12)
+        if supercompression or depth or layers > 1 or faces > 1 or KTX2_VK_FORMATS.get(vk_format) is None:
+            return None
+        layout = {"width": width, "height": height, "dxgi": KTX2_VK_FORMATS[vk_format], "levels": []}
+        for level in range(max(levels, 1)):
+            offset, length, _ = struct.unpack_from('<3Q', header, 80 + 24 * level)
+            layout["levels"].append((offset, length))
+        return layout
+    return None
+
+def build_dds_header(layout, level=0):
+    """DX10 DDS header for the mip chain of layout from level on"""
+    levels = layout["levels"][level:]
+    width, height = get_mip_size(layout, level)
+    header = bytearray(148)
+    header[0:4] = b'DDS '
+    # caps, height, width, pixel format, mip count and linear size are set
+    struct.pack_into('<7I', header, 4, 124, 0xA1007, height, width, levels[0][1], 0, len(levels))
+    struct.pack_into('<II4s', header, 76, 32, 0x4, b'DX10')
+    struct.pack_into('<I', header, 108, 0x401008)  # Texture, mipmaps, complex
+    struct.pack_into('<5I', header, 128, layout["dxgi"], 3, 0, 1, 0)  # 2D texture, one array element
+    return bytes(header)
@@ -0,0 +1,216 @@
+# Background job runner for Assetporter Alpha
+#
+# Started by the add-on as a headless Blender process:
+#   blender --background --factory-startup --python worker.py -- <job.json>
+# The job file describes one unit of work, the result is written next to it.
+
+import bpy
+import os
+import sys
+import json
+import math
+import traceback
+from types import SimpleNamespace
+from mathutils import Vector
+
+# Reuse the importers of the add-on itself
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import assetporter_alpha as addon
+from assetporter_alpha.mesh_formats import match_gltf_node_objects, get_gltf_node_material_count
+
+def reset_scene():
+    """Remove everything from the factory startup scene"""
+    bpy.data.batch_remove(list(bpy.data.objects))
+
+def import_source(file_path):
+    """Import a file with the add-on importers and keep only its mesh objects"""
+    ext = os.path.splitext(file_path)[1].lower()
+    extensions = addon.get_import_extensions()
+    if ext not in extensions:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    pre_import_objects = set(bpy.data.objects)
+    extensions[ext](file_path)
+    new_objects = set(bpy.data.objects) - pre_import_objects
+
+    meshes = [obj for obj in new_objects if obj.type == 'MESH']
+    bpy.data.batch_remove([obj for obj in new_objects if obj.type != 'MESH'])
+    return meshes
+
+def import_source_objects(file_path):
+    """Import the meshes of a file paired with the key the scan stored for them.
+    glTF goes through the stock importer for its materials, objects are matched to node
+    indices by name. Other formats with source refs are read one object at a time."""
+    extensions = addon.get_import_extensions()
+    inventory = addon.list_source_meshes(file_path)
+    if inventory and os.path.splitext(file_path)[1].lower() in ('.glb', '.gltf'):
+        meshes = import_source(file_path)
+        node_refs = match_gltf_node_objects(inventory, [obj.name for obj in meshes])
+        return [(obj, node_refs.get(obj.name) or addon.get_source_key(obj.name, "")) for obj in meshes]
+    if not inventory or not all(ref for _, ref in inventory) or not addon.can_import_selectively(file_path, extensions):
+        return [(obj, addon.get_source_key(obj.name, "")) for obj in import_source(file_path)]
+
+    pairs = []
+    for _, ref in inventory:
+        pre_import_objects = set(bpy.data.objects)
+        addon.import_selected_objects(file_path, [SimpleNamespace(source_ref=ref)], extensions)
+        new_objects = set(bpy.data.objects) - pre_import_objects
+        bpy.data.batch_remove([obj for obj in new_objects if obj.type != 'MESH'])
+        pairs.extend((obj, ref) for obj in new_objects if obj.type == 'MESH')
+    return pairs
+
+def find_missing_materials(file_path, pairs):
+    """Names of converted glTF objects whose node uses materials but that have none"""
+    if os.path.splitext(file_path)[1].lower() not in ('.glb', '.gltf'):
+        return []
+    gltf = addon.read_gltf_json(file_path)
+    node_refs = {str(i) for i, node in enumerate(gltf.get("nodes", [])) if "mesh" in node}
+    return [obj.name for obj, ref in pairs
+            if ref in node_refs and get_gltf_node_material_count(gltf, int(ref))
+            and not any(slot.material for slot in obj.material_slots)]
+
+def get_bounds(objects):
+    """World space bounding box center and radius of the objects"""
+    corners = [obj.matrix_world @ Vector(corner) for obj in objects for corner in obj.bound_box]
+    if not corners:
+        return Vector((0.0, 0.0, 0.0)), 1.0
+    low = Vector((min(c.x for c in corners), min(c.y for c in corners), min(c.z for c in corners)))
+    high = Vector((max(c.x for c in corners), max(c.y for c in corners), max(c.z for c in corners)))
+    return (low + high) / 2, max((high - low).length / 2, 0.001)
+
+def render_thumbnail(job):
+    reset_scene()
+    meshes = import_source(job["source"])
+    if not meshes:
+        raise ValueError("No mesh objects to render")
+
+    scene = bpy.context.scene
+    center, radius = get_bounds(meshes)
+
+    # Frame the asset from a three-quarter view
+    camera_data = bpy.data.cameras.new("Thumbnail")
+    camera = bpy.data.objects.new("Thumbnail", camera_data)
+    scene.collection.objects.link(camera)
+    scene.camera = camera
+    direction = Vector((1.0, -1.0, 0.7)).normalized()
+    distance = radius / math.sin(camera_data.angle / 2) * 1.05
+    camera.location = center + direction * distance
+    camera.rotation_euler = (-direction).to_track_quat('-Z', 'Y').to_euler()
+    camera_data.clip_start = distance / 1000
+    camera_data.clip_end = distance * 4
+
+    # Workbench needs no GPU features or lights, EEVEE is optional
+    try:
+        scene.render.engine = job.get("engine", 'BLENDER_WORKBENCH')
+    except TypeError:
+        scene.render.engine = 'BLENDER_WORKBENCH'
+    if scene.render.engine == 'BLENDER_WORKBENCH':
+        scene.display.shading.light = 'STUDIO'
+        scene.display.shading.color_type = 'OBJECT'
+
+    size = job.get("size", 128)
+    scene.render.resolution_x = size
+    scene.render.resolution_y = size
+    scene.render.resolution_percentage = 100
+    scene.render.film_transparent = True
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.filepath = job["output"]
+    bpy.ops.render.render(write_still=True)
+    return {"output": job["output"]}
+
+def convert_to_blend(job):
+    """Save the meshes of a source file as a library .blend for linking.
+
+    The root collection holds one child collection per object, so single
+    objects of a multi-object file can be instanced on their own. The source
+    key of every child collection goes to keys_output for partial linking.
+    """
+    reset_scene()
+    pairs = import_source_objects(job["source"])
+
+    root = bpy.data.collections.new(job["collection"])
+    bpy.context.scene.collection.children.link(root)
+    collection_keys = {}
+    for obj, source_key in sorted(pairs, key=lambda x: x[0].name):
+        for coll in obj.users_collection:
+            coll.objects.unlink(obj)
+        child = bpy.data.collections.new(obj.name)
+        root.children.link(child)
+        child.objects.link(obj)
+        collection_keys[child.name] = source_key
+
+    bpy.ops.wm.save_as_mainfile(filepath=job["output"], check_existing=False)
+    with open(job["keys_output"], 'w', encoding='utf-8') as f:
+        json.dump(collection_keys, f)
+    return {"output": job["output"], "objects": [obj.name for obj, _ in pairs],
+            "missing_materials": find_missing_materials(job["source"], pairs)}
+
+def decimate_levels(job):
+    """Export one decimated copy of the source per requested LOD level"""
+    reset_scene()
+    meshes = import_source(job["source"])
+
+    modifiers = []
+    for obj in meshes:
+        modifier = obj.modifiers.new("Decimate", 'DECIMATE')
+        modifier.decimate_type = 'COLLAPSE'
+        modifiers.append(modifier)
+
+    outputs = []
+    for level, ratio, output in job["levels"]:
+        for modifier in modifiers:
+            modifier.ratio = ratio
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        bpy.ops.wm.obj_export(
+            filepath=output,
+            apply_modifiers=True,
+            export_selected_objects=False,
+            export_materials=False
+        )
+        outputs.append(output)
+    return {"outputs": outputs}
+
+def downscale_texture(job):
+    """Write a lower resolution copy of a texture, as EXR if the output keeps float precision"""
+    img = bpy.data.images.load(job["source"])
+    # Data maps keep their raw values, alpha is never premultiplied into the color
+    if job.get("non_color"):
+        img.colorspace_settings.name = 'Non-Color'
+    img.alpha_mode = 'CHANNEL_PACKED'
+    img.scale(job["width"], job["height"])
+
+    # Write next to the target first so readers never see a half written file
+    base, ext = os.path.splitext(job["output"])
+    temp_path = base + ".tmp" + ext
+    img.filepath_raw = temp_path
+    img.file_format = 'OPEN_EXR' if ext == '.exr' else 'PNG'
+    img.save()
+    os.replace(temp_path, job["output"])
+    return {"output": job["output"]}
+
+JOB_TYPES = {
+    'THUMBNAIL': render_thumbnail,
+    'CONVERT': convert_to_blend,
+    'DECIMATE': decimate_levels,
+    'DOWNSCALE': downscale_texture,
+}
+
+def main():
+    job_path = sys.argv[sys.argv.index("--") + 1]
+    with open(job_path, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+
+    try:
+        result = JOB_TYPES[job["type"]](job)
+        result["ok"] = True
+    except Exception as e:
+        traceback.print_exc()
+        result = {"ok": False, "error": str(e)}
+
+    with open(os.path.splitext(job_path)[0] + ".result.json", 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    sys.exit(0 if result["ok"] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+# The add-on package imports bpy, the format modules don't - import them on their own
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assetporter_alpha"))
@@ -0,0 +1,164 @@
+import struct
+
+import numpy as np
+import pytest
+
+from mesh_formats import (
+    GLTF_TO_BLENDER, get_gltf_node_material_count, match_gltf_node_objects, parse_obj, parse_ply, parse_stl,
+    read_gltf_accessor
+)
+
+TWO_OBJECTS_OBJ = b"""o A
+v 0 0 0
+v 1 0 0
+v 0 1 0
+f -3 -2 -1
+o B
+v 5 0 0
+v 6 0 0
+v 5 1 0
+v 5 0 1
+f -4 -3 -2 -1
+"""
+
+NORMALS_OBJ = b"""o Quad
+v 0 0 0
+v 1 0 0
+v 1 0 1
+v 0 0 1
+vn 0 1 0
+f 1//1 2//1 3//1 4//1
+"""
+
+
+def to_blender(points):
+    return np.asarray(points, dtype=np.float64) @ GLTF_TO_BLENDER.T
+
+
+def test_obj_negative_indices_are_relative_to_the_face_line():
+    a, b = parse_obj(TWO_OBJECTS_OBJ)
+    assert a["name"] == "A" and b["name"] == "B"
+    np.testing.assert_allclose(a["positions"][a["loop_vertices"]], to_blender([[0, 0, 0], [1, 0, 0], [0, 1, 0]]))
+    np.testing.assert_allclose(b["positions"][b["loop_vertices"]],
+                               to_blender([[5, 0, 0], [6, 0, 0], [5, 1, 0], [5, 0, 1]]))
+    assert list(b["loop_totals"]) == [4]
+
+
+def test_obj_object_filter():
+    meshes = parse_obj(TWO_OBJECTS_OBJ, object_filter={"B"})
+    assert [mesh["name"] for mesh in meshes] == ["B"]
+
+
+def test_obj_is_converted_to_z_up():
+    mesh, = parse_obj(b"v 0 1 0\nv 0 0 1\nv 1 0 0\nf 1 2 3\n")
+    # Y-up (0, 1, 0) is Blender's Z, OBJ forward -Z is Blender's Y
+    np.testing.assert_allclose(mesh["positions"][mesh["loop_vertices"]], [[0, 0, 1], [0, -1, 0], [1, 0, 0]])
+
+
+def test_obj_vertex_normal_corners():
+    mesh, = parse_obj(NORMALS_OBJ)
+    assert "loop_uvs" not in mesh
+    np.testing.assert_allclose(mesh["loop_normals"], np.tile([0, 0, 1], (4, 1)))
+
+
+def test_obj_without_normals_has_no_loop_normals():
+    mesh, = parse_obj(b"v 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nvt 1 0\nvt 0 1\nf 1/1 2/2 3/3\n")
+    assert "loop_normals" not in mesh
+    np.testing.assert_allclose(mesh["loop_uvs"], [[0, 0], [1, 0], [0, 1]])
+
+
+TRIANGLES = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                      [[1, 0, 0], [1, 1, 0], [0, 1, 0]]], dtype=np.float32)
+
+
+def binary_stl(triangles):
+    data = bytearray(80) + struct.pack('<I', len(triangles))
+    for corners in triangles:
+        data += struct.pack('<3f', 0, 0, 1) + corners.astype('<f4').tobytes() + b'\0\0'
+    return bytes(data)
+
+
+def ascii_stl(triangles):
+    lines = ["solid test"]
+    for corners in triangles:
+        lines += ["facet normal 0 0 1", "outer loop"]
+        lines += ["vertex %g %g %g" % tuple(corner) for corner in corners]
+        lines += ["endloop", "endfacet"]
+    return ("\n".join(lines + ["endsolid test"]) + "\n").encode()
+
+
+@pytest.mark.parametrize("encode", [binary_stl, ascii_stl])
+def test_stl_welds_shared_corners(encode):
+    mesh, = parse_stl(encode(TRIANGLES), "Quad")
+    assert len(mesh["positions"]) == 4
+    assert list(mesh["loop_totals"]) == [3, 3]
+    np.testing.assert_allclose(mesh["positions"][mesh["loop_vertices"]], TRIANGLES.reshape(-1, 3))
+
+
+def ply_header(ply_format, vertex_count, face_count):
+    return (f"ply\nformat {ply_format} 1.0\nelement vertex {vertex_count}\n"
+            "property float x\nproperty float y\nproperty float z\n"
+            f"element face {face_count}\nproperty list uchar int vertex_indices\nend_header\n").encode()
+
+
+PLY_POSITIONS = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+PLY_FACES = [[0, 1, 2, 3], [1, 4, 2]]
+
+
+def test_ply_ascii_mixed_polygon_sizes():
+    body = "".join("%g %g %g\n" % tuple(p) for p in PLY_POSITIONS)
+    body += "".join(f"{len(face)} {' '.join(map(str, face))}\n" for face in PLY_FACES)
+    mesh, = parse_ply(ply_header("ascii", 5, 2) + body.encode())
+    assert list(mesh["loop_totals"]) == [4, 3]
+    assert list(mesh["loop_vertices"]) == [0, 1, 2, 3, 1, 4, 2]
+
+
+def test_ply_binary_mixed_polygon_sizes():
+    body = np.array(PLY_POSITIONS, dtype='<f4').tobytes()
+    for face in PLY_FACES:
+        body += struct.pack('<B', len(face)) + np.array(face, dtype='<i4').tobytes()
+    mesh, = parse_ply(ply_header("binary_little_endian", 5, 2) + body)
+    assert list(mesh["loop_totals"]) == [4, 3]
+    assert list(mesh["loop_vertices"]) == [0, 1, 2, 3, 1, 4, 2]
+    np.testing.assert_allclose(mesh["positions"], PLY_POSITIONS)
+
+
+def test_gltf_accessor_with_byte_stride():
+    # Interleaved VEC3 positions and VEC2 uvs, 20 bytes per vertex
+    vertices = np.array([[0, 1, 2, 10, 11], [3, 4, 5, 12, 13]], dtype='<f4')
+    gltf = {
+        "bufferViews": [{"buffer": 0, "byteOffset": 4, "byteStride": 20}],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "type": "VEC3", "count": 2},
+            {"bufferView": 0, "byteOffset": 12, "componentType": 5126, "type": "VEC2", "count": 2},
+            {"componentType": 5126, "type": "SCALAR", "count": 3}
+        ]
+    }
+    buffers = [b"\0" * 4 + vertices.tobytes()]
+    np.testing.assert_allclose(read_gltf_accessor(gltf, buffers, 0), vertices[:, :3])
+    np.testing.assert_allclose(read_gltf_accessor(gltf, buffers, 1), vertices[:, 3:])
+    assert read_gltf_accessor(gltf, buffers, 2).shape == (3, 1)
+
+
+def test_gltf_accessor_normalized_integers():
+    gltf = {
+        "bufferViews": [{"buffer": 0}],
+        "accessors": [{"bufferView": 0, "componentType": 5121, "type": "VEC2", "count": 1, "normalized": True}]
+    }
+    np.testing.assert_allclose(read_gltf_accessor(gltf, [bytes([0, 255])], 0), [[0.0, 1.0]])
+
+
+def test_gltf_objects_match_node_indices_with_blender_suffixes():
+    inventory = [("Rock", "0"), ("Tree", "2"), ("Rock", "3"), ("Stone.001", "5")]
+    matched = match_gltf_node_objects(inventory, ["Rock.001", "Tree", "Rock", "Stone.001", "Camera"])
+    assert matched == {"Rock": "0", "Rock.001": "3", "Stone.001": "5", "Tree": "2"}
+
+
+def test_gltf_node_material_count():
+    gltf = {
+        "nodes": [{"mesh": 0}, {"mesh": 1}],
+        "meshes": [{"primitives": [{"material": 0}, {"material": 1}, {"material": 0}]},
+                   {"primitives": [{}]}]
+    }
+    assert get_gltf_node_material_count(gltf, 0) == 2
+    assert get_gltf_node_material_count(gltf, 1) == 0
@@ -0,0 +1,95 @@
+import io
+import struct
+
+import pytest
+
+from texture_formats import (
+    KTX2_IDENTIFIER, build_dds_header, group_texture_tiles, parse_gpu_texture_header, read_gpu_texture_header
+)
+
+
+def test_udim_tiles_form_one_set():
+    grouped = group_texture_tiles(["rock.1002.png", "rock.1001.png", "rock.1011.png", "moss.png"])
+    assert grouped == [
+        ("rock.1001.png", "rock.<UDIM>.png", [[1001, "rock.1001.png"], [1002, "rock.1002.png"], [1011, "rock.1011.png"]]),
+        ("moss.png", "moss.png", None),
+    ]
+
+
+def test_uvtile_tiles_form_one_set():
+    (first, name, tiles), = group_texture_tiles(["rock_u2_v1.png", "rock_u1_v1.png", "rock_u1_v2.png"])
+    assert first == "rock_u1_v1.png" and name == "rock_<UVTILE>.png"
+    assert [number for number, _ in tiles] == [1001, 1002, 1011]
+
+
+@pytest.mark.parametrize("files", [
+    ["rock_1024.png", "rock_1080.png"],   # resolution suffixes
+    ["rock.1024.png", "rock.1080.png"],   # no tile in the first UV row
+    ["rock.1012.png"],
+])
+def test_numbered_files_that_are_no_tile_sets(files):
+    assert group_texture_tiles(files) == [(file, file, None) for file in files]
+
+
+def dds_header(width, height, mips, fourcc, caps2=0, dx10=None):
+    header = bytearray(128)
+    header[0:4] = b'DDS '
+    struct.pack_into('<5I', header, 12, height, width, 0, 0, mips)
+    struct.pack_into('<I4s', header, 80, 0x4, fourcc)
+    struct.pack_into('<I', header, 112, caps2)
+    if dx10 is not None:
+        header += struct.pack('<5I', *dx10)
+    return bytes(header)
+
+
+def ktx2_header(vk_format, width, height, levels, faces=1, supercompression=0):
+    header = KTX2_IDENTIFIER + struct.pack('<9I', vk_format, 1, width, height, 0, 0, faces, len(levels), supercompression)
+    header += bytes(32)  # dfd/kvd/sgd index
+    for offset, length in levels:
+        header += struct.pack('<3Q', offset, length, length)
+    return header
+
+
+def test_dds_fourcc_mip_chain():
+    layout = parse_gpu_texture_header(dds_header(256, 128, 3, b'DXT1'))
+    assert (layout["width"], layout["height"], layout["dxgi"]) == (256, 128, 71)
+    assert layout["levels"] == [(128, 16384), (16512, 4096), (20608, 1024)]
+
+
+def test_dds_small_levels_round_up_to_whole_blocks():
+    layout = parse_gpu_texture_header(dds_header(6, 6, 3, b'DXT5'))
+    assert [length for _, length in layout["levels"]] == [64, 16, 16]
+
+
+def test_dds_dx10_header():
+    layout = parse_gpu_texture_header(dds_header(64, 64, 2, b'DX10', dx10=(98, 3, 0, 1, 0)))
+    assert layout["dxgi"] == 98
+    assert layout["levels"] == [(148, 4096), (4244, 1024)]
+
+
+@pytest.mark.parametrize("header", [
+    dds_header(64, 64, 1, b'DXT1', caps2=0x200),                # cube map
+    dds_header(64, 64, 1, b'DX10', dx10=(98, 3, 0x4, 1, 0)),    # DX10 cube map
+    dds_header(64, 64, 1, b'DX10', dx10=(98, 3, 0, 2, 0)),      # texture array
+    dds_header(64, 64, 1, b'DX10', dx10=(2, 3, 0, 1, 0)),       # float RGBA, not handled
+    ktx2_header(145, 16, 16, [(200, 256)], faces=6),
+    ktx2_header(145, 16, 16, [(200, 256)], supercompression=1),
+])
+def test_unsupported_layouts(header):
+    assert parse_gpu_texture_header(header) is None
+
+
+def test_ktx2_level_index_is_read_past_the_dds_header_size():
+    header = ktx2_header(145, 16, 16, [(300, 256), (240, 64), (224, 16)])
+    assert len(header) > 148
+    f = io.BytesIO(header + bytes(600))
+    layout = parse_gpu_texture_header(read_gpu_texture_header(f))
+    assert (layout["width"], layout["height"], layout["dxgi"]) == (16, 16, 98)
+    assert layout["levels"] == [(300, 256), (240, 64), (224, 16)]
+
+
+def test_dds_header_for_a_mip_tail_parses_back():
+    layout = parse_gpu_texture_header(ktx2_header(145, 16, 16, [(300, 256), (240, 64), (224, 16)]))
+    tail = parse_gpu_texture_header(build_dds_header(layout, 1))
+    assert (tail["width"], tail["height"], tail["dxgi"]) == (8, 8, 98)
+    assert tail["levels"] == [(148, 64), (212, 16)]